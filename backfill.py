@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+"""
+Backfill: arquiva o catálogo completo de editais da UEPA na tabela all_editais.
+
+Percorre todas as páginas da listagem com concorrência limitada, grava os
+editais em lotes (uma transação por lote) e salva um checkpoint a cada janela
+de páginas concluída, de modo que uma execução interrompida pode ser retomada.
+Nenhuma notificação é enviada: o bot passa a tratar esses editais como vistos.
+Editais registrados antes da coluna `published_at` recebem a data de publicação.
+
+Uso:
+    python backfill.py [--url URL] [--concurrency N] [--chunk-size N] [--reset]
+
+Para testar contra uma cópia local do site, sirva os arquivos com
+`python -m http.server` e use `--url "http://localhost:8000/editais-{page}.html"`.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+from typing import List
+
+import aiohttp
+
+from src.config import settings
+from src.containers import Container
+from src.core.entities.edital import Edital
+from src.infra.web_scraper.accordion_parser import find_last_page
+from src.infra.web_scraper.parser_pool import ParserPool, ParserPoolError
+from src.infra.web_scraper.uepa_scraper import UepaScraper
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger("Backfill")
+
+DEFAULT_CHECKPOINT = os.path.join("data", "backfill_checkpoint.json")
+
+
+def initial_state(url: str) -> dict:
+    """Estado de uma execução que começa da primeira página."""
+    return {"url": url, "next_page": 0, "pages": 0, "seen": 0, "inserted": 0, "dated": 0}
+
+
+def load_checkpoint(path: str, url: str) -> dict:
+    """Carrega o checkpoint, ignorando-o se pertencer a outra URL."""
+    state = initial_state(url)
+    if not os.path.exists(path):
+        return state
+    with open(path, "r", encoding="utf-8") as f:
+        saved = json.load(f)
+    if saved.get("url") != url:
+        logger.warning("Checkpoint pertence a outra URL (%s); ignorando.", saved.get("url"))
+        return state
+    state.update(saved)
+    return state
+
+
+def save_checkpoint(path: str, state: dict):
+    """Grava o checkpoint de forma atômica."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+
+async def fetch_page(scraper: UepaScraper, pool: ParserPool, page: int) -> tuple[int, List[Edital]]:
+    """Baixa e processa uma página, retornando também o último índice de página visto."""
+    html = await scraper.fetch_page(page)
+    editais = await pool.parse(html, scraper.parser_engine)
+    return find_last_page(html), editais
+
+
+async def run(args) -> bool:
+    """Executa o backfill e retorna se o catálogo foi percorrido por completo."""
+    container = Container()
+    await container.db_connection().setup()
+    repo = container.all_editais_repo(chunk_size=args.chunk_size)
+    pool = ParserPool(
+        kind=settings.PARSER_POOL_KIND,
+        max_workers=settings.PARSER_POOL_WORKERS,
+        max_pending=args.concurrency,
+        timeout=settings.PARSER_TIMEOUT_SECONDS,
+    )
+
+    if args.reset:
+        state = initial_state(args.url)
+    else:
+        state = load_checkpoint(args.checkpoint, args.url)
+    if state["next_page"]:
+        logger.info("Retomando a partir da página %d.", state["next_page"])
+
+    http_client = container.http_client()
+    try:
+        scraper = UepaScraper(http_client.session, pool, url=args.url)
+
+        last_page, _ = await fetch_page(scraper, pool, 0)
+        page = state["next_page"]
+        finished = False
+        while not finished and page <= last_page:
+            window = range(page, min(page + args.concurrency, last_page + 1))
+            results = await asyncio.gather(
+                *(fetch_page(scraper, pool, p) for p in window), return_exceptions=True
+            )
+
+            for current, result in zip(window, results):
+                if isinstance(result, (aiohttp.ClientError, asyncio.TimeoutError, ParserPoolError)):
+                    # as páginas anteriores da janela já foram gravadas; a retomada
+                    # começa exatamente na que falhou
+                    save_checkpoint(args.checkpoint, state)
+                    logger.error("Falha na página %d: %s. Execute novamente para retomar.", current, result)
+                    return False
+                if isinstance(result, BaseException):
+                    raise result
+
+                page_last, editais = result
+                if not editais:
+                    logger.info("Página %d vazia; fim do catálogo.", current)
+                    finished = True
+                    break
+
+                last_page = max(last_page, page_last)
+                # duplicados são descartados pelo banco; conta só os novos
+                state["inserted"] += await repo.add_many(editais)
+                # registros anteriores à coluna published_at recebem a data agora
+                state["dated"] += await repo.fill_missing_dates(editais)
+                state["seen"] += len(editais)
+                state["pages"] += 1
+                state["next_page"] = current + 1
+
+            save_checkpoint(args.checkpoint, state)
+            logger.info(
+                "Páginas concluídas: %d/%d | editais vistos: %d | inseridos: %d",
+                state["next_page"],
+                last_page + 1,
+                state["seen"],
+                state["inserted"],
+            )
+            page = state["next_page"]
+    finally:
+        await http_client.close()
+        pool.shutdown()
+        await container.db_connection().close()
+
+    logger.info(
+        "Backfill concluído: %d páginas, %d editais vistos, %d novos registros, "
+        "%d datas de publicação preenchidas.",
+        state["pages"],
+        state["seen"],
+        state["inserted"],
+        state["dated"],
+    )
+    return True
+
+
+def main():
+    """Ponto de entrada do backfill."""
+    parser = argparse.ArgumentParser(description="Arquiva o catálogo completo de editais da UEPA.")
+    parser.add_argument("--url", default=settings.UEPA_EDITAIS_URL, help="URL da listagem (aceita {page}).")
+    parser.add_argument("--concurrency", type=int, default=4, help="Páginas baixadas em paralelo.")
+    parser.add_argument("--chunk-size", type=int, default=200, help="Editais por transação.")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT, help="Arquivo de checkpoint.")
+    parser.add_argument("--reset", action="store_true", help="Ignora o checkpoint existente.")
+    args = parser.parse_args()
+    args.concurrency = max(1, args.concurrency)
+    args.chunk_size = max(1, args.chunk_size)
+
+    try:
+        sys.exit(0 if asyncio.run(run(args)) else 1)
+    except KeyboardInterrupt:
+        logger.info("Backfill interrompido; execute novamente para retomar.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""
+Benchmark: custo de construção e memória por edital nos caminhos validado e confiável.
+
+Compara o modelo anterior (link como `HttpUrl`), a construção validada do
+`Edital` e o caminho usado pelo parser (link validado por `HttpUrl` e
+`Edital.trusted` para os demais campos), sobre os itens de páginas com
+milhares de editais.
+
+Uso: python -m benchmarks.bench_edital_construction --sizes 1000 5000
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Optional
+
+from pydantic import BaseModel, HttpUrl
+
+from benchmarks.sample_site import MONTHS
+from src.core.entities.edital import Edital
+from src.infra.web_scraper.accordion_parser import (
+    BASE_URL,
+    EDITAL_FILES_PATH,
+    _build_edital,
+    generate_edital_hash,
+)
+
+
+class _LegacyEdital(BaseModel, frozen=True):
+    """Modelo anterior, com o link validado e guardado como `HttpUrl`."""
+
+    title: str
+    link: HttpUrl
+    date: Optional[str] = "Data não disponível"
+    hash: str
+
+
+def _items(count: int):
+    """Título, link e data dos itens de uma página sintética."""
+    return [
+        (
+            f"Edital {i % 300 + 1}-{2000 + i % 26} - Processo Seletivo nº {i}",
+            f"{BASE_URL}{EDITAL_FILES_PATH}edital{i}.pdf",
+            f"Belém, {i % 28 + 1} de {MONTHS[i % 12]} de {2000 + i % 26}",
+        )
+        for i in range(count)
+    ]
+
+
+def _legacy(title, link, date):
+    return _LegacyEdital(
+        title=title, link=HttpUrl(link), date=date, hash=generate_edital_hash(title, link)
+    )
+
+
+def _validated(title, link, date):
+    return Edital(title=title, link=link, date=date, hash=generate_edital_hash(title, link))
+
+
+STRATEGIES = {
+    "anterior": _legacy,
+    "validado": _validated,
+    "confiável": _build_edital,
+}
+
+
+def _measure(build, items, repeat: int):
+    """Retorna (µs por edital no melhor caso, bytes retidos por edital)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        [build(*item) for item in items]
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    editais = [build(*item) for item in items]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(editais) == len(items)
+    return best / len(items) * 1e6, retained / len(items)
+
+
+def main():
+    """Executa o benchmark e confere que os caminhos produzem os mesmos editais."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'editais':>8} {'caminho':>10} {'µs/edital':>10} {'bytes/edital':>13}")
+    for size in args.sizes:
+        items = _items(size)
+        for item in items[:50]:
+            validated, trusted = _validated(*item), _build_edital(*item)
+            assert validated == trusted and trusted.published_at is not None
+            assert trusted.link == str(_legacy(*item).link)
+        for name, build in STRATEGIES.items():
+            per_item, per_item_bytes = _measure(build, items, args.repeat)
+            print(f"{size:>8} {name:>10} {per_item:>10.2f} {per_item_bytes:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
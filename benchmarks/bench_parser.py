@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+"""
+Benchmark: compara o parser de referência (BeautifulSoup) com o parser indexado (lxml).
+
+Uso: python -m benchmarks.bench_parser --sizes 100 500 1000
+"""
+
+import argparse
+import time
+
+from benchmarks.sample_site import make_editais_page
+from src.infra.web_scraper.accordion_parser import parse_indexed, parse_reference
+
+
+def _best_of(func, html: str, repeat: int) -> float:
+    """Retorna o menor tempo, em segundos, de `repeat` execuções."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(html)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Executa o benchmark e verifica que os dois parsers produzem o mesmo resultado."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 1000])
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'editais':>8} {'referência (s)':>15} {'indexado (s)':>13} {'ganho':>7}")
+    for size in args.sizes:
+        html = make_editais_page(size)
+        reference = parse_reference(html)
+        indexed = parse_indexed(html)
+        assert reference == indexed, f"Resultados divergentes para {size} editais"
+        assert len(indexed) == size
+
+        reference_time = _best_of(parse_reference, html, args.repeat)
+        indexed_time = _best_of(parse_indexed, html, args.repeat)
+        print(
+            f"{size:>8} {reference_time:>15.4f} {indexed_time:>13.4f} "
+            f"{reference_time / indexed_time:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+"""
+Benchmark: compara a leitura de servidores e cargos como objetos do ORM e como entidades leves.
+
+Simula o fan-out de uma notificação: carrega as configurações e os cargos de
+todos os servidores e monta, para cada um, o canal e a string de menções.
+
+Uso: python -m benchmarks.bench_repository_dtos --guilds 10000
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+
+from sqlalchemy import insert, select
+
+from src.infra.database.connection import DatabaseConnection
+from src.infra.database.repositories.guild_settings_repository import GuildSettingsRepository
+from src.infra.database.repositories.role_repository import RoleRepository
+from src.infra.database.tables import GuildRoleDB, GuildSettingsDB
+
+
+async def _populate(db: DatabaseConnection, guilds: int, roles_per_guild: int):
+    """Cria os servidores e cargos de teste."""
+    async with db.get_session() as session:
+        await session.execute(
+            insert(GuildSettingsDB),
+            [
+                {"guild_id": str(i), "channel_id": str(10**6 + i), "enabled": True}
+                for i in range(guilds)
+            ],
+        )
+        await session.execute(
+            insert(GuildRoleDB),
+            [
+                {"guild_id": str(i), "role_id": f"{i}{r}", "role_name": f"cargo {r}"}
+                for i in range(guilds)
+                for r in range(roles_per_guild)
+            ],
+        )
+
+
+async def _load_orm(db: DatabaseConnection):
+    """Carrega as linhas como instâncias do ORM, como os repositórios faziam antes."""
+    async with db.get_session() as session:
+        guilds = list(await session.scalars(select(GuildSettingsDB)))
+        roles = list(
+            await session.scalars(
+                select(GuildRoleDB).order_by(GuildRoleDB.guild_id, GuildRoleDB.added_at)
+            )
+        )
+    return guilds, roles
+
+
+async def _load_dtos(db: DatabaseConnection):
+    """Carrega as linhas pelos repositórios, como entidades leves."""
+    guilds = await GuildSettingsRepository(db.get_session).get_all_settings()
+    roles = await RoleRepository(db.get_session).get_all_roles()
+    return guilds, roles
+
+
+def _fan_out(guilds, roles) -> int:
+    """Monta o destino e as menções de cada servidor; retorna quantos foram montados."""
+    mentions = {}
+    for role in roles:
+        mentions.setdefault(role.guild_id, []).append(f"<@&{role.role_id}>")
+    targets = [
+        (guild.channel_id, " ".join(mentions.get(guild.guild_id, ())))
+        for guild in guilds
+        if guild.enabled and guild.channel_id
+    ]
+    return len(targets)
+
+
+async def _measure(db: DatabaseConnection, loader, repeat: int):
+    """Retorna (menor tempo em s, pico de memória em bytes) de carga + fan-out."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _fan_out(*await loader(db))
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    _fan_out(*await loader(db))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+async def _run(args):
+    """Popula um banco temporário e mede as duas formas de leitura."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseConnection(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        try:
+            await db.setup()
+            await _populate(db, args.guilds, args.roles)
+            orm_guilds, orm_roles = await _load_orm(db)
+            dto_guilds, dto_roles = await _load_dtos(db)
+            assert _fan_out(orm_guilds, orm_roles) == _fan_out(dto_guilds, dto_roles) == args.guilds
+            return {
+                "ORM": await _measure(db, _load_orm, args.repeat),
+                "entidades": await _measure(db, _load_dtos, args.repeat),
+            }
+        finally:
+            await db.close()
+
+
+def main():
+    """Executa o benchmark e imprime tempo e pico de memória de cada abordagem."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--guilds", type=int, default=10000)
+    parser.add_argument("--roles", type=int, default=2, help="Cargos por servidor.")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results = asyncio.run(_run(args))
+    print(f"{'leitura':>10} {'tempo (s)':>10} {'pico de memória (MB)':>21}")
+    for name, (elapsed, peak) in results.items():
+        print(f"{name:>10} {elapsed:>10.3f} {peak / 1e6:>21.2f}")
+    (orm_time, orm_peak), (dto_time, dto_peak) = results["ORM"], results["entidades"]
+    print(f"\nganho: tempo {orm_time / dto_time:.1f}x, memória {orm_peak / dto_peak:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""
+Benchmark: compara o perfil padrão do SQLite com o perfil ajustado do `DatabaseConnection`.
+
+Mede muitas gravações pequenas (uma transação por log, como `LogRepository.add`),
+leituras repetidas da tabela de editais e as mesmas leituras disputando o banco
+com um escritor, como acontece entre o bot e o `health_check.py`.
+
+Uso: python -m benchmarks.bench_sqlite --writes 500 --reads 200
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from src.core.entities.edital import Edital
+from src.infra.database.connection import DatabaseConnection
+from src.infra.database.repositories.all_editais_repository import AllEditaisRepository
+from src.infra.database.repositories.log_repository import LogRepository
+
+# Equivalente ao comportamento do SQLite sem ajustes: journal de rollback e fsync completo.
+PROFILES = {
+    "padrão": dict(
+        journal_mode="DELETE",
+        synchronous="FULL",
+        busy_timeout_ms=5000,  # mesmo valor que o driver sqlite3 usa por padrão
+        cache_size_kib=2000,
+        mmap_size_bytes=0,
+    ),
+    "ajustado": dict(),
+}
+
+
+def _make_editais(count: int):
+    """Gera editais fictícios para popular o banco."""
+    return [
+        Edital(
+            title=f"Edital {i:05d}/2025 - Processo seletivo",
+            link=f"https://www.uepa.br/editais/{i}.pdf",
+            date="01/01/2025",
+            hash=f"{i:064x}",
+        )
+        for i in range(count)
+    ]
+
+
+async def _run_profile(options: dict, writes: int, reads: int, editais: int):
+    """Executa as cargas em um banco novo e retorna os tempos de escrita, leitura e leitura concorrente."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseConnection(f"sqlite:///{os.path.join(tmp, 'bench.db')}", **options)
+        try:
+            await db.setup()
+            logs = LogRepository(db.get_session)
+            repo = AllEditaisRepository(db.get_session)
+            await repo.add_many(_make_editais(editais))
+
+            start = time.perf_counter()
+            for i in range(writes):
+                await logs.add(guild_id="1", action="BENCH", details=f"log {i}")
+            write_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in range(reads):
+                hashes = await repo.get_all_hashes()
+            read_time = time.perf_counter() - start
+            assert len(hashes) == editais
+
+            async def reader():
+                begin = time.perf_counter()
+                for _ in range(reads):
+                    await repo.get_all_hashes()
+                return time.perf_counter() - begin
+
+            async def writer():
+                for i in range(writes):
+                    await logs.add(guild_id="1", action="BENCH", details=f"concorrente {i}")
+
+            mixed_time, _ = await asyncio.gather(reader(), writer())
+            return write_time, read_time, mixed_time
+        finally:
+            await db.close()
+
+
+def main():
+    """Executa o benchmark para cada perfil e imprime as vazões."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--writes", type=int, default=500)
+    parser.add_argument("--reads", type=int, default=200)
+    parser.add_argument("--editais", type=int, default=2000)
+    args = parser.parse_args()
+
+    results = {
+        name: asyncio.run(_run_profile(options, args.writes, args.reads, args.editais))
+        for name, options in PROFILES.items()
+    }
+
+    print(f"{'perfil':>9} {'escritas/s':>11} {'leituras/s':>11} {'leituras c/ escrita/s':>22}")
+    for name, (write_time, read_time, mixed_time) in results.items():
+        print(
+            f"{name:>9} {args.writes / write_time:>11.0f} {args.reads / read_time:>11.1f}"
+            f" {args.reads / mixed_time:>22.1f}"
+        )
+
+    base, tuned = results["padrão"], results["ajustado"]
+    gains = ", ".join(
+        f"{label} {b / t:.1f}x"
+        for label, b, t in zip(("escrita", "leitura", "leitura concorrente"), base, tuned)
+    )
+    print(f"\nganho: {gains}")
+
+
+if __name__ == "__main__":
+    main()
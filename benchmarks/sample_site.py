@@ -0,0 +1,72 @@
+"""
+Gera páginas sintéticas no formato da listagem de editais da UEPA.
+
+Uso: python -m benchmarks.sample_site --out /tmp/uepa --pages 100 --per-page 50
+"""
+
+import argparse
+import os
+
+MONTHS = [
+    "janeiro", "fevereiro", "março", "abril", "maio", "junho",
+    "julho", "agosto", "setembro", "outubro", "novembro", "dezembro",
+]
+
+
+def make_editais_page(count: int, start: int = 0, total_pages: int = 1) -> str:
+    """Retorna o HTML de uma página com `count` editais a partir do índice `start`."""
+    items = []
+    for i in range(start, start + count):
+        link = (
+            f'<p><a href="/sites/default/files/editais/edital{i}.pdf">Baixar edital</a></p>'
+            if i % 5
+            else ""
+        )
+        items.append(
+            f"""
+<div class="accordion-item">
+  <h2 class="accordion-header" id="heading-{i}">
+    <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse"
+            data-bs-target="#collapse-{i}" aria-controls="collapse-{i}">
+      Edital {i % 300 + 1}-{2000 + i % 26} - Processo <strong>Seletivo</strong> nº {i}
+    </button>
+  </h2>
+  <div id="collapse-{i}" class="accordion-collapse collapse" aria-labelledby="heading-{i}">
+    <div class="accordion-body">
+      <p>Torna público o processo seletivo &amp; demais informações.</p>
+      <p>Belém, {i % 28 + 1} de {MONTHS[i % 12]} de {2000 + i % 26}</p>
+      {link}
+    </div>
+  </div>
+</div>"""
+        )
+
+    pager = "".join(
+        f'<li class="pager__item"><a href="?page={page}">{page + 1}</a></li>'
+        for page in range(total_pages)
+    )
+    return (
+        "<!DOCTYPE html><html lang='pt-br'><head><meta charset='utf-8'>"
+        "<title>Editais | UEPA</title></head><body>"
+        f"<div class='accordion' id='editais'>{''.join(items)}</div>"
+        f"<nav class='pager'><ul class='pagination'>{pager}</ul></nav>"
+        "</body></html>"
+    )
+
+
+def write_site(out_dir: str, pages: int, per_page: int):
+    """Grava `pages` arquivos editais-N.html para servir com `python -m http.server`."""
+    os.makedirs(out_dir, exist_ok=True)
+    for page in range(pages):
+        path = os.path.join(out_dir, f"editais-{page}.html")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(make_editais_page(per_page, start=page * per_page, total_pages=pages))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera uma cópia local sintética da listagem.")
+    parser.add_argument("--out", default="sample_site")
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--per-page", type=int, default=50)
+    args = parser.parse_args()
+    write_site(args.out, args.pages, args.per_page)
@@ -12,6 +12,8 @@ import aiohttp
 from sqlalchemy import create_engine, text, exc
 from sqlalchemy.orm import sessionmaker
 
+from src.infra.http.client import HttpClient
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("HealthCheck")
@@ -72,19 +74,19 @@ def check_database():
 
 async def check_uepa_website():
     """Check if UEPA website is accessible"""
+    client = HttpClient(limit=1, timeout=10)
     try:
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=10)
-        ) as session:
-            async with session.get(UEPA_EDITAIS_URL) as response:
-                if response.status == 200:
-                    return True
-                else:
-                    logger.error("UEPA website returned status %s", response.status)
-                    return False
+        async with client.session.get(UEPA_EDITAIS_URL) as response:
+            if response.status == 200:
+                return True
+            else:
+                logger.error("UEPA website returned status %s", response.status)
+                return False
     except aiohttp.ClientError as e:
         logger.error("UEPA website check failed: %s", e)
         return False
+    finally:
+        await client.close()
 
 
 def check_environment():
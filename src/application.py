@@ -26,11 +26,11 @@ class Application:
                 "src.presentation.discord.cogs.info",
                 "src.presentation.discord.cogs.roles",
                 "src.presentation.discord.bot",
-                "src.infra.web_scraper.uepa_scraper",
+                "src.infra.web_scraper.sources",
             ]
         )
 
-    def setup(self):
+    async def setup(self):
         """Configura a aplicação."""
         
         log_files = glob.glob("logs/**/*.log", recursive=True)
@@ -49,11 +49,11 @@ class Application:
         )
 
         db = self.container.db_connection()
-        db.setup()
+        await db.setup()
 
     async def start(self):
         """Inicia a aplicação."""
-        self.setup()
+        await self.setup()
         bot = self.container.bot()
         bot.container = self.container
 
@@ -69,6 +69,10 @@ class Application:
         finally:
             if not bot.is_closed():
                 await bot.close()
+            await self.container.http_client().close()
+            self.container.parser_pool().shutdown()
+            await self.container.log_repo().close()
+            await self.container.db_connection().close()
             logger.info("Bot desligado.")
 
 
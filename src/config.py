@@ -1,15 +1,75 @@
 """Carrega e valida as configurações do ambiente."""
+from typing import List, Optional
+
+from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 
 
+class EditalSourceSettings(BaseModel):
+    """Define uma página de listagem de editais a ser monitorada."""
+
+    name: str
+    url: str
+    parser: str = "indexed"
+    interval_minutes: Optional[int] = None
+
+
 class Settings(BaseSettings):
     """Carrega e valida as configurações do ambiente."""
 
     DISCORD_TOKEN: str = ""
     CHECK_INTERVAL_MINUTES: int = 5
+    POLL_MIN_INTERVAL_MINUTES: float = 2.0
+    POLL_MAX_INTERVAL_MINUTES: float = 30.0
+    POLL_BACKOFF_FACTOR: float = 1.5
+    POLL_JITTER_RATIO: float = 0.1
+    POLL_HISTORY_DAYS: int = 180
     LOG_LEVEL: str = "INFO"
     DATABASE_URL: str = "sqlite:///data/uepa_bot.db"
+    KNOWN_HASHES_SNAPSHOT_PATH: str = "data/known_hashes.idx"
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE_KIB: int = 16384
+    SQLITE_MMAP_SIZE_BYTES: int = 134217728
+    SQLITE_CONVERT_INCREMENTAL_VACUUM: bool = False
+    DB_POOL_SIZE: int = 5
     UEPA_EDITAIS_URL: str = "https://www.uepa.br/pt-br/editais"
+    EDITAIS_SOURCES: List[EditalSourceSettings] = []
+    HTTP_TIMEOUT_SECONDS: float = 30.0
+    HTTP_POOL_LIMIT: int = 20
+    HTTP_POOL_LIMIT_PER_HOST: int = 8
+    HTTP_KEEPALIVE_SECONDS: float = 60.0
+    HTTP_DNS_CACHE_TTL_SECONDS: int = 300
+    HTTP_MAX_RETRIES: int = 3
+    HTTP_BACKOFF_BASE_SECONDS: float = 1.0
+    HTTP_BACKOFF_MAX_SECONDS: float = 30.0
+    HTTP_HEDGE_DELAY_SECONDS: float = 0.0
+    CIRCUIT_FAILURE_THRESHOLD: int = 3
+    CIRCUIT_RESET_SECONDS: float = 300.0
+    SCRAPER_PARSER_ENGINE: str = "indexed"
+    SCRAPER_MAX_PAGES: int = 5
+    SCRAPER_PAGE_CONCURRENCY: int = 2
+    PARSER_POOL_KIND: str = "thread"
+    PARSER_POOL_WORKERS: int = 2
+    PARSER_POOL_MAX_PENDING: int = 4
+    PARSER_TIMEOUT_SECONDS: float = 30.0
+    DELIVERY_CONCURRENCY: int = 20
+    DELIVERY_GLOBAL_RATE: float = 40.0
+    DELIVERY_PROGRESS_SECONDS: float = 10.0
+    OUTBOX_POLL_SECONDS: float = 30.0
+    OUTBOX_BATCH_SIZE: int = 500
+    OUTBOX_MAX_ATTEMPTS: int = 5
+    OUTBOX_RETRY_BASE_SECONDS: float = 60.0
+    OUTBOX_RETENTION_DAYS: int = 7
+    EDITAIS_INSERT_CHUNK_SIZE: int = 200
+    LOG_BUFFER_BATCH_SIZE: int = 100
+    LOG_BUFFER_FLUSH_SECONDS: float = 5.0
+    LOG_BUFFER_MAX_ENTRIES: int = 10000
+    LOG_RETENTION_DAYS: int = 30
+    LOG_RETENTION_INTERVAL_HOURS: float = 6.0
+    LOG_RETENTION_BATCH_SIZE: int = 500
+    LOG_VACUUM_PAGES: int = 1000
     ENVIRONMENT: str = "production"
     TZ: str = "America/Sao_Paulo"
 
@@ -2,16 +2,27 @@
 
 
 from dependency_injector import containers, providers
-from aiohttp import ClientSession
 
 from src.config import settings
 from src.infra.database.connection import DatabaseConnection
+from src.infra.database.log_retention import LogRetentionJob
 from src.infra.database.repositories.all_editais_repository import AllEditaisRepository
+from src.infra.database.repositories.buffered_log_repository import BufferedLogRepository
+from src.infra.database.repositories.delivery_ledger_repository import DeliveryLedgerRepository
 from src.infra.database.repositories.guild_settings_repository import GuildSettingsRepository
 from src.infra.database.repositories.log_repository import LogRepository
+from src.infra.database.repositories.notification_outbox_repository import (
+    NotificationOutboxRepository,
+)
 from src.infra.database.repositories.role_repository import RoleRepository
-from src.infra.web_scraper.uepa_scraper import UepaScraper
+from src.infra.cache.guild_settings_cache import GuildSettingsCache
+from src.infra.http.client import HttpClient
+from src.infra.scheduling.polling_scheduler import AdaptivePollingScheduler
+from src.infra.web_scraper.parser_pool import ParserPool
+from src.infra.web_scraper.scrape_cache import ScrapeCache
+from src.infra.web_scraper.sources import SourceRegistry
 from src.presentation.discord.bot import UEPABot
+from src.presentation.discord.delivery import DeliveryScheduler
 
 class Container(containers.DeclarativeContainer):
     """Container para injeção de dependências."""
@@ -19,17 +30,98 @@ class Container(containers.DeclarativeContainer):
     config = providers.Configuration()
     config.from_pydantic(settings)
 
-    db_connection = providers.Singleton(DatabaseConnection, db_url=config.DATABASE_URL)
+    db_connection = providers.Singleton(
+        DatabaseConnection,
+        db_url=config.DATABASE_URL,
+        journal_mode=config.SQLITE_JOURNAL_MODE,
+        synchronous=config.SQLITE_SYNCHRONOUS,
+        busy_timeout_ms=config.SQLITE_BUSY_TIMEOUT_MS,
+        cache_size_kib=config.SQLITE_CACHE_SIZE_KIB,
+        mmap_size_bytes=config.SQLITE_MMAP_SIZE_BYTES,
+        pool_size=config.DB_POOL_SIZE,
+        convert_to_incremental_vacuum=config.SQLITE_CONVERT_INCREMENTAL_VACUUM,
+    )
 
     session = providers.Singleton(db_connection.provided.get_session)
 
-    aiohttp_session = providers.Singleton(ClientSession)
+    http_client = providers.Singleton(
+        HttpClient,
+        limit=config.HTTP_POOL_LIMIT,
+        limit_per_host=config.HTTP_POOL_LIMIT_PER_HOST,
+        keepalive_timeout=config.HTTP_KEEPALIVE_SECONDS,
+        dns_cache_ttl=config.HTTP_DNS_CACHE_TTL_SECONDS,
+        timeout=config.HTTP_TIMEOUT_SECONDS,
+    )
 
-    all_editais_repo = providers.Factory(AllEditaisRepository, session_factory=session)
+    aiohttp_session = http_client.provided.session
+
+    all_editais_repo = providers.Factory(
+        AllEditaisRepository,
+        session_factory=session,
+        chunk_size=config.EDITAIS_INSERT_CHUNK_SIZE,
+    )
     guild_settings_repo = providers.Factory(GuildSettingsRepository, session_factory=session)
-    log_repo = providers.Factory(LogRepository, session_factory=session)
+    log_repo = providers.Singleton(
+        BufferedLogRepository,
+        repository=providers.Factory(LogRepository, session_factory=session),
+        batch_size=config.LOG_BUFFER_BATCH_SIZE,
+        flush_interval=config.LOG_BUFFER_FLUSH_SECONDS,
+        max_buffered=config.LOG_BUFFER_MAX_ENTRIES,
+    )
     role_repo = providers.Factory(RoleRepository, session_factory=session)
+    log_retention = providers.Singleton(
+        LogRetentionJob,
+        log_repo=log_repo,
+        db_connection=db_connection,
+        retention_days=config.LOG_RETENTION_DAYS,
+        batch_size=config.LOG_RETENTION_BATCH_SIZE,
+        vacuum_pages=config.LOG_VACUUM_PAGES,
+    )
+    notification_outbox_repo = providers.Factory(
+        NotificationOutboxRepository, session_factory=session
+    )
+    delivery_ledger_repo = providers.Factory(DeliveryLedgerRepository, session_factory=session)
+
+    guild_cache = providers.Singleton(
+        GuildSettingsCache, guild_repo=guild_settings_repo, role_repo=role_repo
+    )
+
+    parser_pool = providers.Singleton(
+        ParserPool,
+        kind=config.PARSER_POOL_KIND,
+        max_workers=config.PARSER_POOL_WORKERS,
+        max_pending=config.PARSER_POOL_MAX_PENDING,
+        timeout=config.PARSER_TIMEOUT_SECONDS,
+    )
+
+    scrape_cache = providers.Singleton(
+        ScrapeCache,
+        ttl_seconds=providers.Callable(lambda minutes: minutes * 60, config.CHECK_INTERVAL_MINUTES),
+    )
+
+    source_registry = providers.Singleton(
+        SourceRegistry,
+        session=aiohttp_session,
+        parser_pool=parser_pool,
+        cache=scrape_cache,
+        sources=config.EDITAIS_SOURCES,
+    )
+
+    polling_scheduler = providers.Singleton(
+        AdaptivePollingScheduler,
+        base_minutes=config.CHECK_INTERVAL_MINUTES,
+        min_minutes=config.POLL_MIN_INTERVAL_MINUTES,
+        max_minutes=config.POLL_MAX_INTERVAL_MINUTES,
+        backoff_factor=config.POLL_BACKOFF_FACTOR,
+        jitter_ratio=config.POLL_JITTER_RATIO,
+        tz=config.TZ,
+    )
 
-    uepa_scraper = providers.Factory(UepaScraper, session=aiohttp_session)
+    delivery_scheduler = providers.Singleton(
+        DeliveryScheduler,
+        max_concurrency=config.DELIVERY_CONCURRENCY,
+        global_rate=config.DELIVERY_GLOBAL_RATE,
+        progress_interval=config.DELIVERY_PROGRESS_SECONDS,
+    )
 
     bot = providers.Singleton(UEPABot)
@@ -1,15 +1,127 @@
 """Define a entidade Edital, que representa um edital da UEPA."""
-from typing import Optional
-from pydantic import BaseModel, HttpUrl, Field
+import re
+import unicodedata
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Optional
+from urllib.parse import quote, unquote, urlsplit, urlunsplit
+
+from pydantic import BaseModel, HttpUrl, Field, field_validator, model_validator
+
+PUBLICATION_DATE_RE = re.compile(r"(\d{1,2})\s+de\s+(\w+)\s+de\s+(\d{4})", re.IGNORECASE)
+MONTHS = {
+    "janeiro": 1,
+    "fevereiro": 2,
+    "marco": 3,
+    "abril": 4,
+    "maio": 5,
+    "junho": 6,
+    "julho": 7,
+    "agosto": 8,
+    "setembro": 9,
+    "outubro": 10,
+    "novembro": 11,
+    "dezembro": 12,
+}
+
+
+@lru_cache(maxsize=4096)
+def parse_publication_date(text: Optional[str]) -> Optional[datetime]:
+    """
+    Interpreta datas por extenso como "Belém, 12 de março de 2025".
+
+    Retorna None quando o texto não contém uma data válida. Os resultados
+    ficam em cache: a mesma data se repete em muitos editais da listagem.
+    """
+    if not text:
+        return None
+    match = PUBLICATION_DATE_RE.search(text)
+    if not match:
+        return None
+    day, month_name, year = match.groups()
+    month_name = unicodedata.normalize("NFKD", month_name.lower())
+    month = MONTHS.get("".join(c for c in month_name if not unicodedata.combining(c)))
+    if not month:
+        return None
+    try:
+        return datetime(int(year), month, int(day))
+    except ValueError:
+        return None
+
+
+def normalize_edital_link(link: str) -> str:
+    """
+    Normaliza o link de um edital para uso como identidade estável.
+
+    Ignora diferenças de caixa no domínio, fragmento, barra final, ordem dos
+    parâmetros e codificação do caminho, que não mudam o documento apontado.
+    """
+    parts = urlsplit(link.strip())
+    path = quote(unquote(parts.path)).rstrip("/") or "/"
+    query = "&".join(sorted(filter(None, parts.query.split("&"))))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+
+TRUSTED_FIELDS = {"title", "link", "date", "hash", "published_at"}
 
 
 class Edital(BaseModel):
     """Representa um edital da UEPA."""
     title: str = Field(..., min_length=1, description="Título do edital")
-    link: HttpUrl = Field(..., description="Link para o edital")
+    link: str = Field(..., description="Link para o edital (URL http/https absoluta)")
     date: Optional[str] = Field("Data não disponível", description="Data de publicação do edital")
     hash: str = Field(..., description="Hash MD5 único do edital")
+    published_at: Optional[datetime] = Field(
+        None, description="Data de publicação interpretada a partir de `date`"
+    )
+
+    @field_validator("link", mode="before")
+    @classmethod
+    def validate_link(cls, link: Any) -> str:
+        """Valida o link como URL http/https e o guarda na forma normalizada, como texto."""
+        return str(HttpUrl(str(link)))
+
+    @model_validator(mode="before")
+    @classmethod
+    def fill_published_at(cls, data: Any) -> Any:
+        """Preenche `published_at` a partir de `date` quando não informado."""
+        if isinstance(data, dict) and data.get("published_at") is None:
+            data = {**data, "published_at": parse_publication_date(data.get("date"))}
+        return data
+
+    @classmethod
+    def trusted(cls, title: str, link: str, date: Optional[str], hash: str) -> "Edital":
+        """
+        Cria o edital sem validação, para dados que o parser já garantiu.
+
+        `link` precisa já estar na forma normalizada que a validação produziria.
+        """
+        return cls.model_construct(
+            _fields_set=TRUSTED_FIELDS,
+            title=title,
+            link=link,
+            date=date,
+            hash=hash,
+            published_at=parse_publication_date(date),
+        )
+
+    @property
+    def key(self) -> str:
+        """Identidade estável do edital, que não muda quando o título é corrigido."""
+        return normalize_edital_link(self.link)
 
     class Config:
         """Configurações para o modelo Pydantic."""
         frozen = True
+
+
+@dataclass(frozen=True, slots=True)
+class EditalRecord:
+    """Edital registrado em `all_editais`, como lido nas consultas de histórico."""
+    id: int
+    published_at: Optional[date]
+    title: str
+    link: str
+    date: Optional[str]
+    posted_at: Optional[datetime]
@@ -0,0 +1,23 @@
+"""Define as entidades de configuração dos servidores do Discord."""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
+class GuildSettings:
+    """Configurações de notificação de um servidor."""
+    guild_id: str
+    channel_id: Optional[str]
+    enabled: bool
+    batch_notifications: bool
+
+
+@dataclass(frozen=True, slots=True)
+class GuildRole:
+    """Cargo mencionado nas notificações de um servidor."""
+    guild_id: str
+    role_id: str
+    role_name: str
+    added_by: Optional[str]
+    added_at: Optional[datetime]
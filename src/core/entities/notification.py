@@ -0,0 +1,32 @@
+"""Define as entidades da fila de notificações e do registro de entregas."""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxEntry:
+    """Notificação pendente de um edital para um servidor."""
+    id: int
+    guild_id: str
+    edital_hash: str
+    title: str
+    link: str
+    date: Optional[str]
+    kind: str
+    attempts: int
+
+
+@dataclass(frozen=True, slots=True)
+class LedgerEntry:
+    """Mensagem em que um edital foi postado em um servidor."""
+    id: int
+    guild_id: str
+    channel_id: str
+    message_id: str
+    edital_key: str
+    edital_hash: str
+    title: str
+    link: str
+    date: Optional[str]
+    posted_at: Optional[datetime]
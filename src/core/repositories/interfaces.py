@@ -1,80 +1,209 @@
 """Interfaces para os repositórios."""
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Set
+from datetime import date, datetime
+from typing import Iterable, List, Dict, Any, Optional, Set, Tuple
 
-from src.core.entities.edital import Edital
+from src.core.entities.edital import Edital, EditalRecord
+from src.core.entities.guild import GuildRole, GuildSettings
+from src.core.entities.notification import LedgerEntry, OutboxEntry
 
 
 class IAllEditaisRepository(ABC):
     """Interface para o repositório global de editais vistos."""
 
     @abstractmethod
-    def get_all_hashes(self) -> Set[str]:
+    async def get_all_hashes(self) -> Set[str]:
         """Retorna um conjunto com todos os hashes de editais já vistos."""
 
     @abstractmethod
-    def add_many(self, editais: List[Edital]) -> bool:
-        """Adiciona múltiplos editais ao repositório."""
+    async def get_hash_watermark(self) -> Tuple[int, int]:
+        """Retorna o maior id e a quantidade de editais registrados."""
 
     @abstractmethod
-    def is_empty(self) -> bool:
+    async def get_hashes_after(self, after_id: int) -> List[Tuple[int, str]]:
+        """Retorna (id, hash) dos editais com id maior que `after_id`."""
+
+    @abstractmethod
+    async def get_existing_keys(self, keys: Iterable[str]) -> Set[str]:
+        """Retorna quais das identidades (links normalizados) já estão no repositório."""
+
+    @abstractmethod
+    async def fill_missing_keys(self) -> int:
+        """Calcula a identidade dos editais gravados antes de ela existir."""
+
+    @abstractmethod
+    async def add_many(self, editais: List[Edital]) -> int:
+        """
+        Adiciona múltiplos editais ao repositório, ignorando os já registrados.
+
+        Retorna quantos editais foram de fato inseridos.
+        """
+
+    @abstractmethod
+    async def is_empty(self) -> bool:
         """Verifica se o repositório de editais está vazio."""
 
     @abstractmethod
-    def clear_all(self) -> int:
+    async def clear_all(self) -> int:
         """Limpa completamente o repositório de editais."""
 
     @abstractmethod
-    def count_all(self) -> int:
+    async def count_all(self) -> int:
         """Conta o total de editais vistos."""
 
+    @abstractmethod
+    async def get_posted_at_since(self, since: datetime) -> List[datetime]:
+        """Retorna os horários em que os editais foram vistos desde a data informada."""
+
+    @abstractmethod
+    async def fill_missing_dates(self, editais: Iterable[Edital]) -> int:
+        """
+        Grava a data de publicação dos editais já registrados sem ela.
+
+        Retorna quantos registros foram atualizados.
+        """
+
+    @abstractmethod
+    async def get_published_between(
+        self, start: date, end: date, limit: int = 100
+    ) -> List[EditalRecord]:
+        """Retorna os editais publicados entre `start` e `end`, inclusive, a partir do mais recente."""
+
+    @abstractmethod
+    async def get_latest(self, limit: int) -> List[EditalRecord]:
+        """Retorna os `limit` editais com a data de publicação mais recente."""
+
+    @abstractmethod
+    async def count_by_month(self, since: Optional[date] = None) -> List[Tuple[int, int, int]]:
+        """Retorna (ano, mês, quantidade) de editais publicados por mês, em ordem cronológica."""
+
+
+class INotificationOutboxRepository(ABC):
+    """Interface para a fila persistente de notificações (outbox)."""
+
+    @abstractmethod
+    async def enqueue(self, guild_ids: Iterable[str], editais: List[Edital], kind: str = "post") -> int:
+        """
+        Enfileira uma notificação por (servidor, edital), ignorando as já existentes.
+
+        `kind` é "post" para uma nova mensagem ou "edit" para atualizar a já enviada.
+        """
+
+    @abstractmethod
+    async def get_due(self, limit: int) -> List[OutboxEntry]:
+        """Retorna as notificações pendentes cuja próxima tentativa já venceu."""
+
+    @abstractmethod
+    async def mark_sent(self, entry_ids: Iterable[int]) -> None:
+        """Marca notificações como entregues."""
+
+    @abstractmethod
+    async def mark_retry(self, entry_ids: Iterable[int], error: str, next_attempt_at: datetime) -> None:
+        """Registra uma falha e reagenda as notificações."""
+
+    @abstractmethod
+    async def mark_failed(self, entry_ids: Iterable[int], error: str) -> None:
+        """Desiste das notificações após uma falha definitiva."""
+
+    @abstractmethod
+    async def count_pending(self) -> int:
+        """Conta as notificações ainda não entregues."""
+
+    @abstractmethod
+    async def purge_finished(self, before: datetime) -> int:
+        """Remove as notificações concluídas antes da data informada."""
+
+
+class IDeliveryLedgerRepository(ABC):
+    """Interface para o registro das mensagens em que cada edital foi postado."""
+
+    @abstractmethod
+    async def record(self, guild_id: str, channel_id: str, message_id: str, entries: List[Any]) -> None:
+        """Registra os editais entregues em uma mensagem."""
+
+    @abstractmethod
+    async def get_guilds_by_keys(self, keys: Iterable[str]) -> Dict[str, Set[str]]:
+        """Retorna, para cada identidade de edital, os servidores em que ele foi postado."""
+
+    @abstractmethod
+    async def get_by_keys(self, guild_id: str, keys: Iterable[str]) -> List[LedgerEntry]:
+        """Retorna os registros de um servidor para as identidades informadas."""
+
+    @abstractmethod
+    async def get_by_message_ids(self, message_ids: Iterable[str]) -> List[LedgerEntry]:
+        """Retorna todos os registros das mensagens informadas, na ordem de envio."""
+
+    @abstractmethod
+    async def update_entries(self, guild_id: str, entries: List[Any]) -> None:
+        """Atualiza título, link, data e hash dos registros de mesma identidade."""
+
 
 class IRoleRepository(ABC):
     """Interface para o repositório de cargos a serem mencionados."""
 
     @abstractmethod
-    def add(self, guild_id: str, role_id: str, role_name: str, added_by: str) -> bool:
+    async def add(self, guild_id: str, role_id: str, role_name: str, added_by: str) -> bool:
         """Adiciona um cargo."""
 
     @abstractmethod
-    def remove(self, guild_id: str, role_id: str) -> bool:
+    async def remove(self, guild_id: str, role_id: str) -> bool:
         """Remove um cargo."""
 
     @abstractmethod
-    def get_all(self, guild_id: str) -> List[Any]:
+    async def get_all(self, guild_id: str) -> List[GuildRole]:
         """Retorna todos os cargos de um servidor."""
 
     @abstractmethod
-    def clear(self, guild_id: str) -> int:
+    async def clear(self, guild_id: str) -> int:
         """Remove todos os cargos de um servidor."""
 
+    @abstractmethod
+    async def get_all_roles(self) -> List[GuildRole]:
+        """Retorna os cargos de todos os servidores."""
+
 
 class IGuildSettingsRepository(ABC):
     """Interface para o repositório de configurações do servidor."""
 
     @abstractmethod
-    def get(self, guild_id: str) -> Optional[Any]:
+    async def get(self, guild_id: str) -> Optional[GuildSettings]:
         """Obtém as configurações de um servidor."""
 
     @abstractmethod
-    def set(self, guild_id: str, settings: Dict[str, Any]) -> None:
+    async def set(self, guild_id: str, settings: Dict[str, Any]) -> None:
         """Define as configurações de um servidor."""
 
     @abstractmethod
-    def get_all_guilds(self) -> List[Any]:
+    async def get_all_guilds(self) -> List[GuildSettings]:
         """Retorna as configurações de todos os servidores."""
 
+    @abstractmethod
+    async def get_all_settings(self) -> List[GuildSettings]:
+        """Retorna as configurações de todos os servidores, inclusive os pausados."""
+
 
 class ILogRepository(ABC):
     """Interface para o repositório de logs."""
 
     @abstractmethod
-    def add(
+    async def add(
         self,
         guild_id: Optional[str],
         action: str,
         details: Optional[str] = None,
         user_id: Optional[str] = None,
     ) -> None:
-        """Adiciona uma entrada de log."""
\ No newline at end of file
+        """Adiciona uma entrada de log."""
+
+    @abstractmethod
+    async def add_many(self, entries: List[Dict[str, Any]]) -> bool:
+        """Adiciona várias entradas de log em uma única inserção."""
+
+    @abstractmethod
+    async def roll_up_before(self, before: datetime, limit: int) -> int:
+        """
+        Soma aos contadores diários até `limit` logs anteriores a `before` e os apaga.
+
+        Retorna quantos logs foram removidos.
+        """
\ No newline at end of file
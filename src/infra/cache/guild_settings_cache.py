@@ -0,0 +1,161 @@
+"""Cache em memória das configurações e dos cargos mencionados de cada servidor."""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.core.entities.guild import GuildSettings
+from src.core.repositories.interfaces import IGuildSettingsRepository, IRoleRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedRole:
+    """Cargo configurado para menção; `present` indica se ainda existe no servidor."""
+
+    role_id: str
+    role_name: str
+    present: bool = True
+
+
+@dataclass
+class CachedGuildSettings:
+    """Configurações de um servidor com a string de menções já montada."""
+
+    guild_id: str
+    channel_id: Optional[str] = None
+    enabled: bool = False
+    batch_notifications: bool = True
+    roles: List[CachedRole] = field(default_factory=list)
+    mentions: str = ""
+
+    def rebuild_mentions(self):
+        """Recalcula a string de menções a partir dos cargos existentes."""
+        self.mentions = " ".join(f"<@&{role.role_id}>" for role in self.roles if role.present)
+
+
+class GuildSettingsCache:
+    """
+    Mantém em memória as configurações e cargos de todos os servidores.
+
+    Carregado uma vez na inicialização; as alterações feitas pelos comandos
+    passam por aqui e são gravadas no banco (write-through), de modo que as
+    leituras do caminho de notificação não consultam o banco.
+    """
+
+    def __init__(self, guild_repo: IGuildSettingsRepository, role_repo: IRoleRepository):
+        self.guild_repo = guild_repo
+        self.role_repo = role_repo
+        self._guilds: Dict[str, CachedGuildSettings] = {}
+
+    @staticmethod
+    def _from_row(row: GuildSettings) -> CachedGuildSettings:
+        """Converte uma linha de `guild_settings` para a entrada do cache."""
+        return CachedGuildSettings(
+            guild_id=row.guild_id,
+            channel_id=row.channel_id,
+            enabled=bool(row.enabled),
+            batch_notifications=row.batch_notifications is not False,
+        )
+
+    async def load(self):
+        """Carrega todas as configurações e cargos do banco."""
+        rows = await self.guild_repo.get_all_settings()
+        guilds = {row.guild_id: self._from_row(row) for row in rows}
+        for role in await self.role_repo.get_all_roles():
+            entry = guilds.setdefault(role.guild_id, CachedGuildSettings(guild_id=role.guild_id))
+            entry.roles.append(CachedRole(role.role_id, role.role_name))
+        for entry in guilds.values():
+            entry.rebuild_mentions()
+        self._guilds = guilds
+        logger.info("Cache de servidores carregado com %d servidores.", len(guilds))
+
+    async def refresh(self, guild_id: str) -> Optional[CachedGuildSettings]:
+        """Recarrega um servidor do banco, descartando o que estava em cache."""
+        row = await self.guild_repo.get(guild_id)
+        entry = self._from_row(row) if row else CachedGuildSettings(guild_id=guild_id)
+        previous = self._guilds.get(guild_id)
+        missing = {r.role_id for r in previous.roles if not r.present} if previous else set()
+        entry.roles = [
+            CachedRole(role.role_id, role.role_name, role.role_id not in missing)
+            for role in await self.role_repo.get_all(guild_id)
+        ]
+        entry.rebuild_mentions()
+        self._guilds[guild_id] = entry
+        return entry
+
+    def get(self, guild_id: str) -> Optional[CachedGuildSettings]:
+        """Retorna as configurações em cache de um servidor."""
+        return self._guilds.get(guild_id)
+
+    def active_guilds(self) -> List[CachedGuildSettings]:
+        """Servidores com notificações ativas e canal configurado."""
+        return [g for g in self._guilds.values() if g.enabled and g.channel_id]
+
+    def roles(self, guild_id: str) -> List[CachedRole]:
+        """Cargos configurados para menção em um servidor."""
+        entry = self._guilds.get(guild_id)
+        return list(entry.roles) if entry else []
+
+    async def set(self, guild_id: str, values: Dict[str, Any]):
+        """Grava as configurações no banco e atualiza o cache."""
+        await self.guild_repo.set(guild_id, values)
+        entry = self._guilds.get(guild_id)
+        if entry is None:
+            await self.refresh(guild_id)
+            return
+        for key, value in values.items():
+            setattr(entry, key, value)
+
+    async def add_role(self, guild_id: str, role_id: str, role_name: str, added_by: str) -> bool:
+        """Adiciona um cargo no banco e no cache."""
+        if not await self.role_repo.add(guild_id, role_id, role_name, added_by):
+            return False
+        entry = self._guilds.setdefault(guild_id, CachedGuildSettings(guild_id=guild_id))
+        entry.roles.append(CachedRole(role_id, role_name))
+        entry.rebuild_mentions()
+        return True
+
+    async def remove_role(self, guild_id: str, role_id: str) -> bool:
+        """Remove um cargo do banco e do cache."""
+        if not await self.role_repo.remove(guild_id, role_id):
+            return False
+        entry = self._guilds.get(guild_id)
+        if entry:
+            entry.roles = [role for role in entry.roles if role.role_id != role_id]
+            entry.rebuild_mentions()
+        return True
+
+    async def clear_roles(self, guild_id: str) -> int:
+        """Remove todos os cargos de um servidor no banco e no cache."""
+        cleared = await self.role_repo.clear(guild_id)
+        entry = self._guilds.get(guild_id)
+        if entry:
+            entry.roles = []
+            entry.rebuild_mentions()
+        return cleared
+
+    def mark_roles_present(self, guild_id: str, present_ids: Iterable[str]):
+        """Sincroniza quais cargos ainda existem no servidor do Discord."""
+        entry = self._guilds.get(guild_id)
+        if not entry:
+            return
+        present_ids = set(present_ids)
+        for role in entry.roles:
+            role.present = role.role_id in present_ids
+        entry.rebuild_mentions()
+
+    def mark_role_deleted(self, guild_id: str, role_id: str):
+        """Tira das menções um cargo apagado no Discord (o registro é mantido)."""
+        entry = self._guilds.get(guild_id)
+        if not entry:
+            return
+        for role in entry.roles:
+            if role.role_id == role_id:
+                role.present = False
+        entry.rebuild_mentions()
+
+    def invalidate(self, guild_id: str):
+        """Descarta um servidor do cache."""
+        self._guilds.pop(guild_id, None)
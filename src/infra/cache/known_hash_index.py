@@ -0,0 +1,269 @@
+"""Índice compacto dos hashes de editais já vistos, com snapshot em disco."""
+
+import hashlib
+import logging
+import mmap
+import os
+import struct
+from array import array
+from itertools import accumulate
+from typing import Iterable, Iterator, List, Optional, Set, Union
+
+from src.core.repositories.interfaces import IAllEditaisRepository
+
+logger = logging.getLogger(__name__)
+
+DIGEST_SIZE = 16
+# Os 12 primeiros bits do digest escolhem um balde; a tabela de deslocamentos
+# limita cada consulta a poucas dezenas de itens mesmo em catálogos grandes.
+PREFIX_BITS = 12
+BUCKETS = 1 << PREFIX_BITS
+# Cabeçalho do snapshot: assinatura, quantidade de digests, maior id de
+# `all_editais` incluído e checksum dos digests; seguem a tabela de baldes e
+# os digests ordenados.
+SNAPSHOT_MAGIC = b"TLNUHX02"
+SNAPSHOT_HEADER = struct.Struct("<8sQQ16s")
+BUCKET_TABLE_SIZE = (BUCKETS + 1) * array("I").itemsize
+# Sem AUTOINCREMENT, o SQLite reaproveita os ids do fim da tabela após um
+# delete; as últimas linhas do snapshot são conferidas com a tabela na carga.
+TAIL_CHECK_ROWS = 256
+
+Buffer = Union[bytes, mmap.mmap]
+
+
+def to_digest(edital_hash: str) -> bytes:
+    """Converte o hash MD5 hexadecimal do edital nos 16 bytes correspondentes."""
+    if len(edital_hash) == DIGEST_SIZE * 2:
+        try:
+            return bytes.fromhex(edital_hash)
+        except ValueError:
+            pass
+    # hashes fora do formato MD5 hexadecimal ainda recebem um digest estável
+    return hashlib.md5(edital_hash.encode()).digest()
+
+
+def _checksum(data: Buffer) -> bytes:
+    """Checksum dos digests ordenados, gravado no cabeçalho do snapshot."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _prefix(digest: bytes) -> int:
+    """Balde de um digest."""
+    return int.from_bytes(digest[:2], "big") >> (16 - PREFIX_BITS)
+
+
+def _bucket_offsets(digests: List[bytes]) -> array:
+    """Posição inicial de cada balde em uma lista ordenada de digests."""
+    counts = [0] * (BUCKETS + 1)
+    for digest in digests:
+        counts[_prefix(digest) + 1] += 1
+    return array("I", accumulate(counts))
+
+
+class _SortedDigests:
+    """Visão de sequência sobre um buffer de digests ordenados, agrupados por balde."""
+
+    __slots__ = ("buffer", "offset", "count", "buckets")
+
+    def __init__(self, buffer: Buffer, offset: int, count: int, buckets: array):
+        self.buffer = buffer
+        self.offset = offset
+        self.count = count
+        self.buckets = buckets
+
+    @classmethod
+    def from_digests(cls, digests: Iterable[bytes]) -> "_SortedDigests":
+        """Monta a base em memória a partir de digests em qualquer ordem."""
+        ordered = sorted(set(digests))
+        return cls(b"".join(ordered), 0, len(ordered), _bucket_offsets(ordered))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> bytes:
+        start = self.offset + index * DIGEST_SIZE
+        return self.buffer[start:start + DIGEST_SIZE]
+
+    def __contains__(self, digest: bytes) -> bool:
+        bucket = _prefix(digest)
+        start = self.offset + self.buckets[bucket] * DIGEST_SIZE
+        end = self.offset + self.buckets[bucket + 1] * DIGEST_SIZE
+        # o balde tem poucas dezenas de digests: uma busca em bytes é mais
+        # rápida que a busca binária em Python; só valem posições alinhadas
+        chunk = self.buffer[start:end]
+        position = chunk.find(digest)
+        while position > 0 and position % DIGEST_SIZE:
+            position = chunk.find(digest, position + 1)
+        return position >= 0
+
+    def data(self) -> bytes:
+        """Os digests ordenados, em um único bloco de bytes."""
+        return bytes(self.buffer[self.offset:self.offset + self.count * DIGEST_SIZE])
+
+
+class KnownHashIndex:
+    """
+    Conjunto dos hashes de editais conhecidos, guardados como digests de 16 bytes.
+
+    A base é um array ordenado (em memória ou mapeado do snapshot) em que a
+    consulta percorre apenas o balde do prefixo do digest; os hashes adicionados depois
+    ficam em um `set` pequeno até o próximo `save`, que os funde na base.
+    `watermark` é o maior id de `all_editais` já refletido no índice e permite
+    completar um snapshot antigo apenas com as linhas novas.
+    """
+
+    def __init__(self, digests: Iterable[bytes] = (), watermark: int = 0):
+        self._base = _SortedDigests.from_digests(digests)
+        self._mmap: Optional[mmap.mmap] = None
+        self._recent: Set[bytes] = set()
+        self.watermark = watermark
+
+    def __contains__(self, edital_hash: object) -> bool:
+        if not isinstance(edital_hash, str):
+            return False
+        digest = to_digest(edital_hash)
+        return digest in self._recent or digest in self._base
+
+    def __len__(self) -> int:
+        return len(self._base) + len(self._recent)
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self._base)):
+            yield self._base[index].hex()
+        for digest in self._recent:
+            yield digest.hex()
+
+    def add(self, edital_hash: str):
+        """Adiciona um hash ao índice."""
+        digest = to_digest(edital_hash)
+        if digest not in self._base:
+            self._recent.add(digest)
+
+    def update(self, edital_hashes: Iterable[str]):
+        """Adiciona vários hashes ao índice."""
+        for edital_hash in edital_hashes:
+            self.add(edital_hash)
+
+    def clear(self):
+        """Esvazia o índice (após a limpeza do histórico)."""
+        self._release()
+        self._base = _SortedDigests.from_digests(())
+        self._recent = set()
+        self.watermark = 0
+
+    def close(self):
+        """Libera o mapeamento do snapshot, mantendo o conteúdo em memória."""
+        if self._mmap is not None:
+            base = self._base
+            self._base = _SortedDigests(base.data(), 0, base.count, base.buckets)
+            self._release()
+
+    def _release(self):
+        """Fecha o mapeamento do snapshot, se houver."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def save(self, path: str):
+        """Grava o índice de forma atômica, fundindo os hashes recentes na base."""
+        if self._recent:
+            base = (self._base[index] for index in range(len(self._base)))
+            merged = _SortedDigests.from_digests((*base, *self._recent))
+        else:
+            merged = _SortedDigests(self._base.data(), 0, self._base.count, self._base.buckets)
+        # `merged` já está em memória; o mapeamento é fechado antes da troca do
+        # arquivo, que o Windows recusa enquanto ele estiver mapeado
+        self._release()
+        self._base = merged
+        self._recent = set()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(
+                SNAPSHOT_HEADER.pack(
+                    SNAPSHOT_MAGIC, merged.count, self.watermark, _checksum(merged.buffer)
+                )
+            )
+            f.write(merged.buckets.tobytes())
+            f.write(merged.buffer)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def open(cls, path: str) -> Optional["KnownHashIndex"]:
+        """Mapeia um snapshot do disco; retorna None se ele não existir ou estiver corrompido."""
+        try:
+            with open(path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        data_offset = SNAPSHOT_HEADER.size + BUCKET_TABLE_SIZE
+        try:
+            magic, count, watermark, checksum = SNAPSHOT_HEADER.unpack_from(mapped, 0)
+        except struct.error:
+            magic = count = watermark = checksum = None
+        valid = magic == SNAPSHOT_MAGIC and len(mapped) == data_offset + count * DIGEST_SIZE
+        if valid:
+            # checksum direto sobre o mapeamento: fatiar o mmap copiaria os digests
+            with memoryview(mapped) as view, view[data_offset:] as data:
+                valid = _checksum(data) == checksum
+        if not valid:
+            mapped.close()
+            logger.warning("Snapshot de hashes inválido em '%s'; será reconstruído.", path)
+            return None
+        buckets = array("I")
+        buckets.frombytes(mapped[SNAPSHOT_HEADER.size:data_offset])
+        index = cls()
+        index._mmap = mapped
+        index._base = _SortedDigests(mapped, data_offset, count, buckets)
+        index.watermark = watermark
+        return index
+
+
+async def load_known_hashes(repo: IAllEditaisRepository, path: str) -> KnownHashIndex:
+    """
+    Carrega o índice a partir do snapshot, completando-o com as linhas novas da tabela.
+
+    Se o snapshot não existir ou não corresponder mais à tabela (histórico
+    apagado, banco trocado, ids reaproveitados), o índice é reconstruído lendo
+    `all_editais` inteira e um snapshot novo é gravado. Além da contagem, as
+    últimas `TAIL_CHECK_ROWS` linhas cobertas pelo snapshot precisam estar nele.
+    """
+    max_id, total = await repo.get_hash_watermark()
+    index = KnownHashIndex.open(path)
+    if index is not None and index.watermark <= max_id:
+        rows = await repo.get_hashes_after(max(0, index.watermark - TAIL_CHECK_ROWS))
+        newer = [(row_id, edital_hash) for row_id, edital_hash in rows if row_id > index.watermark]
+        tail_matches = all(
+            edital_hash in index for row_id, edital_hash in rows if row_id <= index.watermark
+        )
+        if tail_matches and len(index) + len(newer) == total:
+            index.update(edital_hash for _, edital_hash in newer)
+            index.watermark = max_id
+            logger.info(
+                "Índice de hashes carregado do snapshot (%d hashes, %d novos na tabela).",
+                len(index),
+                len(newer),
+            )
+            if newer:
+                index.save(path)
+            return index
+        index.close()
+        logger.info("Snapshot de hashes desatualizado; reconstruindo a partir da tabela.")
+
+    rows = await repo.get_hashes_after(0)
+    index = KnownHashIndex(
+        (to_digest(edital_hash) for _, edital_hash in rows),
+        watermark=max((row_id for row_id, _ in rows), default=0),
+    )
+    index.save(path)
+    logger.info("Índice de hashes reconstruído com %d hashes.", len(index))
+    return index
+
+
+async def save_known_hashes(index: KnownHashIndex, repo: IAllEditaisRepository, path: str):
+    """Sincroniza o índice com as linhas novas da tabela e grava o snapshot."""
+    newer = await repo.get_hashes_after(index.watermark)
+    index.update(edital_hash for _, edital_hash in newer)
+    if newer:
+        index.watermark = max(row_id for row_id, _ in newer)
+    index.save(path)
@@ -1,45 +1,210 @@
-"""Gerencia a conexão com o banco de dados usando SQLAlchemy."""
+"""Gerencia a conexão com o banco de dados usando SQLAlchemy (modo assíncrono)."""
 
 import logging
-from contextlib import contextmanager
-from typing import Iterator
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
+from sqlalchemy import event, text
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 
+from src.infra.database.migrations import run_migrations
 from src.infra.database.tables import Base
+from src.infra.database.upsert import SUPPORTED_DIALECTS
 
 logger = logging.getLogger(__name__)
 
+# Drivers assíncronos usados quando a URL informa apenas o banco (ex.: "sqlite:///...").
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+    "mysql": "aiomysql",
+}
+
+
+SQLITE_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+SQLITE_SYNCHRONOUS_LEVELS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+
+def to_async_url(db_url: str) -> str:
+    """Converte a URL do banco para o driver assíncrono correspondente."""
+    url = make_url(db_url)
+    if "+" not in url.drivername and url.drivername in ASYNC_DRIVERS:
+        url = url.set(drivername=f"{url.drivername}+{ASYNC_DRIVERS[url.drivername]}")
+    return url.render_as_string(hide_password=False)
+
+
+def _is_memory_sqlite(url: URL) -> bool:
+    """Indica se a URL aponta para um banco SQLite em memória."""
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
 
 class DatabaseConnection:
-    """Gerencia a conexão com o banco de dados usando SQLAlchemy."""
+    """
+    Gerencia a conexão com o banco de dados usando SQLAlchemy (modo assíncrono).
+
+    Com SQLite, aplica em cada nova conexão um perfil de desempenho: journal
+    WAL (leitores não bloqueiam o escritor), nível de `synchronous`
+    configurável, espera em caso de banco ocupado e caches de páginas e mmap.
+    """
+
+    def __init__(
+        self,
+        db_url: str,
+        journal_mode: str = "WAL",
+        synchronous: str = "NORMAL",
+        busy_timeout_ms: int = 5000,
+        cache_size_kib: int = 16384,
+        mmap_size_bytes: int = 128 * 1024 * 1024,
+        pool_size: int = 5,
+        convert_to_incremental_vacuum: bool = False,
+    ):
+        url = make_url(to_async_url(db_url))
+        if url.get_backend_name() not in SUPPORTED_DIALECTS:
+            raise ValueError(
+                f"Banco não suportado: {url.get_backend_name()} "
+                f"(use um de: {', '.join(sorted(SUPPORTED_DIALECTS))})"
+            )
+        self.convert_to_incremental_vacuum = convert_to_incremental_vacuum
+        engine_options: Dict[str, Any] = {}
+        self._pragmas: Dict[str, Any] = {}
+        if url.get_backend_name() == "sqlite":
+            journal_mode = journal_mode.upper()
+            synchronous = synchronous.upper()
+            if journal_mode not in SQLITE_JOURNAL_MODES:
+                raise ValueError(f"journal_mode inválido para SQLite: {journal_mode}")
+            if synchronous not in SQLITE_SYNCHRONOUS_LEVELS:
+                raise ValueError(f"synchronous inválido para SQLite: {synchronous}")
+            self._pragmas = {
+                "journal_mode": journal_mode,
+                "synchronous": synchronous,
+                "busy_timeout": int(busy_timeout_ms),
+                # valor negativo: tamanho em KiB, não em páginas
+                "cache_size": -int(cache_size_kib),
+                "mmap_size": int(mmap_size_bytes),
+                "foreign_keys": "ON",
+                "temp_store": "MEMORY",
+            }
+            if _is_memory_sqlite(url):
+                # cada conexão a ":memory:" abriria um banco vazio diferente
+                engine_options["poolclass"] = StaticPool
+            else:
+                # o SQLite aceita um escritor por vez; poucas conexões reaproveitadas
+                # evitam reabrir o arquivo e reaplicar o perfil a cada sessão
+                engine_options.update(
+                    poolclass=AsyncAdaptedQueuePool,
+                    pool_size=max(1, pool_size),
+                    max_overflow=0,
+                    pool_timeout=busy_timeout_ms / 1000 + 5,
+                )
 
-    def __init__(self, db_url: str):
-        self._engine = create_engine(db_url)
-        self._session_factory = sessionmaker(
-            autocommit=False, autoflush=False, bind=self._engine
+        self._engine = create_async_engine(url, **engine_options)
+        if self._pragmas:
+            event.listen(self._engine.sync_engine, "connect", self._apply_pragmas)
+        # expire_on_commit=False: os repositórios devolvem objetos já
+        # desvinculados da sessão, que precisam continuar legíveis.
+        self._session_factory = async_sessionmaker(
+            autoflush=False, expire_on_commit=False, bind=self._engine
         )
 
-    def setup(self):
-        """Cria as tabelas do banco de dados se elas não existirem."""
+    def _apply_pragmas(self, dbapi_connection, _connection_record):
+        """Aplica o perfil do SQLite em cada conexão nova."""
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in self._pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    async def setup(self):
+        """Cria as tabelas que não existem e aplica as migrações pendentes."""
         logger.info("Verificando e configurando o banco de dados...")
         try:
-            Base.metadata.create_all(self._engine)
+            if self._pragmas:
+                await self._enable_incremental_vacuum()
+            async with self._engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+                await conn.run_sync(run_migrations)
             logger.info("Banco de dados configurado com sucesso.")
         except Exception as e:
             logger.error("Falha ao configurar o banco de dados: %s", e, exc_info=True)
             raise
 
-    @contextmanager
-    def get_session(self) -> Iterator[Session]:
-        """Fornece uma sessão do SQLAlchemy."""
+    async def _enable_incremental_vacuum(self):
+        """
+        Ativa `auto_vacuum=INCREMENTAL` no SQLite, permitindo devolver espaço aos poucos.
+
+        Bancos novos recebem o modo sem custo. Em bancos já existentes a mudança
+        só vale após um VACUUM completo, que bloqueia o banco durante toda a
+        execução; por isso ele só roda quando o operador habilita
+        `convert_to_incremental_vacuum` (SQLITE_CONVERT_INCREMENTAL_VACUUM).
+        """
+        async with self._engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            if await conn.scalar(text("PRAGMA auto_vacuum")) == 2:
+                return
+            if not await conn.scalar(text("SELECT count(*) FROM sqlite_master")):
+                # o VACUUM de um banco vazio é instantâneo e grava o modo no cabeçalho
+                await conn.execute(text("PRAGMA auto_vacuum=INCREMENTAL"))
+                await conn.execute(text("VACUUM"))
+                return
+
+            page_count = await conn.scalar(text("PRAGMA page_count"))
+            page_size = await conn.scalar(text("PRAGMA page_size"))
+            size_mib = page_count * page_size / (1024 * 1024)
+            if not self.convert_to_incremental_vacuum:
+                logger.warning(
+                    "Banco SQLite (%.1f MiB) sem auto_vacuum incremental: o espaço dos logs "
+                    "removidos não volta ao sistema. Para converter, defina "
+                    "SQLITE_CONVERT_INCREMENTAL_VACUUM=true e reinicie o bot; a conversão "
+                    "executa um VACUUM completo, que bloqueia o banco e precisa de até "
+                    "%.1f MiB livres em disco.",
+                    size_mib,
+                    size_mib,
+                )
+                return
+
+            logger.warning(
+                "Convertendo o banco (%.1f MiB) para auto_vacuum incremental com um VACUUM "
+                "completo; o banco fica bloqueado até o fim.",
+                size_mib,
+            )
+            start = time.perf_counter()
+            await conn.execute(text("PRAGMA auto_vacuum=INCREMENTAL"))
+            await conn.execute(text("VACUUM"))
+            logger.info("Conversão concluída em %.1fs.", time.perf_counter() - start)
+
+    async def reclaim_space(self, max_pages: int) -> int:
+        """Devolve ao sistema até `max_pages` páginas livres do SQLite e retorna quantas."""
+        if not self._pragmas:
+            return 0
+        async with self._engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            before = await conn.scalar(text("PRAGMA freelist_count"))
+            # o sqlite3 do Python executa o pragma um único passo (uma página) via
+            # `execute`; `executescript` o executa até o fim
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.executescript(
+                f"PRAGMA incremental_vacuum({int(max_pages)});"
+            )
+            after = await conn.scalar(text("PRAGMA freelist_count"))
+        return before - after
+
+    @asynccontextmanager
+    async def get_session(self) -> AsyncIterator[AsyncSession]:
+        """Fornece uma sessão assíncrona do SQLAlchemy."""
         session = self._session_factory()
         try:
             yield session
-            session.commit()
+            await session.commit()
         except Exception as e:
             logger.error("Erro na sessão do banco de dados: %s", e, exc_info=True)
-            session.rollback()
+            await session.rollback()
             raise
         finally:
-            session.close()
+            await session.close()
+
+    async def close(self):
+        """Fecha as conexões do pool."""
+        await self._engine.dispose()
@@ -0,0 +1,23 @@
+"""Consultas que devolvem entidades leves em vez de objetos do ORM."""
+
+from dataclasses import fields
+from typing import Iterable, List, Type, TypeVar
+
+from sqlalchemy import Select, select
+
+T = TypeVar("T")
+
+
+def select_dto(dto: Type[T], model) -> Select:
+    """
+    Monta um SELECT apenas com as colunas de `model` que correspondem aos campos de `dto`.
+
+    As linhas vêm na ordem dos campos da dataclass, prontas para `to_dtos`,
+    sem passar pelo identity map nem pela instrumentação do ORM.
+    """
+    return select(*(getattr(model, field.name) for field in fields(dto)))
+
+
+def to_dtos(dto: Type[T], rows: Iterable[tuple]) -> List[T]:
+    """Converte as linhas de um `select_dto` nas entidades correspondentes."""
+    return [dto(*row) for row in rows]
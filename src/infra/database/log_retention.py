@@ -0,0 +1,70 @@
+"""Retenção dos logs do bot: resumo diário, limpeza em lotes e recuperação de espaço."""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from src.core.repositories.interfaces import ILogRepository
+from src.infra.database.connection import DatabaseConnection
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RetentionReport:
+    """Resultado de uma rodada de retenção."""
+
+    rolled_up: int = 0
+    pages_reclaimed: int = 0
+
+
+class LogRetentionJob:
+    """
+    Mantém `bot_logs` limitado a `retention_days` dias.
+
+    Os logs mais antigos são somados em `bot_log_daily` (por dia, servidor e
+    ação) e apagados em lotes de `batch_size`, cada um em sua própria
+    transação curta, com uma pausa entre eles para não segurar o escritor.
+    Ao final, devolve até `vacuum_pages` páginas livres por rodada.
+    """
+
+    def __init__(
+        self,
+        log_repo: ILogRepository,
+        db_connection: DatabaseConnection,
+        retention_days: int = 30,
+        batch_size: int = 500,
+        batch_pause: float = 0.05,
+        vacuum_pages: int = 1000,
+    ):
+        self.log_repo = log_repo
+        self.db_connection = db_connection
+        self.retention_days = retention_days
+        self.batch_size = max(1, batch_size)
+        self.batch_pause = batch_pause
+        self.vacuum_pages = vacuum_pages
+
+    async def run(self) -> RetentionReport:
+        """Executa uma rodada completa de retenção."""
+        report = RetentionReport()
+        before = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+            days=self.retention_days
+        )
+        while True:
+            removed = await self.log_repo.roll_up_before(before, self.batch_size)
+            report.rolled_up += removed
+            if removed < self.batch_size:
+                break
+            await asyncio.sleep(self.batch_pause)
+
+        if self.vacuum_pages > 0:
+            report.pages_reclaimed = await self.db_connection.reclaim_space(self.vacuum_pages)
+
+        if report.rolled_up or report.pages_reclaimed:
+            logger.info(
+                "Retenção de logs: %d logs resumidos e removidos, %d páginas devolvidas.",
+                report.rolled_up,
+                report.pages_reclaimed,
+            )
+        return report
@@ -0,0 +1,135 @@
+"""Migrações de esquema versionadas, aplicadas na inicialização do bot."""
+
+import logging
+from dataclasses import dataclass
+from typing import Callable, List, Sequence
+
+from sqlalchemy import Connection, insert, inspect, select, text
+
+from src.infra.database.tables import Base, SchemaMigrationDB
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """Uma alteração de esquema identificada por uma versão crescente."""
+
+    version: int
+    description: str
+    upgrade: Callable[[Connection], None]
+
+
+def create_indexes(*names: str) -> Callable[[Connection], None]:
+    """Retorna uma migração que cria os índices declarados nos modelos, se faltarem."""
+
+    def upgrade(conn: Connection):
+        indexes = {
+            index.name: index for table in Base.metadata.sorted_tables for index in table.indexes
+        }
+        for name in names:
+            indexes[name].create(conn, checkfirst=True)
+            logger.info("Índice '%s' verificado.", name)
+
+    return upgrade
+
+
+def add_columns(table_name: str, *names: str) -> Callable[[Connection], None]:
+    """Retorna uma migração que adiciona a uma tabela existente as colunas declaradas no modelo."""
+
+    def upgrade(conn: Connection):
+        table = Base.metadata.tables[table_name]
+        existing = {column["name"] for column in inspect(conn).get_columns(table_name)}
+        preparer = conn.dialect.identifier_preparer
+        for name in names:
+            if name in existing:
+                # tabela criada pelo `create_all` já com a coluna
+                continue
+            column = table.columns[name]
+            ddl = (
+                f"ALTER TABLE {preparer.quote(table_name)} "
+                f"ADD COLUMN {preparer.quote(name)} {column.type.compile(dialect=conn.dialect)}"
+            )
+            if column.server_default is not None:
+                default = column.server_default.arg
+                if isinstance(default, str):
+                    default = "'" + default.replace("'", "''") + "'"
+                else:
+                    default = default.compile(dialect=conn.dialect)
+                ddl += f" DEFAULT {default}"
+                if not column.nullable:
+                    ddl += " NOT NULL"
+            conn.execute(text(ddl))
+            logger.info("Coluna '%s.%s' adicionada.", table_name, name)
+
+    return upgrade
+
+
+def steps(*upgrades: Callable[[Connection], None]) -> Callable[[Connection], None]:
+    """Combina várias alterações em uma única migração, executadas em ordem."""
+
+    def upgrade(conn: Connection):
+        for step in upgrades:
+            step(conn)
+
+    return upgrade
+
+
+# `create_all` cria apenas tabelas novas; colunas e índices de tabelas já
+# implantadas chegam por aqui. Nunca altere uma migração publicada: acrescente
+# outra. (As colunas das versões 1 e 3 eram adicionadas fora do versionamento
+# antes da migração correspondente; bancos que já a registraram têm a coluna.)
+MIGRATIONS: List[Migration] = [
+    Migration(
+        1,
+        "Colunas batch_notifications, edital_key e kind; índices de edital_key e message_id",
+        steps(
+            add_columns("guild_settings", "batch_notifications"),
+            add_columns("all_editais", "edital_key"),
+            add_columns("notification_outbox", "kind"),
+            create_indexes("ix_all_editais_edital_key", "ix_delivery_ledger_message_id"),
+        ),
+    ),
+    Migration(
+        2,
+        "Índices dos filtros de cargos, configurações, logs e outbox",
+        create_indexes(
+            "ix_guild_roles_guild_added",
+            "ix_guild_settings_enabled_channel",
+            "ix_bot_logs_timestamp",
+            "ix_outbox_status_next_attempt",
+        ),
+    ),
+    Migration(
+        3,
+        "Colunas date e published_at dos editais e índice da data de publicação",
+        steps(
+            add_columns("all_editais", "date", "published_at"),
+            create_indexes("ix_all_editais_published_at"),
+        ),
+    ),
+]
+
+
+def run_migrations(conn: Connection, migrations: Sequence[Migration] = MIGRATIONS) -> int:
+    """
+    Aplica em ordem as migrações ainda não registradas e retorna quantas rodaram.
+
+    Cada versão é registrada em `schema_migrations` na mesma transação da
+    alteração, então uma falha interrompe a inicialização sem marcar a
+    migração como aplicada.
+    """
+    applied = set(conn.scalars(select(SchemaMigrationDB.version)))
+    pending = sorted(
+        (migration for migration in migrations if migration.version not in applied),
+        key=lambda migration: migration.version,
+    )
+    for migration in pending:
+        logger.info("Aplicando migração %d: %s", migration.version, migration.description)
+        migration.upgrade(conn)
+        conn.execute(
+            insert(SchemaMigrationDB).values(
+                version=migration.version, description=migration.description
+            )
+        )
+    return len(pending)
@@ -1,59 +1,194 @@
 """Implementação do repositório de editais vistos para SQLAlchemy."""
 
-from typing import List, Callable, Any
-from contextlib import AbstractContextManager
+import logging
+from datetime import date, datetime
+from typing import Iterable, List, Callable, Optional, Set, Tuple
+from contextlib import AbstractAsyncContextManager
 
-from sqlalchemy import ColumnElement
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, extract, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
-from src.core.entities.edital import Edital
+from src.core.entities.edital import Edital, EditalRecord, normalize_edital_link
 from src.core.repositories.interfaces import IAllEditaisRepository
+from src.infra.database.dto import select_dto, to_dtos
 from src.infra.database.tables import EditalDB
+from src.infra.database.upsert import insert_ignoring_conflicts
 
+logger = logging.getLogger(__name__)
 
 class AllEditaisRepository(IAllEditaisRepository):
     """Implementação do repositório de editais vistos para SQLAlchemy."""
 
-    def __init__(self, session_factory: Callable[..., AbstractContextManager[Session]]):
+    def __init__(
+        self,
+        session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]],
+        chunk_size: int = 200,
+    ):
         self.session_factory = session_factory
+        self.chunk_size = max(1, chunk_size)
 
-    def get_all_hashes(self) -> set[ColumnElement[Any]]:
-        with self.session_factory() as session:
-            return {row[0] for row in session.query(EditalDB.edital_hash).all()}
+    async def get_all_hashes(self) -> Set[str]:
+        async with self.session_factory() as session:
+            return set(await session.scalars(select(EditalDB.edital_hash)))
 
-    def add_many(self, editais: List[Edital]) -> bool:
-        with self.session_factory() as session:
-            try:
-                db_editais = [
-                    EditalDB(
-                        edital_hash=edital.hash,
-                        title=edital.title,
-                        link=str(edital.link),
+    async def get_hash_watermark(self) -> Tuple[int, int]:
+        async with self.session_factory() as session:
+            max_id, total = (
+                await session.execute(select(func.max(EditalDB.id), func.count(EditalDB.id)))
+            ).one()
+            return max_id or 0, total
+
+    async def get_hashes_after(self, after_id: int) -> List[Tuple[int, str]]:
+        async with self.session_factory() as session:
+            rows = await session.execute(
+                select(EditalDB.id, EditalDB.edital_hash).where(EditalDB.id > after_id)
+            )
+            return [(row_id, edital_hash) for row_id, edital_hash in rows]
+
+    async def get_existing_keys(self, keys: Iterable[str]) -> Set[str]:
+        keys = list(keys)
+        if not keys:
+            return set()
+        async with self.session_factory() as session:
+            return set(
+                await session.scalars(
+                    select(EditalDB.edital_key).where(EditalDB.edital_key.in_(keys))
+                )
+            )
+
+    async def fill_missing_keys(self) -> int:
+        async with self.session_factory() as session:
+            rows = await session.execute(
+                select(EditalDB.id, EditalDB.link).where(EditalDB.edital_key.is_(None))
+            )
+            updates = [
+                {"id": row_id, "edital_key": normalize_edital_link(link)} for row_id, link in rows
+            ]
+            if updates:
+                await session.execute(update(EditalDB), updates)
+                await session.commit()
+            return len(updates)
+
+    async def add_many(self, editais: List[Edital]) -> int:
+        rows = [
+            {
+                "edital_hash": edital.hash,
+                "edital_key": edital.key,
+                "title": edital.title,
+                "link": edital.link,
+                "date": edital.date,
+                "published_at": edital.published_at.date() if edital.published_at else None,
+            }
+            for edital in editais
+        ]
+        inserted = 0
+        # um INSERT de várias linhas por lote, cada um na sua transação: o
+        # rowcount é exato e os parâmetros ficam abaixo do limite do SQLite
+        for start in range(0, len(rows), self.chunk_size):
+            async with self.session_factory() as session:
+                try:
+                    stmt = insert_ignoring_conflicts(
+                        EditalDB, session.bind.dialect.name
+                    ).values(rows[start:start + self.chunk_size])
+                    result = await session.execute(stmt)
+                    await session.commit()
+                except SQLAlchemyError:
+                    await session.rollback()
+                    # os lotes anteriores já foram gravados; os restantes ficam
+                    # para a próxima verificação, que os verá como novos
+                    logger.exception(
+                        "Falha ao gravar editais; %d de %d inseridos antes do erro.",
+                        inserted, len(rows),
                     )
-                    for edital in editais
-                ]
-                session.bulk_save_objects(db_editais)
-                session.commit()
-                return True
-            except SQLAlchemyError:
-                session.rollback()
-                return False
+                    return inserted
+                inserted += max(result.rowcount, 0)
+        return inserted
 
-    def is_empty(self) -> bool:
-        with self.session_factory() as session:
-            return session.query(EditalDB).first() is None
+    async def is_empty(self) -> bool:
+        async with self.session_factory() as session:
+            return await session.scalar(select(EditalDB.id).limit(1)) is None
 
-    def clear_all(self) -> int:
-        with self.session_factory() as session:
+    async def clear_all(self) -> int:
+        async with self.session_factory() as session:
             try:
-                deleted_rows = session.query(EditalDB).delete()
-                session.commit()
-                return deleted_rows
+                result = await session.execute(delete(EditalDB))
+                await session.commit()
+                return result.rowcount
             except SQLAlchemyError:
-                session.rollback()
+                await session.rollback()
                 return 0
 
-    def count_all(self) -> int:
-        with self.session_factory() as session:
-            return session.query(EditalDB).count()
+    async def count_all(self) -> int:
+        async with self.session_factory() as session:
+            return await session.scalar(select(func.count()).select_from(EditalDB))
+
+    async def get_posted_at_since(self, since: datetime) -> List[datetime]:
+        async with self.session_factory() as session:
+            return list(
+                await session.scalars(
+                    select(EditalDB.posted_at).where(EditalDB.posted_at >= since)
+                )
+            )
+
+    async def fill_missing_dates(self, editais: Iterable[Edital]) -> int:
+        dated = {edital.hash: edital for edital in editais if edital.published_at}
+        if not dated:
+            return 0
+        async with self.session_factory() as session:
+            rows = await session.execute(
+                select(EditalDB.id, EditalDB.edital_hash).where(
+                    EditalDB.edital_hash.in_(list(dated)),
+                    EditalDB.published_at.is_(None),
+                )
+            )
+            updates = [
+                {
+                    "id": row_id,
+                    "date": dated[edital_hash].date,
+                    "published_at": dated[edital_hash].published_at.date(),
+                }
+                for row_id, edital_hash in rows
+            ]
+            if updates:
+                await session.execute(update(EditalDB), updates)
+                await session.commit()
+            return len(updates)
+
+    async def get_published_between(
+        self, start: date, end: date, limit: int = 100
+    ) -> List[EditalRecord]:
+        async with self.session_factory() as session:
+            return to_dtos(
+                EditalRecord,
+                await session.execute(
+                    select_dto(EditalRecord, EditalDB)
+                    .where(EditalDB.published_at.between(start, end))
+                    .order_by(EditalDB.published_at.desc(), EditalDB.id.desc())
+                    .limit(limit)
+                ),
+            )
+
+    async def get_latest(self, limit: int) -> List[EditalRecord]:
+        async with self.session_factory() as session:
+            return to_dtos(
+                EditalRecord,
+                await session.execute(
+                    select_dto(EditalRecord, EditalDB)
+                    .where(EditalDB.published_at.is_not(None))
+                    .order_by(EditalDB.published_at.desc(), EditalDB.id.desc())
+                    .limit(limit)
+                ),
+            )
+
+    async def count_by_month(self, since: Optional[date] = None) -> List[Tuple[int, int, int]]:
+        year = extract("year", EditalDB.published_at)
+        month = extract("month", EditalDB.published_at)
+        stmt = select(year, month, func.count()).where(EditalDB.published_at.is_not(None))
+        if since:
+            stmt = stmt.where(EditalDB.published_at >= since)
+        async with self.session_factory() as session:
+            rows = await session.execute(
+                stmt.group_by(year, month).order_by(year, month)
+            )
+            return [(int(y), int(m), count) for y, m, count in rows]
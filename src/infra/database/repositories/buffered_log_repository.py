@@ -0,0 +1,127 @@
+"""Gravação de logs em lote, fora do caminho dos comandos e eventos."""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from src.core.repositories.interfaces import ILogRepository
+
+logger = logging.getLogger(__name__)
+
+
+class BufferedLogRepository(ILogRepository):
+    """
+    Acumula as entradas de log em memória e as grava em inserções de várias linhas.
+
+    `add` apenas enfileira a entrada (com o horário do evento) e retorna; a
+    gravação acontece quando o buffer atinge `batch_size` ou a cada
+    `flush_interval` segundos, o que vier primeiro. Se o banco falhar, as
+    entradas voltam para o buffer, que descarta as mais antigas acima de
+    `max_buffered`. `close` grava o que restou e deve ser chamado no desligamento.
+    """
+
+    def __init__(
+        self,
+        repository: ILogRepository,
+        batch_size: int = 100,
+        flush_interval: float = 5.0,
+        max_buffered: int = 10000,
+    ):
+        self.repository = repository
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_buffered = max(self.batch_size, max_buffered)
+        self.dropped = 0
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    async def add(
+        self,
+        guild_id: Optional[str],
+        action: str,
+        details: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> None:
+        self._append(
+            {
+                "guild_id": str(guild_id) if guild_id else None,
+                "action": action,
+                "details": details,
+                "user_id": str(user_id) if user_id else None,
+                "timestamp": datetime.now(timezone.utc).replace(tzinfo=None),
+            }
+        )
+
+    async def add_many(self, entries: List[Dict[str, Any]]) -> bool:
+        for entry in entries:
+            self._append(dict(entry))
+        return True
+
+    def _append(self, entry: Dict[str, Any]):
+        """Enfileira uma entrada e acorda o gravador quando o lote enche."""
+        if self._closed:
+            logger.warning("Log descartado após o encerramento: %s", entry.get("action"))
+            return
+        self._buffer.append(entry)
+        self._trim()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    def _trim(self):
+        """Descarta as entradas mais antigas quando o buffer passa do limite."""
+        overflow = len(self._buffer) - self.max_buffered
+        if overflow > 0:
+            del self._buffer[:overflow]
+            self.dropped += overflow
+            logger.warning("Buffer de logs cheio: %d entradas antigas descartadas.", overflow)
+
+    async def _run(self):
+        """Grava o buffer periodicamente ou quando o lote enche."""
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:  # o gravador não pode morrer por uma falha pontual
+                logger.error("Erro ao gravar o buffer de logs: %s", e, exc_info=True)
+
+    async def flush(self) -> int:
+        """Grava todas as entradas pendentes e retorna quantas foram gravadas."""
+        written = 0
+        async with self._lock:
+            while self._buffer:
+                batch = self._buffer[: self.batch_size]
+                del self._buffer[: len(batch)]
+                if not await self.repository.add_many(batch):
+                    # devolve o lote na frente e tenta de novo no próximo ciclo
+                    self._buffer[:0] = batch
+                    self._trim()
+                    break
+                written += len(batch)
+        return written
+
+    async def close(self):
+        """Para o gravador periódico e grava as entradas restantes."""
+        self._closed = True
+        if self._task:
+            # acorda o gravador em vez de cancelá-lo, para não perder um lote em voo
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        written = await self.flush()
+        if self._buffer:
+            logger.error("%d logs não puderam ser gravados no encerramento.", len(self._buffer))
+        logger.info("Buffer de logs encerrado (%d entradas gravadas no desligamento).", written)
+
+    async def roll_up_before(self, before: datetime, limit: int) -> int:
+        await self.flush()
+        return await self.repository.roll_up_before(before, limit)
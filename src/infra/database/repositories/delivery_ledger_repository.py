@@ -0,0 +1,116 @@
+"""Implementação do repositório do registro de entregas para SQLAlchemy."""
+
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Set
+from contextlib import AbstractAsyncContextManager
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.entities.edital import normalize_edital_link
+from src.core.entities.notification import LedgerEntry
+from src.core.repositories.interfaces import IDeliveryLedgerRepository
+from src.infra.database.dto import select_dto, to_dtos
+from src.infra.database.tables import DeliveryLedgerDB
+from src.infra.database.upsert import insert_ignoring_conflicts
+
+
+class DeliveryLedgerRepository(IDeliveryLedgerRepository):
+    """Implementação do repositório do registro de entregas para SQLAlchemy."""
+
+    def __init__(self, session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]]):
+        self.session_factory = session_factory
+
+    async def record(
+        self, guild_id: str, channel_id: str, message_id: str, entries: List[Any]
+    ) -> None:
+        if not entries:
+            return
+        # editais diferentes podem apontar para o mesmo documento; o primeiro
+        # registro de cada identidade (no lote ou já gravado) é mantido
+        rows: Dict[str, Dict[str, Any]] = {}
+        for entry in entries:
+            key = normalize_edital_link(entry.link)
+            rows.setdefault(
+                key,
+                {
+                    "guild_id": guild_id,
+                    "channel_id": channel_id,
+                    "message_id": message_id,
+                    "edital_key": key,
+                    "edital_hash": entry.edital_hash,
+                    "title": entry.title,
+                    "link": entry.link,
+                    "date": entry.date,
+                },
+            )
+        async with self.session_factory() as session:
+            stmt = insert_ignoring_conflicts(DeliveryLedgerDB, session.bind.dialect.name)
+            await session.execute(stmt.values(list(rows.values())))
+            await session.commit()
+
+    async def get_guilds_by_keys(self, keys: Iterable[str]) -> Dict[str, Set[str]]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        guilds: Dict[str, Set[str]] = {}
+        async with self.session_factory() as session:
+            rows = await session.execute(
+                select(DeliveryLedgerDB.edital_key, DeliveryLedgerDB.guild_id).where(
+                    DeliveryLedgerDB.edital_key.in_(keys)
+                )
+            )
+            for key, guild_id in rows:
+                guilds.setdefault(key, set()).add(guild_id)
+        return guilds
+
+    async def get_by_keys(self, guild_id: str, keys: Iterable[str]) -> List[LedgerEntry]:
+        keys = list(keys)
+        if not keys:
+            return []
+        async with self.session_factory() as session:
+            return to_dtos(
+                LedgerEntry,
+                await session.execute(
+                    select_dto(LedgerEntry, DeliveryLedgerDB).where(
+                        DeliveryLedgerDB.guild_id == guild_id,
+                        DeliveryLedgerDB.edital_key.in_(keys),
+                    )
+                ),
+            )
+
+    async def get_by_message_ids(self, message_ids: Iterable[str]) -> List[LedgerEntry]:
+        message_ids = list(message_ids)
+        if not message_ids:
+            return []
+        async with self.session_factory() as session:
+            return to_dtos(
+                LedgerEntry,
+                await session.execute(
+                    select_dto(LedgerEntry, DeliveryLedgerDB)
+                    .where(DeliveryLedgerDB.message_id.in_(message_ids))
+                    .order_by(DeliveryLedgerDB.id)
+                ),
+            )
+
+    async def update_entries(self, guild_id: str, entries: List[Any]) -> None:
+        if not entries:
+            return
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        async with self.session_factory() as session:
+            for entry in entries:
+                await session.execute(
+                    update(DeliveryLedgerDB)
+                    .where(
+                        DeliveryLedgerDB.guild_id == guild_id,
+                        DeliveryLedgerDB.edital_key == normalize_edital_link(entry.link),
+                    )
+                    .values(
+                        edital_hash=entry.edital_hash,
+                        title=entry.title,
+                        link=entry.link,
+                        date=entry.date,
+                        updated_at=now,
+                    )
+                )
+            await session.commit()
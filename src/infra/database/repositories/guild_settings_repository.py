@@ -1,40 +1,57 @@
 """Implementação do repositório de configurações do servidor para SQLAlchemy."""
 
-from typing import Dict, Any, Optional
-from sqlalchemy.orm import sessionmaker
+from typing import Dict, Any, List, Optional, Callable
+from contextlib import AbstractAsyncContextManager
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.entities.guild import GuildSettings
 from src.core.repositories.interfaces import IGuildSettingsRepository
+from src.infra.database.dto import select_dto, to_dtos
 from src.infra.database.tables import GuildSettingsDB
 
 
 class GuildSettingsRepository(IGuildSettingsRepository):
     """Implementação do repositório de configurações do servidor para SQLAlchemy."""
 
-    def __init__(self, session_factory: sessionmaker):
+    def __init__(self, session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]]):
         self.session_factory = session_factory
 
-    def get(self, guild_id: str) -> Optional[GuildSettingsDB]:
-        with self.session_factory() as session:
-            return session.get(GuildSettingsDB, guild_id)
+    async def get(self, guild_id: str) -> Optional[GuildSettings]:
+        async with self.session_factory() as session:
+            row = (
+                await session.execute(
+                    select_dto(GuildSettings, GuildSettingsDB).where(
+                        GuildSettingsDB.guild_id == guild_id
+                    )
+                )
+            ).first()
+            return GuildSettings(*row) if row else None
 
-    def set(self, guild_id: str, settings: Dict[str, Any]) -> None:
-        with self.session_factory() as session:
-            guild_settings = session.get(GuildSettingsDB, guild_id)
+    async def set(self, guild_id: str, settings: Dict[str, Any]) -> None:
+        async with self.session_factory() as session:
+            guild_settings = await session.get(GuildSettingsDB, guild_id)
             if guild_settings:
                 for key, value in settings.items():
                     setattr(guild_settings, key, value)
             else:
                 guild_settings = GuildSettingsDB(guild_id=guild_id, **settings)
                 session.add(guild_settings)
-            session.commit()
-
-    def get_all_guilds(self) -> list[type[GuildSettingsDB]]:
-        with self.session_factory() as session:
-            return (
-                session.query(GuildSettingsDB)
-                .filter(
-                    GuildSettingsDB.enabled.is_(True),
-                    GuildSettingsDB.channel_id.isnot(None),
-                )
-                .all()
-                )
+            await session.commit()
+
+    async def get_all_guilds(self) -> List[GuildSettings]:
+        async with self.session_factory() as session:
+            return to_dtos(
+                GuildSettings,
+                await session.execute(
+                    select_dto(GuildSettings, GuildSettingsDB).where(
+                        GuildSettingsDB.enabled.is_(True),
+                        GuildSettingsDB.channel_id.isnot(None),
+                    )
+                ),
+            )
+
+    async def get_all_settings(self) -> List[GuildSettings]:
+        async with self.session_factory() as session:
+            return to_dtos(
+                GuildSettings, await session.execute(select_dto(GuildSettings, GuildSettingsDB))
+            )
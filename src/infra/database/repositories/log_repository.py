@@ -1,28 +1,34 @@
 """Implementação do repositório de logs para SQLAlchemy."""
 
-from typing import Optional, Callable
-from contextlib import AbstractContextManager
+import logging
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from contextlib import AbstractAsyncContextManager
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.repositories.interfaces import ILogRepository
-from src.infra.database.tables import LogDB
+from src.infra.database.tables import LogDailyDB, LogDB
+
+logger = logging.getLogger(__name__)
 
 
 class LogRepository(ILogRepository):
     """Implementação do repositório de logs para SQLAlchemy."""
 
-    def __init__(self, session_factory: Callable[..., AbstractContextManager[Session]]):
+    def __init__(self, session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]]):
         self.session_factory = session_factory
 
-    def add(
+    async def add(
         self,
         guild_id: Optional[str],
         action: str,
         details: Optional[str] = None,
         user_id: Optional[str] = None,
     ) -> None:
-        with self.session_factory() as session:
+        async with self.session_factory() as session:
             try:
                 log_entry = LogDB(
                     guild_id=str(guild_id) if guild_id else None,
@@ -31,7 +37,50 @@ class LogRepository(ILogRepository):
                     user_id=str(user_id) if user_id else None,
                 )
                 session.add(log_entry)
-                session.commit()
+                await session.commit()
             except SQLAlchemyError:
-                session.rollback()
+                await session.rollback()
                 # Evita que uma falha de log quebre a aplicação
+
+    async def add_many(self, entries: List[Dict[str, Any]]) -> bool:
+        if not entries:
+            return True
+        async with self.session_factory() as session:
+            try:
+                await session.execute(insert(LogDB), entries)
+                await session.commit()
+                return True
+            except SQLAlchemyError as e:
+                await session.rollback()
+                logger.error("Erro ao gravar %d logs: %s", len(entries), e)
+                return False
+
+    async def roll_up_before(self, before: datetime, limit: int) -> int:
+        async with self.session_factory() as session:
+            rows = (
+                await session.execute(
+                    select(LogDB.id, LogDB.timestamp, LogDB.guild_id, LogDB.action)
+                    .where(LogDB.timestamp < before)
+                    .order_by(LogDB.id)
+                    .limit(limit)
+                )
+            ).all()
+            if not rows:
+                return 0
+            counts = Counter((row.timestamp.date(), row.guild_id or "", row.action) for row in rows)
+            # contadores e remoção na mesma transação: cada log é contado uma única vez
+            for (day, guild_id, action), count in counts.items():
+                result = await session.execute(
+                    update(LogDailyDB)
+                    .where(
+                        LogDailyDB.day == day,
+                        LogDailyDB.guild_id == guild_id,
+                        LogDailyDB.action == action,
+                    )
+                    .values(count=LogDailyDB.count + count)
+                )
+                if not result.rowcount:
+                    session.add(LogDailyDB(day=day, guild_id=guild_id, action=action, count=count))
+            await session.execute(delete(LogDB).where(LogDB.id.in_([row.id for row in rows])))
+            await session.commit()
+            return len(rows)
@@ -0,0 +1,142 @@
+"""Implementação do repositório da fila de notificações para SQLAlchemy."""
+
+from datetime import datetime, timezone
+from typing import Callable, Iterable, List
+from contextlib import AbstractAsyncContextManager
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.entities.edital import Edital
+from src.core.entities.notification import OutboxEntry
+from src.core.repositories.interfaces import INotificationOutboxRepository
+from src.infra.database.dto import select_dto, to_dtos
+from src.infra.database.tables import NotificationOutboxDB
+from src.infra.database.upsert import insert_ignoring_conflicts
+
+PENDING = "pending"
+SENT = "sent"
+FAILED = "failed"
+
+
+def _utcnow() -> datetime:
+    """Horário atual em UTC sem fuso, no mesmo formato de `CURRENT_TIMESTAMP`."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class NotificationOutboxRepository(INotificationOutboxRepository):
+    """Implementação do repositório da fila de notificações para SQLAlchemy."""
+
+    def __init__(
+        self,
+        session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]],
+        chunk_size: int = 500,
+    ):
+        self.session_factory = session_factory
+        self.chunk_size = max(1, chunk_size)
+
+    async def enqueue(
+        self, guild_ids: Iterable[str], editais: List[Edital], kind: str = "post"
+    ) -> int:
+        guild_ids = list(guild_ids)
+        if not guild_ids or not editais:
+            return 0
+        now = _utcnow()
+        entries = [
+            {
+                "guild_id": guild_id,
+                "edital_hash": edital.hash,
+                "title": edital.title,
+                "link": edital.link,
+                "date": edital.date,
+                "kind": kind,
+                "status": PENDING,
+                "attempts": 0,
+                "next_attempt_at": now,
+            }
+            for guild_id in guild_ids
+            for edital in editais
+        ]
+        queued = 0
+        # a restrição (guild_id, edital_hash) descarta o que já foi enfileirado,
+        # inclusive por uma verificação concorrente ou outra instância
+        async with self.session_factory() as session:
+            for start in range(0, len(entries), self.chunk_size):
+                stmt = insert_ignoring_conflicts(
+                    NotificationOutboxDB, session.bind.dialect.name
+                ).values(entries[start:start + self.chunk_size])
+                result = await session.execute(stmt)
+                queued += max(result.rowcount, 0)
+            await session.commit()
+        return queued
+
+    async def get_due(self, limit: int) -> List[OutboxEntry]:
+        async with self.session_factory() as session:
+            return to_dtos(
+                OutboxEntry,
+                await session.execute(
+                    select_dto(OutboxEntry, NotificationOutboxDB)
+                    .where(
+                        NotificationOutboxDB.status == PENDING,
+                        NotificationOutboxDB.next_attempt_at <= _utcnow(),
+                    )
+                    .order_by(NotificationOutboxDB.id)
+                    .limit(limit)
+                ),
+            )
+
+    async def _update(self, entry_ids: Iterable[int], values: dict) -> None:
+        entry_ids = list(entry_ids)
+        if not entry_ids:
+            return
+        async with self.session_factory() as session:
+            await session.execute(
+                update(NotificationOutboxDB)
+                .where(NotificationOutboxDB.id.in_(entry_ids))
+                .values(**values, updated_at=_utcnow())
+            )
+            await session.commit()
+
+    async def mark_sent(self, entry_ids: Iterable[int]) -> None:
+        await self._update(entry_ids, {"status": SENT, "last_error": None})
+
+    async def mark_retry(
+        self, entry_ids: Iterable[int], error: str, next_attempt_at: datetime
+    ) -> None:
+        await self._update(
+            entry_ids,
+            {
+                "attempts": NotificationOutboxDB.attempts + 1,
+                "last_error": error,
+                "next_attempt_at": next_attempt_at,
+            },
+        )
+
+    async def mark_failed(self, entry_ids: Iterable[int], error: str) -> None:
+        await self._update(
+            entry_ids,
+            {
+                "status": FAILED,
+                "attempts": NotificationOutboxDB.attempts + 1,
+                "last_error": error,
+            },
+        )
+
+    async def count_pending(self) -> int:
+        async with self.session_factory() as session:
+            return await session.scalar(
+                select(func.count())
+                .select_from(NotificationOutboxDB)
+                .where(NotificationOutboxDB.status == PENDING)
+            )
+
+    async def purge_finished(self, before: datetime) -> int:
+        async with self.session_factory() as session:
+            result = await session.execute(
+                delete(NotificationOutboxDB).where(
+                    NotificationOutboxDB.status != PENDING,
+                    NotificationOutboxDB.updated_at < before,
+                )
+            )
+            await session.commit()
+            return result.rowcount
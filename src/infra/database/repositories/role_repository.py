@@ -1,22 +1,25 @@
 """Implementação do repositório de cargos para SQLAlchemy."""
 
-from typing import Callable
-from contextlib import AbstractContextManager
+from typing import Callable, List
+from contextlib import AbstractAsyncContextManager
+from sqlalchemy import delete
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.entities.guild import GuildRole
 from src.core.repositories.interfaces import IRoleRepository
+from src.infra.database.dto import select_dto, to_dtos
 from src.infra.database.tables import GuildRoleDB
 
 
 class RoleRepository(IRoleRepository):
     """Implementação do repositório de cargos para SQLAlchemy."""
 
-    def __init__(self, session_factory: Callable[..., AbstractContextManager[Session]]):
+    def __init__(self, session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]]):
         self.session_factory = session_factory
 
-    def add(self, guild_id: str, role_id: str, role_name: str, added_by: str) -> bool:
-        with self.session_factory() as session:
+    async def add(self, guild_id: str, role_id: str, role_name: str, added_by: str) -> bool:
+        async with self.session_factory() as session:
             try:
                 new_role = GuildRoleDB(
                     guild_id=guild_id,
@@ -25,43 +28,52 @@ class RoleRepository(IRoleRepository):
                     added_by=added_by,
                 )
                 session.add(new_role)
-                session.commit()
+                await session.commit()
                 return True
             except SQLAlchemyError:
-                session.rollback()
+                await session.rollback()
                 return False
 
-    def remove(self, guild_id: str, role_id: str) -> bool:
-        with self.session_factory() as session:
+    async def remove(self, guild_id: str, role_id: str) -> bool:
+        async with self.session_factory() as session:
             try:
-                deleted_rows = (
-                    session.query(GuildRoleDB)
-                    .filter_by(guild_id=guild_id, role_id=role_id)
-                    .delete()
+                result = await session.execute(
+                    delete(GuildRoleDB).filter_by(guild_id=guild_id, role_id=role_id)
                 )
-                session.commit()
-                return deleted_rows > 0
+                await session.commit()
+                return result.rowcount > 0
             except SQLAlchemyError:
-                session.rollback()
+                await session.rollback()
                 return False
 
-    def get_all(self, guild_id: str) -> list["GuildRoleDB"]:
-        with self.session_factory() as session:
-            return (
-                session.query(GuildRoleDB)
-                .filter_by(guild_id=guild_id)
-                .order_by(GuildRoleDB.added_at)
-                .all()
+    async def get_all(self, guild_id: str) -> List[GuildRole]:
+        async with self.session_factory() as session:
+            return to_dtos(
+                GuildRole,
+                await session.execute(
+                    select_dto(GuildRole, GuildRoleDB)
+                    .filter_by(guild_id=guild_id)
+                    .order_by(GuildRoleDB.added_at)
+                ),
             )
 
-    def clear(self, guild_id: str) -> int:
-        with self.session_factory() as session:
+    async def get_all_roles(self) -> List[GuildRole]:
+        async with self.session_factory() as session:
+            return to_dtos(
+                GuildRole,
+                await session.execute(
+                    select_dto(GuildRole, GuildRoleDB).order_by(
+                        GuildRoleDB.guild_id, GuildRoleDB.added_at
+                    )
+                ),
+            )
+
+    async def clear(self, guild_id: str) -> int:
+        async with self.session_factory() as session:
             try:
-                deleted_rows = (
-                    session.query(GuildRoleDB).filter_by(guild_id=guild_id).delete()
-                )
-                session.commit()
-                return deleted_rows
+                result = await session.execute(delete(GuildRoleDB).filter_by(guild_id=guild_id))
+                await session.commit()
+                return result.rowcount
             except SQLAlchemyError:
-                session.rollback()
+                await session.rollback()
                 return 0
@@ -5,12 +5,14 @@ from sqlalchemy import (
     Integer,
     String,
     Boolean,
+    Date,
     DateTime,
+    Index,
     UniqueConstraint,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.sql import func
+from sqlalchemy.sql import expression, func
 
 Base = declarative_base()
 
@@ -20,8 +22,11 @@ class EditalDB(Base):
     __tablename__ = "all_editais"
     id = Column(Integer, primary_key=True, autoincrement=True)
     edital_hash = Column(String, nullable=False, unique=True)
+    edital_key = Column(String, index=True)
     title = Column(String, nullable=False)
     link = Column(String, nullable=False)
+    date = Column(String)
+    published_at = Column(Date, index=True)
     posted_at = Column(DateTime, server_default=func.now())
 
 
@@ -31,6 +36,8 @@ class GuildSettingsDB(Base):
     guild_id = Column(String, primary_key=True)
     channel_id = Column(String)
     enabled = Column(Boolean, default=False)
+    batch_notifications = Column(Boolean, nullable=False, server_default=expression.true())
+    __table_args__ = (Index("ix_guild_settings_enabled_channel", "enabled", "channel_id"),)
 
 
 class GuildRoleDB(Base):
@@ -42,7 +49,10 @@ class GuildRoleDB(Base):
     role_name = Column(String, nullable=False)
     added_by = Column(String)
     added_at = Column(DateTime, server_default=func.now())
-    __table_args__ = (UniqueConstraint("guild_id", "role_id", name="_guild_role_uc"),)
+    __table_args__ = (
+        UniqueConstraint("guild_id", "role_id", name="_guild_role_uc"),
+        Index("ix_guild_roles_guild_added", "guild_id", "added_at"),
+    )
 
 
 class LogDB(Base):
@@ -54,6 +64,65 @@ class LogDB(Base):
     details = Column(String)
     user_id = Column(String)
     timestamp = Column(DateTime, server_default=func.now())
+    __table_args__ = (Index("ix_bot_logs_timestamp", "timestamp"),)
+
+
+class LogDailyDB(Base):
+    """Tabela com a contagem diária de logs por servidor e ação, mantida após a limpeza."""
+    __tablename__ = "bot_log_daily"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    day = Column(Date, nullable=False)
+    guild_id = Column(String, nullable=False, server_default="")
+    action = Column(String, nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+    __table_args__ = (UniqueConstraint("day", "guild_id", "action", name="_log_daily_uc"),)
+
+
+class NotificationOutboxDB(Base):
+    """Tabela com as notificações pendentes, uma por (servidor, edital)."""
+    __tablename__ = "notification_outbox"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    guild_id = Column(String, nullable=False)
+    edital_hash = Column(String, nullable=False)
+    title = Column(String, nullable=False)
+    link = Column(String, nullable=False)
+    date = Column(String)
+    kind = Column(String, nullable=False, server_default="post")
+    status = Column(String, nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, server_default=func.now())
+    last_error = Column(String)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    __table_args__ = (
+        UniqueConstraint("guild_id", "edital_hash", name="_outbox_guild_edital_uc"),
+        Index("ix_outbox_status_next_attempt", "status", "next_attempt_at"),
+    )
+
+
+class DeliveryLedgerDB(Base):
+    """Tabela com a mensagem em que cada edital foi postado em cada servidor."""
+    __tablename__ = "delivery_ledger"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    guild_id = Column(String, nullable=False)
+    channel_id = Column(String, nullable=False)
+    message_id = Column(String, nullable=False, index=True)
+    edital_key = Column(String, nullable=False)
+    edital_hash = Column(String, nullable=False)
+    title = Column(String, nullable=False)
+    link = Column(String, nullable=False)
+    date = Column(String)
+    posted_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime)
+    __table_args__ = (UniqueConstraint("guild_id", "edital_key", name="_ledger_guild_key_uc"),)
+
+
+class SchemaMigrationDB(Base):
+    """Tabela com as migrações de esquema já aplicadas."""
+    __tablename__ = "schema_migrations"
+    version = Column(Integer, primary_key=True)
+    description = Column(String, nullable=False)
+    applied_at = Column(DateTime, server_default=func.now())
 
 
 def setup_database(engine):
@@ -0,0 +1,21 @@
+"""Inserções que ignoram linhas duplicadas, conforme o dialeto do banco."""
+
+from sqlalchemy import Insert
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+# Dialetos com inserção sem conflitos; a conexão recusa os demais ao ser criada.
+SUPPORTED_DIALECTS = frozenset({"sqlite", "postgresql", "mysql", "mariadb"})
+
+def insert_ignoring_conflicts(table, dialect_name: str) -> Insert:
+    """
+    Monta um INSERT que descarta as linhas que violariam uma restrição de unicidade.
+
+    SQLite e PostgreSQL usam `ON CONFLICT DO NOTHING`; MySQL usa `INSERT IGNORE`.
+    """
+    if dialect_name == "sqlite":
+        return sqlite.insert(table).on_conflict_do_nothing()
+    if dialect_name == "postgresql":
+        return postgresql.insert(table).on_conflict_do_nothing()
+    if dialect_name in ("mysql", "mariadb"):
+        return mysql.insert(table).prefix_with("IGNORE")
+    raise NotImplementedError(f"Inserção sem conflitos não suportada para o dialeto {dialect_name}.")
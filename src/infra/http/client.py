@@ -0,0 +1,73 @@
+"""Cliente HTTP compartilhado, com pool de conexões ajustado."""
+
+import importlib.util
+import logging
+from typing import Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.36"
+
+# O aiohttp só descomprime brotli se um dos pacotes opcionais estiver instalado.
+HAS_BROTLI = any(importlib.util.find_spec(name) for name in ("brotli", "brotlicffi"))
+ACCEPT_ENCODING = "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate"
+
+
+class HttpClient:
+    """
+    Gerencia a `aiohttp.ClientSession` usada por todos os componentes.
+
+    A sessão é criada sob demanda (dentro do event loop) com um `TCPConnector`
+    configurável: limite de conexões, keep-alive e cache de DNS. Deve ser
+    encerrada com `close()` ao desligar a aplicação.
+    """
+
+    def __init__(
+        self,
+        limit: int = 20,
+        limit_per_host: int = 8,
+        keepalive_timeout: float = 60.0,
+        dns_cache_ttl: int = 300,
+        timeout: float = 30.0,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Retorna a sessão compartilhada, criando-a se necessário."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+                use_dns_cache=True,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"User-Agent": USER_AGENT, "Accept-Encoding": ACCEPT_ENCODING},
+            )
+            logger.info(
+                "Sessão HTTP criada (limite %d, %d por host, keep-alive %.0fs, DNS %ds, %s).",
+                self.limit,
+                self.limit_per_host,
+                self.keepalive_timeout,
+                self.dns_cache_ttl,
+                ACCEPT_ENCODING,
+            )
+        return self._session
+
+    async def close(self):
+        """Encerra a sessão e as conexões abertas."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.info("Sessão HTTP encerrada.")
+        self._session = None
@@ -0,0 +1,158 @@
+"""Agendador adaptativo para a verificação periódica de editais."""
+
+import logging
+import math
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Dict, Iterable, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger(__name__)
+
+# Uma faixa (dia da semana, hora) só é considerada movimentada se houve
+# publicações nela em pelo menos esta quantidade de dias distintos.
+MIN_BUSY_DAYS = 2
+# Fração das publicações históricas que as faixas movimentadas devem cobrir.
+BUSY_COVERAGE = 0.6
+
+
+class PollOutcome(str, Enum):
+    """Resultado de uma verificação, usado para calcular o próximo intervalo."""
+
+    NEW = "new"
+    QUIET = "quiet"
+    ERROR = "error"
+
+
+class AdaptivePollingScheduler:
+    """
+    Calcula o intervalo entre verificações a partir do histórico e dos resultados.
+
+    - Nas faixas de horário em que a UEPA costuma publicar, usa o intervalo mínimo.
+    - Fora delas, cada verificação sem novidades aumenta o intervalo por
+      `backoff_factor`, até `max_minutes`.
+    - Erros consecutivos aumentam o intervalo da mesma forma, mesmo em horário
+      movimentado.
+    - Um intervalo fixo definido por administrador tem prioridade sobre tudo.
+    """
+
+    def __init__(
+        self,
+        base_minutes: float,
+        min_minutes: float,
+        max_minutes: float,
+        backoff_factor: float = 1.5,
+        jitter_ratio: float = 0.1,
+        tz: str = "America/Sao_Paulo",
+    ):
+        self.base_minutes = base_minutes
+        self.min_minutes = min(min_minutes, base_minutes)
+        self.max_minutes = max(max_minutes, base_minutes)
+        self.backoff_factor = backoff_factor
+        self.jitter_ratio = jitter_ratio
+        self.tz = ZoneInfo(tz)
+        self.override_minutes: Optional[float] = None
+        self.current_minutes = base_minutes
+        self._busy_slots: Set[Tuple[int, int]] = set()
+        self._quiet_streak = 0
+        self._error_streak = 0
+        # a partir desta sequência o intervalo já atingiu `max_minutes`; contar
+        # além dela só faria a potência crescer até estourar o float
+        if backoff_factor > 1:
+            self._max_streak = (
+                math.ceil(math.log(self.max_minutes / self.base_minutes, backoff_factor)) + 1
+            )
+        else:
+            self._max_streak = 1
+
+    @property
+    def busy_slots(self) -> Set[Tuple[int, int]]:
+        """Faixas (dia da semana, hora local) consideradas movimentadas."""
+        return set(self._busy_slots)
+
+    def learn(self, posted_at: Iterable[datetime]):
+        """
+        Aprende as faixas de horário movimentadas a partir do histórico.
+
+        Os horários sem fuso são tratados como UTC, que é como o SQLite grava
+        `CURRENT_TIMESTAMP`.
+        """
+        days_by_slot: Dict[Tuple[int, int], Set] = defaultdict(set)
+        for moment in posted_at:
+            if moment is None:
+                continue
+            if moment.tzinfo is None:
+                moment = moment.replace(tzinfo=timezone.utc)
+            local = moment.astimezone(self.tz)
+            days_by_slot[(local.weekday(), local.hour)].add(local.date())
+
+        weights = sorted(
+            ((len(days), slot) for slot, days in days_by_slot.items() if len(days) >= MIN_BUSY_DAYS),
+            reverse=True,
+        )
+        total = sum(weight for weight, _ in weights)
+        busy: Set[Tuple[int, int]] = set()
+        covered = 0
+        for weight, slot in weights:
+            if total and covered / total >= BUSY_COVERAGE:
+                break
+            busy.add(slot)
+            covered += weight
+
+        self._busy_slots = busy
+        logger.info("Agendador aprendeu %d faixas de horário movimentadas.", len(busy))
+
+    def is_busy(self, now: Optional[datetime] = None) -> bool:
+        """Indica se o horário informado (ou o atual) está em uma faixa movimentada."""
+        local = (now or datetime.now(timezone.utc)).astimezone(self.tz)
+        return (local.weekday(), local.hour) in self._busy_slots
+
+    def _minutes_until_busy(self, now: Optional[datetime] = None) -> Optional[float]:
+        """Minutos até o início da próxima faixa movimentada dentro do intervalo máximo."""
+        if not self._busy_slots:
+            return None
+        local = (now or datetime.now(timezone.utc)).astimezone(self.tz)
+        slot_start = local.replace(minute=0, second=0, microsecond=0)
+        horizon = local + timedelta(minutes=self.max_minutes)
+        while slot_start <= horizon:
+            slot_start += timedelta(hours=1)
+            if (slot_start.weekday(), slot_start.hour) in self._busy_slots:
+                return (slot_start - local).total_seconds() / 60
+        return None
+
+    def set_override(self, minutes: Optional[float]) -> float:
+        """Define um intervalo fixo ou, com `None`, volta ao modo adaptativo."""
+        self.override_minutes = minutes
+        self.current_minutes = minutes if minutes else self.base_minutes
+        return self.current_minutes
+
+    def next_interval(self, outcome: PollOutcome, now: Optional[datetime] = None) -> float:
+        """Registra o resultado da verificação e retorna o próximo intervalo, em minutos."""
+        if self.override_minutes:
+            self.current_minutes = self.override_minutes
+            return self.current_minutes
+
+        until_busy = None
+        if outcome is PollOutcome.ERROR:
+            self._error_streak = min(self._error_streak + 1, self._max_streak)
+            minutes = self.base_minutes * self.backoff_factor ** self._error_streak
+        elif outcome is PollOutcome.NEW:
+            self._quiet_streak = 0
+            self._error_streak = 0
+            minutes = self.min_minutes
+        else:
+            self._error_streak = 0
+            self._quiet_streak = min(self._quiet_streak + 1, self._max_streak)
+            if self.is_busy(now):
+                minutes = self.min_minutes
+            else:
+                minutes = self.base_minutes * self.backoff_factor ** (self._quiet_streak - 1)
+                until_busy = self._minutes_until_busy(now)
+
+        minutes *= 1 + random.uniform(-self.jitter_ratio, self.jitter_ratio)
+        if until_busy is not None:
+            minutes = min(minutes, until_busy)
+        self.current_minutes = max(self.min_minutes, min(self.max_minutes, minutes))
+        return self.current_minutes
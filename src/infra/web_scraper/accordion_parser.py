@@ -0,0 +1,188 @@
+"""Parsers para a estrutura de accordion da página de editais da UEPA."""
+
+import hashlib
+import logging
+import re
+from typing import Callable, Dict, List, Optional
+
+import lxml.html
+from bs4 import BeautifulSoup
+from lxml import etree
+from pydantic import HttpUrl, ValidationError
+
+from src.core.entities.edital import Edital
+
+logger = logging.getLogger(__name__)
+
+BASE_URL = "https://www.uepa.br"
+EDITAL_FILES_PATH = "/sites/default/files/editais/"
+EDITAL_NUMBER_RE = re.compile(r"Edital\s*(\d+)-(\d{4})", re.IGNORECASE)
+EDITAL_DATE_RE = re.compile(r"Belém, \d+ de \w+ de \d{4}")
+PAGE_LINK_RE = re.compile(r"[?&](?:amp;)?page=(\d+)")
+
+
+def generate_edital_hash(title: str, link: str) -> str:
+    """Gera um hash MD5 para um edital a partir do título e link."""
+    content = f"{title}:{link}"
+    return hashlib.md5(content.encode()).hexdigest()
+
+
+def find_last_page(html: str) -> int:
+    """Retorna o maior índice de página (base 0) encontrado nos links de paginação."""
+    return max((int(page) for page in PAGE_LINK_RE.findall(html)), default=0)
+
+
+def _resolve_link(title: str, href: Optional[str]) -> Optional[str]:
+    """Retorna o link absoluto do edital, construindo-o pelo título se necessário."""
+    link = href
+    if not link:
+        match = EDITAL_NUMBER_RE.search(title)
+        if match:
+            number, year = match.groups()
+            link = f"{BASE_URL}{EDITAL_FILES_PATH}edital{number}{year}.pdf"
+
+    if not link:
+        logger.warning("Não foi possível encontrar ou construir o link para o edital: %s", title)
+        return None
+
+    if not link.startswith("http"):
+        link = f"{BASE_URL}{link}"
+    return link
+
+
+def _build_edital(title: str, link: str, date: str) -> Optional[Edital]:
+    """Cria a entidade Edital, descartando itens inválidos."""
+    # o hash usa o link como aparece na página, para continuar igual ao dos editais já gravados
+    edital_hash = generate_edital_hash(title, link)
+    try:
+        normalized = str(HttpUrl(link))
+    except ValidationError as e:
+        logger.warning("Erro ao validar dados do edital '%s': %s", title, e)
+        return None
+    # título e link já foram conferidos pelo parser; os demais campos não precisam de validação
+    return Edital.trusted(title=title, link=normalized, date=date, hash=edital_hash)
+
+
+def parse_reference(html: str) -> List[Edital]:
+    """
+    Implementação de referência com BeautifulSoup.
+
+    Faz uma busca CSS no documento inteiro para cada botão do accordion, o que
+    torna o custo quadrático no número de editais. Mantida para comparação.
+    """
+    soup = BeautifulSoup(html, "lxml")
+    editais = []
+
+    for button in soup.select("button.accordion-button"):
+        title = button.get_text(strip=True)
+
+        target_id = button.get("data-bs-target")
+        if isinstance(target_id, list):
+            target_id = target_id[0] if target_id else None
+
+        if not target_id or not isinstance(target_id, str):
+            continue
+
+        body = soup.select_one(target_id)
+        if not body:
+            continue
+
+        href = None
+        link_elem = body.select_one(f"a[href*='{EDITAL_FILES_PATH}']")
+        if link_elem:
+            href_attr = link_elem.get("href")
+            if isinstance(href_attr, list):
+                href = href_attr[0] if href_attr else None
+            else:
+                href = str(href_attr) if href_attr else None
+
+        link = _resolve_link(title, href)
+        if not title or not link:
+            continue
+
+        date = "Data não disponível"
+        date_elem = body.find(string=EDITAL_DATE_RE)
+        if date_elem:
+            date = str(date_elem).strip()
+
+        edital = _build_edital(title, link, date)
+        if edital:
+            editais.append(edital)
+
+    return editais
+
+
+def parse_indexed(html: str) -> List[Edital]:
+    """
+    Parser linear usando lxml diretamente.
+
+    Indexa todos os elementos por id em uma única passada pela árvore e resolve
+    o corpo de cada botão do accordion por consulta ao dicionário.
+    """
+    if not html or not html.strip():
+        return []
+
+    try:
+        root = lxml.html.fromstring(html)
+    except (etree.ParserError, ValueError) as e:
+        logger.error("Falha ao interpretar o HTML da página de editais: %s", e)
+        return []
+
+    elements_by_id: Dict[str, etree._Element] = {}
+    buttons = []
+    for element in root.iter(etree.Element):
+        element_id = element.get("id")
+        if element_id:
+            elements_by_id.setdefault(element_id, element)
+        if element.tag == "button" and "accordion-button" in (element.get("class") or "").split():
+            buttons.append(element)
+
+    editais = []
+    for button in buttons:
+        title = "".join(text.strip() for text in button.itertext() if text.strip())
+
+        target_id = button.get("data-bs-target")
+        if not target_id or not target_id.startswith("#"):
+            continue
+
+        body = elements_by_id.get(target_id[1:])
+        if body is None:
+            continue
+
+        href = None
+        for anchor in body.iter("a"):
+            anchor_href = anchor.get("href")
+            if anchor_href is not None and EDITAL_FILES_PATH in anchor_href:
+                href = anchor_href or None
+                break
+
+        link = _resolve_link(title, href)
+        if not title or not link:
+            continue
+
+        date = "Data não disponível"
+        for text in body.itertext():
+            if EDITAL_DATE_RE.search(text):
+                date = text.strip()
+                break
+
+        edital = _build_edital(title, link, date)
+        if edital:
+            editais.append(edital)
+
+    return editais
+
+
+PARSER_ENGINES: Dict[str, Callable[[str], List[Edital]]] = {
+    "indexed": parse_indexed,
+    "reference": parse_reference,
+}
+
+
+def parse_editais(html: str, engine: str = "indexed") -> List[Edital]:
+    """Extrai os editais do HTML usando o motor de parse indicado."""
+    parser = PARSER_ENGINES.get(engine)
+    if parser is None:
+        logger.warning("Motor de parse '%s' desconhecido, usando 'indexed'.", engine)
+        parser = parse_indexed
+    return parser(html)
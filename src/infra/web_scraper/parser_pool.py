@@ -0,0 +1,107 @@
+"""Pool de workers para executar o parse de HTML fora do event loop."""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional
+
+from src.core.entities.edital import Edital
+from src.infra.web_scraper.accordion_parser import parse_editais
+
+logger = logging.getLogger(__name__)
+
+
+class ParserPoolError(Exception):
+    """Erro ao executar um parse no pool (espera na fila, timeout ou worker quebrado)."""
+
+
+class ParserPool:
+    """
+    Executa o parse de HTML em um pool de threads ou processos.
+
+    A quantidade de parses em andamento é limitada por `max_pending`; pedidos
+    além desse limite aguardam uma vaga por até `timeout` segundos antes de
+    serem recusados. A vaga só é devolvida quando o worker termina, mesmo que
+    quem pediu o parse tenha desistido antes.
+    """
+
+    def __init__(
+        self,
+        kind: str = "thread",
+        max_workers: int = 2,
+        max_pending: int = 4,
+        timeout: float = 30.0,
+    ):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Tipo de pool inválido: {kind}")
+        self.kind = kind
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._slots = asyncio.Semaphore(max_pending)
+        self._executor: Optional[Executor] = None
+        self._closed = False
+
+    def _get_executor(self) -> Executor:
+        """Cria o executor sob demanda."""
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="parser"
+                )
+            logger.info(
+                "Pool de parse iniciado (%s, %d workers).", self.kind, self.max_workers
+            )
+        return self._executor
+
+    async def parse(self, html: str, engine: str) -> List[Edital]:
+        """Executa o parse do HTML no pool, respeitando a fila e o timeout."""
+        if self._closed:
+            raise ParserPoolError("O pool de parse já foi encerrado.")
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.timeout)
+        except asyncio.TimeoutError as e:
+            raise ParserPoolError(
+                f"Nenhuma vaga no pool de parse após {self.timeout:.0f}s de espera."
+            ) from e
+
+        try:
+            future = self._get_executor().submit(parse_editais, html, engine)
+        except BaseException:
+            self._slots.release()
+            raise
+        loop = asyncio.get_running_loop()
+        future.add_done_callback(lambda _: self._release_slot(loop))
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError as e:
+            future.cancel()
+            raise ParserPoolError(
+                f"Parse excedeu o tempo limite de {self.timeout:.0f}s."
+            ) from e
+        except BrokenProcessPool as e:
+            self._executor = None
+            raise ParserPoolError("Worker do pool de parse encerrado inesperadamente.") from e
+
+    def _release_slot(self, loop: asyncio.AbstractEventLoop):
+        """Devolve a vaga a partir da thread do worker, pelo event loop do pedido."""
+        try:
+            loop.call_soon_threadsafe(self._slots.release)
+        except RuntimeError:
+            # o loop já foi encerrado: não há mais quem aguarde uma vaga
+            pass
+
+    def shutdown(self):
+        """Encerra o pool, cancelando os parses que ainda não começaram."""
+        self._closed = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            logger.info("Pool de parse encerrado.")
@@ -0,0 +1,251 @@
+"""Camada de requisições HTTP resiliente: retentativas, circuit breaker e hedging."""
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Mapping, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(aiohttp.ClientError):
+    """Requisição recusada porque o circuit breaker da fonte está aberto."""
+
+
+@dataclass
+class FetchResponse:
+    """Resposta HTTP já lida por completo."""
+
+    status: int
+    headers: Mapping[str, str]
+    body: bytes
+    encoding: str
+
+    def text(self) -> str:
+        """Decodifica o corpo da resposta."""
+        return self.body.decode(self.encoding, errors="replace")
+
+
+@dataclass
+class FetchStats:
+    """Métricas da camada de requisições de uma fonte."""
+
+    requests: int = 0
+    attempts: int = 0
+    retries: int = 0
+    failures: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    short_circuited: int = 0
+    circuit_opens: int = 0
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker simples com os estados fechado, aberto e meio-aberto.
+
+    Após `failure_threshold` falhas consecutivas o circuito abre e recusa
+    requisições por `reset_timeout` segundos; em seguida deixa passar uma
+    requisição de teste, que fecha o circuito em caso de sucesso.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 3, reset_timeout: float = 300.0):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    def allow(self) -> bool:
+        """Indica se uma requisição pode ser feita agora."""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self._set_state(self.HALF_OPEN)
+        if self._trial_in_flight:
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def record_success(self):
+        """Registra uma requisição bem-sucedida."""
+        self._failures = 0
+        self._trial_in_flight = False
+        if self.state != self.CLOSED:
+            self._set_state(self.CLOSED)
+
+    def release_trial(self):
+        """Libera a requisição de teste quando ela é cancelada sem resultado."""
+        self._trial_in_flight = False
+
+    def record_failure(self) -> bool:
+        """Registra uma falha e retorna se o circuito abriu por causa dela."""
+        self._failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or (
+            self.state == self.CLOSED and self._failures >= self.failure_threshold
+        ):
+            self._opened_at = time.monotonic()
+            self._set_state(self.OPEN)
+            return True
+        return False
+
+    def _set_state(self, state: str):
+        """Altera o estado e registra a transição no log."""
+        previous, self.state = self.state, state
+        log = logger.warning if state == self.OPEN else logger.info
+        log("Circuit breaker '%s': %s -> %s.", self.name, previous, state)
+
+
+class ResilientFetcher:
+    """
+    Faz requisições GET com retentativas, circuit breaker e hedging opcional.
+
+    - Erros de rede, timeouts e respostas 429/5xx são repetidos até
+      `max_retries` vezes, com backoff exponencial e jitter (respeitando
+      `Retry-After` quando presente).
+    - Se `hedge_delay` for definido e a primeira tentativa demorar mais que
+      isso, uma segunda requisição idêntica é disparada e vence a que
+      terminar primeiro.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        name: str,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        hedge_delay: Optional[float] = None,
+        failure_threshold: int = 3,
+        reset_timeout: float = 300.0,
+    ):
+        self.session = session
+        self.name = name
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.hedge_delay = hedge_delay or None
+        self.breaker = CircuitBreaker(name, failure_threshold, reset_timeout)
+        self.stats = FetchStats()
+
+    async def get(self, url: str, headers: Optional[Mapping[str, str]] = None) -> FetchResponse:
+        """Executa um GET resiliente e retorna a resposta lida."""
+        if not self.breaker.allow():
+            self.stats.short_circuited += 1
+            raise CircuitOpenError(f"Circuito aberto para a fonte '{self.name}'.")
+
+        self.stats.requests += 1
+        attempt = 0
+        while True:
+            try:
+                response = await self._hedged_attempt(url, headers)
+            except asyncio.CancelledError:
+                self.breaker.release_trial()
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if not self._is_retryable(e) or attempt >= self.max_retries:
+                    self._record_failure(e)
+                    raise
+                delay = self._backoff(attempt, e)
+                attempt += 1
+                self.stats.retries += 1
+                logger.warning(
+                    "Falha ao acessar %s (%s). Retentativa %d/%d em %.1fs.",
+                    url,
+                    e.__class__.__name__,
+                    attempt,
+                    self.max_retries,
+                    delay,
+                )
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    self.breaker.release_trial()
+                    raise
+                continue
+
+            self.breaker.record_success()
+            return response
+
+    def _record_failure(self, error: BaseException):
+        """Contabiliza uma falha definitiva; erros 4xx não indicam indisponibilidade."""
+        if isinstance(error, aiohttp.ClientResponseError) and error.status not in RETRYABLE_STATUSES:
+            self.breaker.record_success()
+            return
+        self.stats.failures += 1
+        if self.breaker.record_failure():
+            self.stats.circuit_opens += 1
+
+    @staticmethod
+    def _is_retryable(error: BaseException) -> bool:
+        """Indica se o erro justifica uma nova tentativa."""
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status in RETRYABLE_STATUSES
+        return True
+
+    def _backoff(self, attempt: int, error: BaseException) -> float:
+        """Calcula a espera antes da próxima tentativa (full jitter)."""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        if isinstance(error, aiohttp.ClientResponseError) and error.headers:
+            retry_after = error.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+        return min(delay, self.backoff_max)
+
+    async def _attempt(self, url: str, headers: Optional[Mapping[str, str]]) -> FetchResponse:
+        """Executa uma única requisição."""
+        self.stats.attempts += 1
+        async with self.session.get(url, timeout=self.timeout, headers=headers) as response:
+            response.raise_for_status()
+            body = await response.read()
+            return FetchResponse(
+                status=response.status,
+                headers=response.headers.copy(),
+                body=body,
+                encoding=response.get_encoding(),
+            )
+
+    async def _hedged_attempt(self, url: str, headers: Optional[Mapping[str, str]]) -> FetchResponse:
+        """Executa uma tentativa, disparando uma requisição extra se a primeira demorar."""
+        if not self.hedge_delay:
+            return await self._attempt(url, headers)
+
+        primary = asyncio.create_task(self._attempt(url, headers))
+        done, _ = await asyncio.wait({primary}, timeout=self.hedge_delay)
+        if done:
+            return primary.result()
+
+        self.stats.hedges += 1
+        logger.debug("Requisição a %s lenta; disparando requisição extra.", url)
+        hedge = asyncio.create_task(self._attempt(url, headers))
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.stats.hedge_wins += 1
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,82 @@
+"""Cache compartilhado de resultados de scraping com coalescência de requisições."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from src.core.entities.edital import Edital
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    """Contadores de uso do cache."""
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+
+
+class ScrapeCache:
+    """
+    Guarda o último resultado de cada fonte por `ttl_seconds` (single-flight).
+
+    Chamadas simultâneas para a mesma fonte compartilham uma única requisição
+    em andamento. Resultados vazios, que indicam falha no scraper, não são
+    armazenados.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._entries: Dict[str, Tuple[float, List[Edital]]] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def _fresh(self, key: str) -> Optional[List[Edital]]:
+        """Retorna o valor em cache se ainda estiver dentro do TTL."""
+        entry = self._entries.get(key)
+        if entry and time.monotonic() - entry[0] < self.ttl_seconds:
+            return entry[1]
+        return None
+
+    def _on_done(self, key: str, task: asyncio.Future):
+        """Armazena o resultado da requisição e libera a chave."""
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        value = task.result()
+        if value:
+            self._entries[key] = (time.monotonic(), value)
+
+    async def get(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[List[Edital]]],
+        force: bool = False,
+    ) -> List[Edital]:
+        """
+        Retorna o resultado da fonte, usando o cache ou uma requisição em andamento.
+
+        Com `force=True`, ignora o valor em cache e faz (ou aguarda) uma nova
+        busca, que atualiza o cache para as próximas chamadas.
+        """
+        if not force:
+            cached = self._fresh(key)
+            if cached is not None:
+                self.stats.hits += 1
+                return list(cached)
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats.coalesced += 1
+        else:
+            self.stats.misses += 1
+            task = asyncio.ensure_future(loader())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._on_done(key, done))
+
+        # shield: cancelar quem aguarda não cancela a busca compartilhada
+        return list(await asyncio.shield(task))
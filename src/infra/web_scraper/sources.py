@@ -0,0 +1,217 @@
+"""Registro das fontes de editais monitoradas pelo bot."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Collection, Dict, Iterable, List, Mapping, Optional
+
+import aiohttp
+
+from src.config import settings
+from src.core.entities.edital import Edital
+from src.infra.web_scraper.parser_pool import ParserPool
+from src.infra.web_scraper.scrape_cache import ScrapeCache
+from src.infra.web_scraper.uepa_scraper import UepaScraper
+
+logger = logging.getLogger(__name__)
+
+# Folga para que uma fonte com intervalo próprio não perca um ciclo por poucos segundos.
+SCHEDULE_SLACK_SECONDS = 5.0
+
+
+@dataclass
+class SourceStats:
+    """Métricas de latência e erros de uma fonte."""
+
+    fetches: int = 0
+    errors: int = 0
+    last_latency: float = 0.0
+    total_latency: float = 0.0
+    last_error: Optional[str] = None
+    last_success_at: Optional[float] = None
+
+    @property
+    def avg_latency(self) -> float:
+        """Latência média das buscas, em segundos."""
+        return self.total_latency / self.fetches if self.fetches else 0.0
+
+
+@dataclass
+class EditalSource:
+    """
+    Uma página de listagem de editais com seu scraper.
+
+    Sem `interval_minutes`, a fonte é consultada em toda verificação, no ritmo
+    do agendador; com ele, o intervalo funciona como espaçamento mínimo.
+    `baselined` indica que a fonte já teve uma consulta bem-sucedida, cujos
+    editais foram registrados sem notificação.
+    """
+
+    name: str
+    scraper: UepaScraper
+    interval_minutes: Optional[int] = None
+    stats: SourceStats = field(default_factory=SourceStats)
+    next_due: float = 0.0
+    baselined: bool = False
+
+    def is_due(self, now: float) -> bool:
+        """Indica se a fonte deve ser consultada no ciclo atual."""
+        return self.interval_minutes is None or now >= self.next_due
+
+
+class SourceRegistry:
+    """
+    Mantém as fontes de editais e as consulta em paralelo.
+
+    Sem `EDITAIS_SOURCES` configurado, registra apenas a listagem principal
+    (`UEPA_EDITAIS_URL`), consultada em toda verificação. Os resultados passam
+    pelo `ScrapeCache`, de modo que comandos interativos reaproveitam a última
+    verificação em vez de baixar a página novamente.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        parser_pool: ParserPool,
+        cache: ScrapeCache,
+        sources: Optional[Iterable[Mapping[str, Any]]] = None,
+    ):
+        self.session = session
+        self.parser_pool = parser_pool
+        self.cache = cache
+        self._sources: Dict[str, EditalSource] = {}
+        self.last_round_failed = False
+        self.last_baseline: List[Edital] = []
+
+        for source in sources or []:
+            self.register(**dict(source))
+        if not self._sources:
+            self.register(name="editais", url=settings.UEPA_EDITAIS_URL)
+
+    def register(
+        self,
+        name: str,
+        url: str,
+        parser: str = "indexed",
+        interval_minutes: Optional[int] = None,
+    ) -> EditalSource:
+        """Registra uma nova fonte de editais."""
+        if name in self._sources:
+            raise ValueError(f"Fonte de editais duplicada: {name}")
+        scraper = UepaScraper(self.session, self.parser_pool, url=url, parser_engine=parser)
+        source = EditalSource(name=name, scraper=scraper, interval_minutes=interval_minutes)
+        self._sources[name] = source
+        logger.info(
+            "Fonte de editais '%s' registrada (%s, intervalo: %s).",
+            name,
+            url,
+            f"{interval_minutes} min" if interval_minutes else "agendador",
+        )
+        return source
+
+    @property
+    def sources(self) -> List[EditalSource]:
+        """Fontes registradas, na ordem de registro."""
+        return list(self._sources.values())
+
+    async def _fetch_source(
+        self, source: EditalSource, known_hashes: Optional[Collection[str]], force: bool
+    ) -> List[Edital]:
+        """Consulta uma fonte pelo cache compartilhado."""
+        return await self.cache.get(
+            source.name, lambda: self._load_source(source, known_hashes), force=force
+        )
+
+    async def _load_source(
+        self, source: EditalSource, known_hashes: Optional[Collection[str]]
+    ) -> List[Edital]:
+        """Consulta uma fonte no site e atualiza suas métricas."""
+        start = time.perf_counter()
+        editais = await source.scraper.fetch_editais(known_hashes)
+        latency = time.perf_counter() - start
+
+        stats = source.stats
+        stats.fetches += 1
+        stats.last_latency = latency
+        stats.total_latency += latency
+        stats.last_error = source.scraper.last_error
+        if stats.last_error:
+            stats.errors += 1
+        else:
+            stats.last_success_at = time.time()
+        logger.debug(
+            "Fonte '%s': %d editais em %.2fs (erros: %d).",
+            source.name,
+            len(editais),
+            latency,
+            stats.errors,
+        )
+        return editais
+
+    @staticmethod
+    def _merge(results: Iterable[List[Edital]]) -> List[Edital]:
+        """Une os resultados das fontes removendo editais repetidos."""
+        merged: Dict[str, Edital] = {}
+        for editais in results:
+            for edital in editais:
+                merged.setdefault(edital.hash, edital)
+        return list(merged.values())
+
+    async def fetch_due(self, known_hashes: Optional[Collection[str]] = None) -> List[Edital]:
+        """
+        Consulta em paralelo as fontes cujo intervalo venceu, renovando o cache.
+
+        Os editais que vieram apenas de fontes consultadas com sucesso pela
+        primeira vez ficam em `last_baseline`: servem de linha de base da
+        fonte e não devem ser notificados.
+        """
+        now = time.monotonic()
+        due = [source for source in self._sources.values() if source.is_due(now)]
+        for source in due:
+            if source.interval_minutes:
+                source.next_due = now + source.interval_minutes * 60 - SCHEDULE_SLACK_SECONDS
+        results = await asyncio.gather(
+            *(self._fetch_source(s, known_hashes, force=True) for s in due)
+        )
+        self.last_round_failed = bool(due) and all(s.stats.last_error for s in due)
+
+        baseline: List[List[Edital]] = []
+        regular: List[List[Edital]] = []
+        for source, editais in zip(due, results):
+            if source.baselined:
+                regular.append(editais)
+            elif editais:
+                source.baselined = True
+                baseline.append(editais)
+                logger.info(
+                    "Primeira consulta da fonte '%s': %d editais como linha de base.",
+                    source.name,
+                    len(editais),
+                )
+        # um edital que também veio de uma fonte já acompanhada é novidade real
+        regular_hashes = {edital.hash for editais in regular for edital in editais}
+        self.last_baseline = [
+            edital for edital in self._merge(baseline) if edital.hash not in regular_hashes
+        ]
+        return self._merge(results)
+
+    def reset_baseline(self):
+        """Faz cada fonte voltar a registrar sua próxima consulta sem notificar."""
+        for source in self._sources.values():
+            source.baselined = False
+
+    async def fetch_all(self, known_hashes: Optional[Collection[str]] = None) -> List[Edital]:
+        """
+        Retorna os editais de todas as fontes, do cache quando possível.
+
+        `known_hashes` interrompe o crawl paginado na primeira página já
+        conhecida, como nas verificações periódicas.
+        """
+        results = await asyncio.gather(
+            *(
+                self._fetch_source(source, known_hashes, force=False)
+                for source in self._sources.values()
+            )
+        )
+        return self._merge(results)
@@ -2,123 +2,248 @@
 
 import hashlib
 import logging
-import re
-from typing import List
+import asyncio
+from dataclasses import dataclass
+from typing import Collection, List, Optional, Tuple
 
 import aiohttp
-from bs4 import BeautifulSoup
-from pydantic import ValidationError, HttpUrl
-
+from yarl import URL
 
 from src.config import settings
 from src.core.entities.edital import Edital
+from src.infra.web_scraper.accordion_parser import find_last_page, generate_edital_hash
+from src.infra.web_scraper.parser_pool import ParserPool, ParserPoolError
+from src.infra.web_scraper.resilience import ResilientFetcher
 
 logger = logging.getLogger(__name__)
 
 
+def build_page_url(base_url: str, page: int) -> str:
+    """
+    Monta a URL de uma página da listagem (base 0).
+
+    Se a URL base contiver `{page}`, o índice é inserido nela; caso contrário,
+    usa o parâmetro `?page=N` da paginação do site.
+    """
+    if "{page}" in base_url:
+        return base_url.format(page=page)
+    if page == 0:
+        return base_url
+    return str(URL(base_url).update_query(page=page))
+
+
+@dataclass
+class ScraperStats:
+    """Contadores de requisições e parses do scraper."""
+
+    full_parses: int = 0
+    skipped_parses: int = 0
+    not_modified: int = 0
+    bytes_downloaded: int = 0
+    bytes_saved: int = 0
+
+
 class UepaScraper:
     """Responsável por buscar e processar editais do site da UEPA."""
 
-    def __init__(self, session: aiohttp.ClientSession):
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        parser_pool: ParserPool,
+        url: Optional[str] = None,
+        parser_engine: Optional[str] = None,
+        fetcher: Optional[ResilientFetcher] = None,
+    ):
         self.session = session
-        self.url = settings.UEPA_EDITAIS_URL
+        self.parser_pool = parser_pool
+        self.url = url or settings.UEPA_EDITAIS_URL
+        self.fetcher = fetcher or ResilientFetcher(
+            session,
+            name=self.url,
+            timeout=settings.HTTP_TIMEOUT_SECONDS,
+            max_retries=settings.HTTP_MAX_RETRIES,
+            backoff_base=settings.HTTP_BACKOFF_BASE_SECONDS,
+            backoff_max=settings.HTTP_BACKOFF_MAX_SECONDS,
+            hedge_delay=settings.HTTP_HEDGE_DELAY_SECONDS,
+            failure_threshold=settings.CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=settings.CIRCUIT_RESET_SECONDS,
+        )
+        self.parser_engine = parser_engine or settings.SCRAPER_PARSER_ENGINE
+        self.max_pages = max(1, settings.SCRAPER_MAX_PAGES)
+        self.page_concurrency = max(1, settings.SCRAPER_PAGE_CONCURRENCY)
+        self.stats = ScraperStats()
+        self.last_error: Optional[str] = None
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._fingerprint: Optional[str] = None
+        self._last_body_size = 0
+        self._cached_editais: List[Edital] = []
 
     @staticmethod
     def _generate_edital_hash(title: str, link: str) -> str:
         """Gera um hash MD5 para um edital a partir do título e link."""
-        content = f"{title}:{link}"
-        return hashlib.md5(content.encode()).hexdigest()
-
-    async def fetch_editais(self) -> List[Edital]:
+        return generate_edital_hash(title, link)
+
+    def _conditional_headers(self) -> dict:
+        """Monta os cabeçalhos de GET condicional a partir dos validadores salvos."""
+        headers = {}
+        if self._cached_editais:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+        return headers
+
+    def _save_validators(self, headers):
+        """Guarda o ETag e o Last-Modified da resposta para o próximo GET condicional."""
+        self._etag = headers.get("ETag")
+        self._last_modified = headers.get("Last-Modified")
+
+    def _skip_parse(self) -> List[Edital]:
+        """Registra um parse evitado e retorna os editais em cache."""
+        self.stats.skipped_parses += 1
+        self.last_error = None
+        logger.info(
+            "Página de editais inalterada, parse evitado (%d evitados, %d completos, %d bytes economizados).",
+            self.stats.skipped_parses,
+            self.stats.full_parses,
+            self.stats.bytes_saved,
+        )
+        return list(self._cached_editais)
+
+    async def fetch_editais(self, known_hashes: Optional[Collection[str]] = None) -> List[Edital]:
         """
         Busca os editais mais recentes do site da UEPA.
 
+        Usa GET condicional (ETag/Last-Modified) e uma impressão digital do
+        corpo da resposta para evitar o parse quando a página não mudou. Se
+        `SCRAPER_MAX_PAGES` for maior que 1, segue a paginação até encontrar
+        uma página composta apenas por editais já conhecidos.
+
+        Args:
+            known_hashes: Hashes de editais já vistos, usados para parar o crawl.
+
         Returns:
             Uma lista de objetos Edital.
         """
         try:
-            timeout = aiohttp.ClientTimeout(total=30)
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.36"
-            }
-            async with self.session.get(self.url, timeout=timeout, headers=headers) as response:
-                response.raise_for_status()
-                html = await response.text()
-                return self._parse_html(html)
-        except aiohttp.ClientError as e:
-            logger.error("Erro de HTTP ao acessar o site da UEPA: %s", e)
+            response = await self.fetcher.get(
+                build_page_url(self.url, 0), self._conditional_headers()
+            )
+            if response.status == 304:
+                self.stats.not_modified += 1
+                self.stats.bytes_saved += self._last_body_size
+                return self._skip_parse()
+
+            body = response.body
+            self.stats.bytes_downloaded += len(body)
+            html = response.text()
+
+            fingerprint = hashlib.sha256(body).hexdigest()
+            if fingerprint == self._fingerprint and self._cached_editais:
+                self._save_validators(response.headers)
+                return self._skip_parse()
+
+            editais = await self._parse_html(html)
+            self.stats.full_parses += 1
+            complete = True
+            if editais and self.max_pages > 1:
+                editais, complete = await self._crawl_next_pages(
+                    html, editais, known_hashes or ()
+                )
+            # os validadores só acompanham um resultado completo: se o parse ou
+            # o crawl falharem, a próxima consulta precisa baixar a página de novo
+            if editais and complete:
+                self._save_validators(response.headers)
+                self._last_body_size = len(body)
+                self._fingerprint = fingerprint
+                self._cached_editais = editais
+            self.last_error = None
+            return editais
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("Erro de HTTP ao acessar %s: %s", self.url, e)
+            self.last_error = str(e) or type(e).__name__
+        except ParserPoolError as e:
+            logger.error("Erro ao processar a página de editais: %s", e)
+            self.last_error = str(e)
         except IOError as e:
             logger.error("Erro inesperado ao buscar editais: %s", e)
+            self.last_error = str(e) or type(e).__name__
         return []
 
-    def _parse_html(self, html: str) -> List[Edital]:
-        """Extrai informações dos editais do HTML."""
-        soup = BeautifulSoup(html, "lxml")
-        editais = []
-
-        accordion_buttons = soup.select("button.accordion-button")
-
-        for button in accordion_buttons:
-            title = button.get_text(strip=True)
-
-            target_id_attr = button.get("data-bs-target")
-            if not target_id_attr:
-                continue
-
-            target_id = target_id_attr
-            if isinstance(target_id_attr, list):
-                target_id = target_id_attr[0] if target_id_attr else None
-
-            if not target_id or not isinstance(target_id, str):
-                continue
-
-            body = soup.select_one(target_id)
-            if not body:
-                continue
-
-            link_elem = body.select_one("a[href*='/sites/default/files/editais/']")
-            link = None
-            if link_elem:
-                href = link_elem.get("href")
-                if isinstance(href, list):
-                    link = href[0] if href else None
-                else:
-                    link = str(href) if href else None
-
-            if not link:
-                match = re.search(r'Edital\s*(\d+)-(\d{4})', title, re.IGNORECASE)
-                if match:
-                    number, year = match.groups()
-                    link = f"https://www.uepa.br/sites/default/files/editais/edital{number}{year}.pdf"
-
-            if not link:
-                logger.warning("Não foi possível encontrar ou construir o link para o edital: %s", title)
-                continue
-
-            if not link.startswith("http"):
-                link = f"https://www.uepa.br{link}"
-
-            date = "Data não disponível"
-            date_elem = body.find(string=re.compile(r'Belém, \d+ de \w+ de \d{4}'))
-            if date_elem:
-                date = str(date_elem).strip()
+    async def fetch_page(self, page: int) -> str:
+        """Baixa o HTML de uma página da listagem, sem cache."""
+        response = await self.fetcher.get(build_page_url(self.url, page))
+        self.stats.bytes_downloaded += len(response.body)
+        return response.text()
+
+    async def fetch_page_editais(self, page: int) -> List[Edital]:
+        """Baixa e processa uma página da listagem."""
+        html = await self.fetch_page(page)
+        editais = await self._parse_html(html)
+        self.stats.full_parses += 1
+        return editais
+
+    async def _load_page(self, page: int, semaphore: asyncio.Semaphore) -> List[Edital]:
+        """Processa uma página respeitando o limite de concorrência."""
+        async with semaphore:
+            return await self.fetch_page_editais(page)
+
+    async def _crawl_next_pages(
+        self, first_html: str, editais: List[Edital], known_hashes: Collection[str]
+    ) -> Tuple[List[Edital], bool]:
+        """
+        Segue a paginação a partir da segunda página, buscando páginas em paralelo.
 
-            if title and link:
-                edital_hash = self._generate_edital_hash(title, link)
+        Para na primeira página vazia, com erro ou composta apenas por hashes
+        conhecidos; as páginas seguintes ainda pendentes são canceladas.
+        Retorna os editais e se o crawl terminou sem erro.
+        """
+        if all(edital.hash in known_hashes for edital in editais):
+            return editais, True
+
+        last_page = min(find_last_page(first_html), self.max_pages - 1)
+        if last_page < 1:
+            return editais, True
+
+        merged = list(editais)
+        seen = {edital.hash for edital in merged}
+        semaphore = asyncio.Semaphore(self.page_concurrency)
+        pages = range(1, last_page + 1)
+        tasks = [asyncio.create_task(self._load_page(page, semaphore)) for page in pages]
+        complete = True
+        try:
+            for page, task in zip(pages, tasks):
                 try:
-                    editais.append(
-                        Edital(
-                            title=title,
-                            link=HttpUrl(link),
-                            date=date,
-                            hash=edital_hash
-                        )
-                    )
-                except ValidationError as e:
-                    logger.warning("Erro ao validar dados do edital '%s': %s", title, e)
+                    page_editais = await task
+                except (aiohttp.ClientError, asyncio.TimeoutError, ParserPoolError) as e:
+                    logger.warning("Crawl interrompido na página %d: %s", page, e)
+                    complete = False
+                    break
+
+                if not page_editais:
+                    break
+                merged.extend(edital for edital in page_editais if edital.hash not in seen)
+                seen.update(edital.hash for edital in page_editais)
+                if all(edital.hash in known_hashes for edital in page_editais):
+                    logger.debug("Página %d contém apenas editais conhecidos.", page)
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        logger.info(
+            "Crawl paginado concluído: %d editais em até %d páginas.", len(merged), page + 1
+        )
+        return merged, complete
+
+    async def _parse_html(self, html: str) -> List[Edital]:
+        """Extrai informações dos editais do HTML no pool de parse."""
+        editais = await self.parser_pool.parse(html, self.parser_engine)
 
         if not editais:
             logger.warning("Nenhum edital encontrado com a estrutura de accordion. A estrutura do site pode ter mudado ou requer JavaScript.")
 
         logger.info("Total de %s editais parseados com sucesso.", len(editais))
-        return editais[:20]
+        return editais
@@ -5,20 +5,35 @@ from __future__ import annotations
 import asyncio
 import logging
 import typing
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import discord
 from discord.ext import commands, tasks
 
 from src.config import settings
-from src.core.entities.edital import Edital
+from src.core.entities.edital import Edital, normalize_edital_link
+from src.core.entities.notification import LedgerEntry, OutboxEntry
 from src.core.repositories.interfaces import (
     IAllEditaisRepository,
-    IGuildSettingsRepository,
+    IDeliveryLedgerRepository,
     ILogRepository,
-    IRoleRepository,
+    INotificationOutboxRepository,
+)
+from src.infra.cache.guild_settings_cache import CachedGuildSettings, GuildSettingsCache
+from src.infra.cache.known_hash_index import (
+    KnownHashIndex,
+    load_known_hashes,
+    save_known_hashes,
+)
+from src.infra.database.log_retention import LogRetentionJob
+from src.infra.scheduling.polling_scheduler import AdaptivePollingScheduler, PollOutcome
+from src.infra.web_scraper.sources import SourceRegistry
+from src.presentation.discord.delivery import (
+    DeliveryJob,
+    DeliveryMessage,
+    DeliveryScheduler,
+    chunk_embeds,
 )
-from src.infra.web_scraper.uepa_scraper import UepaScraper
 
 if typing.TYPE_CHECKING:
     from src.containers import Container
@@ -36,38 +51,90 @@ class UEPABot(commands.Bot):
         super().__init__(command_prefix="!", intents=intents, help_command=None)
         
         self.container: Container | None = None
-        self.guild_repo: IGuildSettingsRepository | None = None
+        self.guild_cache: GuildSettingsCache | None = None
         self.all_editais_repo: IAllEditaisRepository | None = None
-        self.role_repo: IRoleRepository | None = None
         self.log_repo: ILogRepository | None = None
-        self.scraper: UepaScraper | None = None
-        self.known_edital_hashes: set = set()
-        self.is_first_check = True
-
-    def populate_known_hashes(self):
+        self.sources: SourceRegistry | None = None
+        self.scheduler: AdaptivePollingScheduler | None = None
+        self.outbox_repo: INotificationOutboxRepository | None = None
+        self.ledger_repo: IDeliveryLedgerRepository | None = None
+        self.delivery = DeliveryScheduler()
+        self.log_retention: LogRetentionJob | None = None
+        self._outbox_lock = asyncio.Lock()
+        self._drain_task: asyncio.Task | None = None
+        self.known_edital_hashes = KnownHashIndex()
+
+    async def populate_known_hashes(self):
         """Popula o cache de hashes conhecidos a partir do banco de dados."""
         if not self.all_editais_repo:
             logger.error("Repositório de editais não inicializado.")
             return
-        self.known_edital_hashes = self.all_editais_repo.get_all_hashes()
+        filled = await self.all_editais_repo.fill_missing_keys()
+        if filled:
+            logger.info("Identidade calculada para %d editais antigos.", filled)
+        self.known_edital_hashes = await load_known_hashes(
+            self.all_editais_repo, settings.KNOWN_HASHES_SNAPSHOT_PATH
+        )
         logger.info(
             "Cache populado com %d hashes de editais conhecidos.",
             len(self.known_edital_hashes),
         )
 
+    async def close(self):
+        """Grava o snapshot dos hashes conhecidos antes de desconectar."""
+        if self.all_editais_repo:
+            try:
+                await save_known_hashes(
+                    self.known_edital_hashes,
+                    self.all_editais_repo,
+                    settings.KNOWN_HASHES_SNAPSHOT_PATH,
+                )
+            except Exception as e:
+                logger.error("Erro ao gravar o snapshot de hashes: %s", e, exc_info=True)
+        await super().close()
+
+    async def learn_publication_windows(self):
+        """Atualiza as faixas de horário movimentadas do agendador com o histórico."""
+        if not self.scheduler or not self.all_editais_repo:
+            return
+        since = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+            days=settings.POLL_HISTORY_DAYS
+        )
+        self.scheduler.learn(await self.all_editais_repo.get_posted_at_since(since))
+
+    def set_check_interval(self, minutes: float | None) -> float:
+        """Define um intervalo fixo de verificação (ou volta ao adaptativo com None)."""
+        if not self.scheduler:
+            raise RuntimeError("Agendador não inicializado.")
+        interval = self.scheduler.set_override(minutes)
+        self.check_editais_task.change_interval(minutes=interval)
+        if self.sources:
+            self.sources.cache.ttl_seconds = interval * 60
+        return interval
+
     async def setup_hook(self):
         """Executado quando o bot é configurado."""
         if self.container:
-            self.guild_repo = self.container.guild_settings_repo()
+            self.guild_cache = self.container.guild_cache()
             self.all_editais_repo = self.container.all_editais_repo()
-            self.role_repo = self.container.role_repo()
             self.log_repo = self.container.log_repo()
-            self.scraper = self.container.uepa_scraper()
+            self.outbox_repo = self.container.notification_outbox_repo()
+            self.ledger_repo = self.container.delivery_ledger_repo()
+            self.sources = self.container.source_registry()
+            self.scheduler = self.container.polling_scheduler()
+            self.delivery = self.container.delivery_scheduler()
+            self.log_retention = self.container.log_retention()
 
         logger.info("Iniciando setup do bot...")
         await self.load_cogs()
-        self.populate_known_hashes()
+        if self.guild_cache:
+            await self.guild_cache.load()
+        await self.populate_known_hashes()
+        await self.learn_publication_windows()
         self.check_editais_task.start()
+        self.deliver_outbox_task.start()
+        if self.log_retention:
+            self.log_retention_task.start()
         logger.info("Bot configurado e tarefas iniciadas.")
 
     async def load_cogs(self):
@@ -90,38 +157,72 @@ class UEPABot(commands.Bot):
         if self.user:
             logger.info("Bot online como %s (ID: %s)", self.user.name, self.user.id)
         logger.info("Conectado a %d servidores.", len(self.guilds))
+        if self.guild_cache:
+            for guild in self.guilds:
+                self.guild_cache.mark_roles_present(
+                    str(guild.id), (str(role.id) for role in guild.roles)
+                )
         await self.tree.sync()
 
     async def on_guild_join(self, guild: discord.Guild):
         """Registra o servidor quando o bot entra."""
         logger.info("Bot adicionado ao servidor: %s (ID: %s)", guild.name, guild.id)
-        if self.guild_repo and self.log_repo:
-            self.guild_repo.set(str(guild.id), {"enabled": False})
-            self.log_repo.add(
+        if self.guild_cache and self.log_repo:
+            await self.guild_cache.set(str(guild.id), {"enabled": False})
+            await self.log_repo.add(
                 str(guild.id), "bot_joined", "Bot adicionado ao servidor " + guild.name
             )
 
     async def on_guild_remove(self, guild: discord.Guild):
         """Log quando o bot é removido de um servidor."""
         logger.info("Bot removido do servidor: %s (ID: %s)", guild.name, guild.id)
+        if self.guild_cache:
+            self.guild_cache.invalidate(str(guild.id))
         if self.log_repo:
-            self.log_repo.add(
+            await self.log_repo.add(
                 str(guild.id), "bot_removed", "Bot removido do servidor " + guild.name
             )
 
+    async def on_guild_role_delete(self, role: discord.Role):
+        """Deixa de mencionar um cargo apagado no servidor."""
+        if self.guild_cache:
+            self.guild_cache.mark_role_deleted(str(role.guild.id), str(role.id))
+
     @tasks.loop(minutes=settings.CHECK_INTERVAL_MINUTES)
     async def check_editais_task(self):
-        """Tarefa periódica que verifica e posta novos editais."""
-        if not self.scraper or not self.all_editais_repo or not self.guild_repo:
-            logger.error("Scraper ou repositórios não inicializados para a tarefa.")
-            return
+        """
+        Tarefa periódica que verifica e posta novos editais.
+
+        O intervalo inicial é `CHECK_INTERVAL_MINUTES`; depois de cada
+        verificação, o agendador adaptativo define o próximo.
+        """
+        try:
+            outcome = await self.check_editais()
+        except Exception as e:
+            # uma falha pontual (banco ocupado, erro de rede) não pode parar o loop
+            logger.error("Erro na verificação de editais: %s", e, exc_info=True)
+            outcome = PollOutcome.ERROR
+        if self.scheduler:
+            minutes = self.scheduler.next_interval(outcome)
+            self.check_editais_task.change_interval(minutes=minutes)
+            if self.sources:
+                self.sources.cache.ttl_seconds = minutes * 60
+            logger.info("Próxima verificação em %.1f minutos.", minutes)
+
+    async def check_editais(self) -> PollOutcome:
+        """Verifica as fontes, registra os novos editais e enfileira as notificações."""
+        if not self.sources or not self.all_editais_repo or not self.guild_cache:
+            logger.error("Fontes ou repositórios não inicializados para a tarefa.")
+            return PollOutcome.ERROR
             
         logger.info("Iniciando verificação de editais...")
         
-        scraped_editais = await self.scraper.fetch_editais()
+        scraped_editais = await self.sources.fetch_due(self.known_edital_hashes)
         if not scraped_editais:
             logger.warning("Scraper não retornou editais.")
-            return
+            if self.sources.last_round_failed:
+                return PollOutcome.ERROR
+            return PollOutcome.QUIET
 
         new_editais = [
             edital
@@ -129,56 +230,244 @@ class UEPABot(commands.Bot):
             if edital.hash not in self.known_edital_hashes
         ]
 
+        # Na primeira consulta bem-sucedida de cada fonte os editais são apenas
+        # registrados: são a linha de base daquela fonte, não novidades.
+        baseline_hashes = {edital.hash for edital in self.sources.last_baseline}
+        baseline = [edital for edital in new_editais if edital.hash in baseline_hashes]
+        if baseline:
+            inserted = await self.all_editais_repo.add_many(baseline)
+            self.known_edital_hashes.update(edital.hash for edital in baseline)
+            logger.info(
+                "Primeira verificação de fonte. %d editais registrados, não serão notificados.",
+                len(baseline),
+            )
+            if self.log_repo:
+                await self.log_repo.add(
+                    None, "first_check", f"{inserted} editais registrados na base."
+                )
+            new_editais = [edital for edital in new_editais if edital.hash not in baseline_hashes]
+
         if not new_editais:
             logger.info("Nenhum edital novo encontrado.")
-            return
-
-        logger.info(
-            "Encontrados %d novos editais. Notificando servidores ativos...",
-            len(new_editais),
-        )
-
-        self.all_editais_repo.add_many(new_editais)
-        for edital in new_editais:
-            self.known_edital_hashes.add(edital.hash)
+            return PollOutcome.QUIET
+
+        logger.info("Encontrados %d novos editais.", len(new_editais))
+
+        # As notificações são gravadas no outbox antes de o edital ser marcado
+        # como visto: se o bot cair no meio do caminho, o edital volta a ser
+        # "novo", o reenfileiramento é ignorado e a entrega continua de onde parou.
+        # Um edital com link já conhecido é uma correção de um edital postado:
+        # as mensagens existentes são editadas em vez de uma nova ser enviada.
+        if self.outbox_repo:
+            ordered = list(reversed(new_editais))
+            known_keys = await self.all_editais_repo.get_existing_keys(
+                edital.key for edital in ordered
+            )
+            fresh = [edital for edital in ordered if edital.key not in known_keys]
+            updated = [edital for edital in ordered if edital.key in known_keys]
+
+            guild_ids = [g.guild_id for g in self.guild_cache.active_guilds()]
+            queued = await self.outbox_repo.enqueue(guild_ids, fresh)
+            if updated and self.ledger_repo:
+                posted_in = await self.ledger_repo.get_guilds_by_keys(
+                    edital.key for edital in updated
+                )
+                for edital in updated:
+                    queued += await self.outbox_repo.enqueue(
+                        posted_in.get(edital.key, ()), [edital], kind="edit"
+                    )
+            logger.info(
+                "%d notificações enfileiradas (%d editais novos, %d atualizados).",
+                queued,
+                len(fresh),
+                len(updated),
+            )
 
-        if self.is_first_check:
-            self.is_first_check = False
+        inserted = await self.all_editais_repo.add_many(new_editais)
+        if inserted < len(new_editais):
             logger.info(
-                "Primeira verificação. Editais registrados, não serão notificados."
+                "%d editais já estavam registrados (outra instância ou verificação manual).",
+                len(new_editais) - inserted,
             )
-            if self.log_repo:
-                self.log_repo.add(
-                    None, "first_check", f"{len(new_editais)} editais registrados na base."
-                )
+        self.known_edital_hashes.update(edital.hash for edital in new_editais)
+        await self.learn_publication_windows()
+        self.wake_outbox()
+        return PollOutcome.NEW
+
+    def wake_outbox(self):
+        """Dispara o esvaziamento do outbox em segundo plano, se ainda não estiver rodando."""
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self.drain_outbox())
+            self._drain_task.add_done_callback(self._log_drain_error)
+
+    @staticmethod
+    def _log_drain_error(task: asyncio.Task):
+        """Registra a falha de um esvaziamento do outbox disparado em segundo plano."""
+        if not task.cancelled() and task.exception() is not None:
+            error = task.exception()
+            logger.error("Erro ao entregar o outbox: %s", error, exc_info=error)
+
+    async def drain_outbox(self):
+        """Entrega as notificações pendentes do outbox, em lotes."""
+        if not self.outbox_repo or not self.guild_cache:
             return
-
-        active_guilds = self.guild_repo.get_all_guilds()
-        for guild_settings in active_guilds:
-            if not guild_settings.enabled:
+        async with self._outbox_lock:
+            while True:
+                entries = await self.outbox_repo.get_due(settings.OUTBOX_BATCH_SIZE)
+                if not entries:
+                    return
+                await self._deliver_entries(entries)
+                if len(entries) < settings.OUTBOX_BATCH_SIZE:
+                    return
+
+    async def _deliver_entries(self, entries: list[OutboxEntry]):
+        """Monta e entrega as mensagens de um lote do outbox, registrando o resultado."""
+        entries_by_id = {entry.id: entry for entry in entries}
+        by_guild: dict[str, list[OutboxEntry]] = {}
+        for entry in entries:
+            by_guild.setdefault(entry.guild_id, []).append(entry)
+
+        active = {g.guild_id: g for g in self.guild_cache.active_guilds()}
+        jobs: list[DeliveryJob] = []
+        for guild_id, guild_entries in by_guild.items():
+            guild_settings = active.get(guild_id)
+            guild = self.get_guild(int(guild_id)) if guild_settings else None
+            if not guild:
+                await self.outbox_repo.mark_failed(
+                    [entry.id for entry in guild_entries],
+                    "Servidor indisponível ou pausado.",
+                )
                 continue
 
-            guild = self.get_guild(int(guild_settings.guild_id))
-            channel_id = guild_settings.channel_id
-
-            if not guild or not channel_id:
+            posts = [entry for entry in guild_entries if entry.kind != "edit"]
+            edits = [entry for entry in guild_entries if entry.kind == "edit"]
+            guild_jobs = await self.build_edit_jobs(guild, edits) if edits else []
+            if posts:
+                job = self.build_delivery_job(guild, guild_settings, posts)
+                if job:
+                    guild_jobs.append(job)
+            planned = {entry_id for job in guild_jobs for entry_id in job.entry_ids}
+            unplanned = [entry.id for entry in guild_entries if entry.id not in planned]
+            if unplanned:
+                await self.outbox_repo.mark_failed(
+                    unplanned, "Canal inválido ou mensagem original não encontrada."
+                )
+            jobs.extend(guild_jobs)
+
+        async def on_sent(job: DeliveryJob, message: DeliveryMessage, result: discord.Message):
+            sent_entries = [entries_by_id[entry_id] for entry_id in message.entry_ids]
+            if self.ledger_repo:
+                guild_id = str(job.guild.id)
+                try:
+                    if message.edit_message_id:
+                        await self.ledger_repo.update_entries(guild_id, sent_entries)
+                    else:
+                        await self.ledger_repo.record(
+                            guild_id, str(job.channel.id), str(result.id), sent_entries
+                        )
+                except Exception as e:
+                    # a mensagem já saiu: sem o registro apenas as edições futuras
+                    # se perdem, mas sem `mark_sent` ela seria postada de novo
+                    logger.error(
+                        "Erro ao registrar a entrega no servidor %s: %s", guild_id, e, exc_info=True
+                    )
+            await self.outbox_repo.mark_sent(message.entry_ids)
+
+        failed_jobs = set()
+
+        async def on_failed(
+            job: DeliveryJob, remaining: list[DeliveryMessage], error: Exception
+        ):
+            failed_jobs.add(id(job))
+            entry_ids = [entry_id for message in remaining for entry_id in message.entry_ids]
+            if not entry_ids:
+                return
+            tries = max(entries_by_id[entry_id].attempts for entry_id in entry_ids) + 1
+            # fora dos erros HTTP a mensagem pode já ter saído: repetir a duplicaria
+            permanent = not isinstance(error, discord.HTTPException) or isinstance(
+                error, (discord.Forbidden, discord.NotFound)
+            )
+            if permanent or tries >= settings.OUTBOX_MAX_ATTEMPTS:
+                await self.outbox_repo.mark_failed(entry_ids, str(error))
+                return
+            delay = settings.OUTBOX_RETRY_BASE_SECONDS * 2 ** (tries - 1)
+            next_attempt = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(
+                seconds=delay
+            )
+            await self.outbox_repo.mark_retry(entry_ids, str(error), next_attempt)
+
+        await self.delivery.deliver(jobs, on_sent=on_sent, on_failed=on_failed)
+        for job in jobs:
+            if id(job) not in failed_jobs:
+                await self.log_delivery(job)
+
+    async def build_edit_jobs(
+        self, guild: discord.Guild, entries: list[OutboxEntry]
+    ) -> list[DeliveryJob]:
+        """
+        Monta as edições das mensagens já postadas para os editais atualizados.
+
+        Cada mensagem é reconstruída com todos os editais que ela contém,
+        trocando apenas os que mudaram; as edições são agrupadas por canal.
+        """
+        if not self.ledger_repo:
+            return []
+        guild_id = str(guild.id)
+        updates = {normalize_edital_link(entry.link): entry for entry in entries}
+        ledger = await self.ledger_repo.get_by_keys(guild_id, updates)
+        message_ids = {row.message_id for row in ledger}
+        rows_by_message: dict[str, list[LedgerEntry]] = {}
+        for row in await self.ledger_repo.get_by_message_ids(message_ids):
+            rows_by_message.setdefault(row.message_id, []).append(row)
+
+        jobs: dict[str, DeliveryJob] = {}
+        for message_id, rows in rows_by_message.items():
+            channel = guild.get_channel(int(rows[0].channel_id))
+            if not channel or not isinstance(channel, (discord.TextChannel, discord.Thread)):
                 continue
-
-            try:
-                await self.notify_guild(guild, int(channel_id), new_editais)
-            except (discord.Forbidden, discord.HTTPException) as e:
-                logger.error(
-                    "Erro ao notificar o servidor %s: %s", guild.name, e, exc_info=True
+            embeds = [self.build_edital_embed(updates.get(row.edital_key, row)) for row in rows]
+            entry_ids = [updates[row.edital_key].id for row in rows if row.edital_key in updates]
+            job = jobs.setdefault(
+                rows[0].channel_id, DeliveryJob(guild=guild, channel=channel, messages=[])
+            )
+            job.messages.append(
+                DeliveryMessage(
+                    payload={"embeds": embeds},
+                    entry_ids=entry_ids,
+                    edit_message_id=int(message_id),
                 )
-
-    async def notify_guild(
-        self, guild: discord.Guild, channel_id: int, new_editais: list[Edital]
-    ):
-        """Envia a notificação de novos editais para um servidor."""
-        if not self.role_repo or not self.log_repo:
-            logger.error("Repositórios de Role ou Log não inicializados para notificação.")
-            return
-
+            )
+        return list(jobs.values())
+
+    @staticmethod
+    def build_edital_embed(
+        edital: Edital | OutboxEntry | LedgerEntry,
+    ) -> discord.Embed:
+        """Monta o embed de notificação de um edital (ou item do outbox)."""
+        embed = discord.Embed(
+            title="📢 Novo Edital da UEPA",
+            description=edital.title,
+            url=edital.link,
+            color=discord.Color.blue(),
+            timestamp=datetime.now(timezone.utc),
+        )
+        embed.add_field(name="📅 Data", value=edital.date, inline=True)
+        embed.set_footer(text="Monitor de Editais UEPA")
+        return embed
+
+    def build_delivery_job(
+        self,
+        guild: discord.Guild,
+        guild_settings: CachedGuildSettings,
+        entries: list[OutboxEntry],
+    ) -> DeliveryJob | None:
+        """
+        Monta as mensagens dos itens do outbox de um servidor.
+
+        No modo agrupado, até `MAX_EMBEDS_PER_MESSAGE` editais seguem em uma
+        única mensagem, com a menção aos cargos enviada uma vez só.
+        """
+        channel_id = int(guild_settings.channel_id)
         channel = guild.get_channel(channel_id)
         if not channel or not isinstance(channel, (discord.TextChannel, discord.Thread)):
             logger.warning(
@@ -186,39 +475,75 @@ class UEPABot(commands.Bot):
                 channel_id,
                 guild.name,
             )
-            return
-
-        roles = self.role_repo.get_all(str(guild.id))
-        mentions = " ".join(
-            f"<@&{role.role_id}>"
-            for role in roles
-            if guild.get_role(int(role.role_id))
-        )
-
-        logger.info(
-            "Postando %d novos editais em %s...", len(new_editais), guild.name
-        )
-        for edital in reversed(new_editais):
-            embed = discord.Embed(
-                title="📢 Novo Edital da UEPA",
-                description=edital.title,
-                url=str(edital.link),
-                color=discord.Color.blue(),
-                timestamp=datetime.now(timezone.utc),
-            )
-            embed.add_field(name="📅 Data", value=edital.date, inline=True)
-            embed.set_footer(text="Monitor de Editais UEPA")
+            return None
+
+        mentions = guild_settings.mentions
+
+        embeds = [self.build_edital_embed(entry) for entry in entries]
+        messages = []
+        if guild_settings.batch_notifications:
+            start = 0
+            for chunk in chunk_embeds(embeds):
+                text = (
+                    f"{len(chunk)} novos editais publicados!"
+                    if len(chunk) > 1
+                    else "Novo edital publicado!"
+                )
+                # a menção vai apenas na primeira mensagem do lote
+                content = f"{mentions} {text}" if mentions and not messages else text
+                entry_ids = [entry.id for entry in entries[start:start + len(chunk)]]
+                start += len(chunk)
+                messages.append(
+                    DeliveryMessage(payload={"content": content, "embeds": chunk}, entry_ids=entry_ids)
+                )
+        else:
+            for embed, entry in zip(embeds, entries):
+                messages.append(
+                    DeliveryMessage(
+                        payload={"content": f"{mentions} Novo edital publicado!", "embed": embed},
+                        entry_ids=[entry.id],
+                    )
+                )
 
-            await channel.send(f"{mentions} Novo edital publicado!", embed=embed)
-            await asyncio.sleep(1)
+        return DeliveryJob(guild=guild, channel=channel, messages=messages)
 
-        self.log_repo.add(
-            str(guild.id),
-            "editais_posted",
-            str(len(new_editais)) + " novos editais postados.",
-        )
+    async def log_delivery(self, job: DeliveryJob):
+        """Registra no log do servidor uma entrega concluída."""
+        if not self.log_repo:
+            return
+        if any(message.edit_message_id for message in job.messages):
+            action, details = "editais_updated", " editais atualizados."
+        else:
+            action, details = "editais_posted", " novos editais postados."
+        await self.log_repo.add(str(job.guild.id), action, str(len(job.entry_ids)) + details)
+
+    @tasks.loop(seconds=settings.OUTBOX_POLL_SECONDS)
+    async def deliver_outbox_task(self):
+        """Tarefa periódica que retoma entregas pendentes e limpa o outbox."""
+        try:
+            await self.drain_outbox()
+            if self.outbox_repo:
+                before = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+                    days=settings.OUTBOX_RETENTION_DAYS
+                )
+                await self.outbox_repo.purge_finished(before)
+        except Exception as e:
+            logger.error("Erro ao entregar o outbox: %s", e, exc_info=True)
+
+    @tasks.loop(hours=settings.LOG_RETENTION_INTERVAL_HOURS)
+    async def log_retention_task(self):
+        """Tarefa periódica que resume e remove os logs antigos."""
+        try:
+            await self.log_retention.run()
+        except Exception as e:
+            logger.error("Erro na retenção de logs: %s", e, exc_info=True)
 
     @check_editais_task.before_loop
     async def before_check_editais(self):
         """Aguarda o bot estar pronto antes de iniciar a tarefa."""
         await self.wait_until_ready()
+
+    @deliver_outbox_task.before_loop
+    async def before_deliver_outbox(self):
+        """Aguarda o bot estar pronto antes de iniciar a tarefa."""
+        await self.wait_until_ready()
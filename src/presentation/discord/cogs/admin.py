@@ -32,7 +32,12 @@ class AdminCog(commands.Cog):
         name="verificar_agora", description="Força uma verificação de novos editais"
     )
     async def check_now(self, interaction: discord.Interaction):
-        """Força uma verificação de novos editais e reinicia a tarefa."""
+        """
+        Força uma verificação de novos editais e reinicia a tarefa.
+
+        Reiniciar a verificação não interrompe entregas em andamento: elas
+        são feitas a partir do outbox, em uma tarefa separada.
+        """
         await interaction.response.defer(ephemeral=True)
 
         guild_name = interaction.guild.name if interaction.guild else "DM"
@@ -42,7 +47,7 @@ class AdminCog(commands.Cog):
             guild_name,
         )
         self.bot.check_editais_task.restart()
-        self.log_repo.add(
+        await self.log_repo.add(
             str(interaction.guild_id),
             "manual_check",
             "Verificação manual forçada",
@@ -56,6 +61,35 @@ class AdminCog(commands.Cog):
         )
         await interaction.followup.send(embed=embed)
 
+    @app_commands.command(
+        name="intervalo_verificacao",
+        description="Define um intervalo fixo de verificação (0 volta ao modo adaptativo)",
+    )
+    @app_commands.describe(minutos="Intervalo em minutos; use 0 para o modo adaptativo")
+    async def set_interval(
+        self, interaction: discord.Interaction, minutos: app_commands.Range[int, 0, 1440]
+    ):
+        """Altera o intervalo da tarefa de verificação em tempo de execução."""
+        interval = self.bot.set_check_interval(minutos or None)
+        await self.log_repo.add(
+            str(interaction.guild_id),
+            "interval_changed",
+            f"Intervalo: {minutos} min" if minutos else "Intervalo adaptativo",
+            str(interaction.user.id),
+        )
+
+        description = (
+            f"As verificações passam a ocorrer a cada **{interval:.0f} minutos**."
+            if minutos
+            else "O intervalo volta a ser ajustado automaticamente conforme o histórico de publicações."
+        )
+        embed = discord.Embed(
+            title="✅ Intervalo Atualizado",
+            description=description,
+            color=discord.Color.green(),
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
     @app_commands.command(
         name="limpar_historico",
         description="[PERIGOSO] Limpa todo o histórico de editais do bot.",
@@ -87,10 +121,12 @@ class AdminCog(commands.Cog):
             async def confirm(self, view_interaction: discord.Interaction, button: discord.ui.Button):
                 """Confirma a limpeza do histórico global."""
                 button.disabled = True
-                cleared_count = self.all_editais_repo.clear_all()
-                self.bot.is_first_check = True
+                cleared_count = await self.all_editais_repo.clear_all()
+                self.bot.known_edital_hashes.clear()
+                if self.bot.sources:
+                    self.bot.sources.reset_baseline()
 
-                self.log_repo.add(
+                await self.log_repo.add(
                     None,
                     "history_cleared",
                     f"{cleared_count} registros removidos do histórico GLOBAL",
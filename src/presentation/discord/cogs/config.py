@@ -1,11 +1,14 @@
 """Cog para comandos de configuração do bot."""
 
 import logging
+from typing import Literal
+
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-from src.core.repositories.interfaces import IGuildSettingsRepository, ILogRepository
+from src.core.repositories.interfaces import ILogRepository
+from src.infra.cache.guild_settings_cache import GuildSettingsCache
 from src.presentation.discord.bot import UEPABot
 
 logger = logging.getLogger(__name__)
@@ -18,12 +21,12 @@ class ConfigCog(commands.Cog):
     def __init__(
         self,
         bot: UEPABot,
-        guild_repo: IGuildSettingsRepository,
+        guild_cache: GuildSettingsCache,
         log_repo: ILogRepository,
     ):
         """Inicializa o cog."""
         self.bot = bot
-        self.guild_repo = guild_repo
+        self.guild_cache = guild_cache
         self.log_repo = log_repo
 
     @app_commands.command(
@@ -36,11 +39,11 @@ class ConfigCog(commands.Cog):
         """Configura o canal de notificações e ativa o bot."""
         guild_id = str(interaction.guild_id)
 
-        self.guild_repo.set(
+        await self.guild_cache.set(
             guild_id,
             {"channel_id": str(canal.id), "enabled": True},
         )
-        self.log_repo.add(
+        await self.log_repo.add(
             guild_id, "configured", f"Canal: {canal.name}", str(interaction.user.id)
         )
 
@@ -59,8 +62,8 @@ class ConfigCog(commands.Cog):
     async def pause(self, interaction: discord.Interaction):
         """Pausa as notificações no servidor."""
         guild_id = str(interaction.guild_id)
-        self.guild_repo.set(guild_id, {"enabled": False})
-        self.log_repo.add(guild_id, "paused", user_id=str(interaction.user.id))
+        await self.guild_cache.set(guild_id, {"enabled": False})
+        await self.log_repo.add(guild_id, "paused", user_id=str(interaction.user.id))
         await interaction.response.send_message("⏸️ Notificações pausadas.", ephemeral=True)
 
     @app_commands.command(
@@ -69,7 +72,7 @@ class ConfigCog(commands.Cog):
     async def resume(self, interaction: discord.Interaction):
         """Retoma as notificações no servidor."""
         guild_id = str(interaction.guild_id)
-        settings = self.guild_repo.get(guild_id)
+        settings = self.guild_cache.get(guild_id)
         if not settings or not settings.channel_id:
             await interaction.response.send_message(
                 "❌ O bot precisa ser configurado primeiro com `/configurar`.",
@@ -77,12 +80,32 @@ class ConfigCog(commands.Cog):
             )
             return
 
-        self.guild_repo.set(guild_id, {"enabled": True})
-        self.log_repo.add(guild_id, "resumed", user_id=str(interaction.user.id))
+        await self.guild_cache.set(guild_id, {"enabled": True})
+        await self.log_repo.add(guild_id, "resumed", user_id=str(interaction.user.id))
         await interaction.response.send_message(
             "▶️ Notificações retomadas.", ephemeral=True
         )
 
+    @app_commands.command(
+        name="modo_notificacao",
+        description="Define se os editais são postados agrupados ou um por mensagem",
+    )
+    @app_commands.describe(
+        modo="agrupado: vários editais por mensagem; individual: uma mensagem por edital"
+    )
+    async def notification_mode(
+        self, interaction: discord.Interaction, modo: Literal["agrupado", "individual"]
+    ):
+        """Alterna entre notificações agrupadas e individuais no servidor."""
+        guild_id = str(interaction.guild_id)
+        await self.guild_cache.set(guild_id, {"batch_notifications": modo == "agrupado"})
+        await self.log_repo.add(
+            guild_id, "notification_mode", f"Modo: {modo}", str(interaction.user.id)
+        )
+        await interaction.response.send_message(
+            f"📨 Modo de notificação definido como **{modo}**.", ephemeral=True
+        )
+
 async def setup(bot: UEPABot):
     """Configura o cog de configuração."""
     if not bot.container:
@@ -91,7 +114,7 @@ async def setup(bot: UEPABot):
 
     cog = ConfigCog(
         bot=bot,
-        guild_repo=bot.container.guild_settings_repo(),
+        guild_cache=bot.container.guild_cache(),
         log_repo=bot.container.log_repo(),
     )
     await bot.add_cog(cog)
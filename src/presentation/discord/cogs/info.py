@@ -1,20 +1,39 @@
 """Cog para comandos informativos e de ajuda."""
 import logging
+from datetime import date, datetime
+from typing import List, Optional
+
 import discord
 from discord import app_commands, TextChannel
 from discord.ext import commands
 
-from src.core.repositories.interfaces import (
-    IAllEditaisRepository,
-    IGuildSettingsRepository,
-    IRoleRepository,
-)
-from src.infra.web_scraper.uepa_scraper import UepaScraper
+from src.core.entities.edital import EditalRecord
+from src.core.repositories.interfaces import IAllEditaisRepository, INotificationOutboxRepository
+from src.infra.cache.guild_settings_cache import GuildSettingsCache
+from src.infra.web_scraper.sources import SourceRegistry
 from src.presentation.discord.bot import UEPABot
+from src.presentation.discord.delivery import MAX_EMBED_CHARS_PER_MESSAGE
 from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Um embed do Discord comporta no máximo 25 campos; a soma dos textos também
+# é limitada, e parte do limite fica reservada para o rodapé.
+MAX_EMBED_FIELDS = 25
+MAX_EMBED_FIELD_VALUE = 1024
+EMBED_FIELDS_CHAR_BUDGET = MAX_EMBED_CHARS_PER_MESSAGE - 300
+MONTH_ABBREVIATIONS = (
+    "jan", "fev", "mar", "abr", "mai", "jun", "jul", "ago", "set", "out", "nov", "dez"
+)
+
+
+def parse_day(text: str) -> Optional[date]:
+    """Interpreta uma data no formato DD/MM/AAAA; retorna None se for inválida."""
+    try:
+        return datetime.strptime(text.strip(), "%d/%m/%Y").date()
+    except ValueError:
+        return None
+
 
 class InfoCog(commands.Cog):
     """Cog para comandos informativos e de ajuda."""
@@ -22,23 +41,23 @@ class InfoCog(commands.Cog):
     def __init__(
         self,
         bot: UEPABot,
-        guild_repo: IGuildSettingsRepository,
-        role_repo: IRoleRepository,
+        guild_cache: GuildSettingsCache,
         all_editais_repo: IAllEditaisRepository,
-        scraper: UepaScraper,
+        sources: SourceRegistry,
+        outbox_repo: INotificationOutboxRepository,
     ):
         """Inicializa o cog."""
         self.bot = bot
-        self.guild_repo = guild_repo
-        self.role_repo = role_repo
+        self.guild_cache = guild_cache
         self.all_editais_repo = all_editais_repo
-        self.scraper = scraper
+        self.sources = sources
+        self.outbox_repo = outbox_repo
 
     @app_commands.command(name="status", description="Verifica o status atual do bot")
     async def status(self, interaction: discord.Interaction):
         """Mostra o status do bot e suas configurações para o servidor."""
         guild_id = str(interaction.guild_id)
-        guild_settings = self.guild_repo.get(guild_id)
+        guild_settings = self.guild_cache.get(guild_id)
 
         embed = discord.Embed(
             title="📊 Status do Monitor de Editais UEPA", color=discord.Color.blue()
@@ -56,7 +75,7 @@ class InfoCog(commands.Cog):
             if isinstance(channel, TextChannel):
                 channel_mention = channel.mention
                          
-            roles = self.role_repo.get_all(guild_id)
+            roles = self.guild_cache.roles(guild_id)
             roles_text = (
                 "\n".join(f"<@&{r.role_id}>" for r in roles) if roles else "Nenhum"
             )
@@ -65,9 +84,14 @@ class InfoCog(commands.Cog):
             embed.add_field(
                 name="Canal de Notificações", value=channel_mention, inline=True
             )
+            embed.add_field(
+                name="Modo de Notificação",
+                value="Agrupado" if guild_settings.batch_notifications else "Individual",
+                inline=True,
+            )
             embed.add_field(
                 name="Total de Editais Vistos",
-                value=str(self.all_editais_repo.count_all()),
+                value=str(await self.all_editais_repo.count_all()),
                 inline=True,
             )
             embed.add_field(
@@ -76,20 +100,95 @@ class InfoCog(commands.Cog):
                 inline=False,
             )
 
+        sources_lines = [
+            f"`{source.name}`: {source.stats.avg_latency:.2f}s em média, "
+            f"{source.stats.errors} erro(s) em {source.stats.fetches} consulta(s), "
+            f"circuito {source.scraper.fetcher.breaker.state}"
+            for source in self.sources.sources
+        ]
+        embed.add_field(
+            name=f"🌐 Fontes Monitoradas ({len(sources_lines)})",
+            value=self.join_lines(sources_lines, "fonte(s)"),
+            inline=False,
+        )
+        embed.add_field(
+            name="📬 Notificações na Fila",
+            value=str(await self.outbox_repo.count_pending()),
+            inline=True,
+        )
+
+        interval = settings.CHECK_INTERVAL_MINUTES
+        mode = "fixo"
+        if self.bot.scheduler:
+            interval = self.bot.scheduler.current_minutes
+            mode = "fixo" if self.bot.scheduler.override_minutes else "adaptativo"
         embed.set_footer(
-            text=f"Verificação global a cada {settings.CHECK_INTERVAL_MINUTES} minutos."
+            text=f"Próxima verificação global em {interval:.0f} minutos (intervalo {mode})."
         )
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
+    @staticmethod
+    def join_lines(lines: List[str], noun: str) -> str:
+        """
+        Junta as linhas até o limite de caracteres de um campo de embed.
+
+        As que não couberem são resumidas numa última linha com a contagem.
+        """
+        text = "\n".join(lines)
+        if len(text) <= MAX_EMBED_FIELD_VALUE:
+            return text or "Nenhuma"
+        # reserva espaço para a linha de resumo
+        budget = MAX_EMBED_FIELD_VALUE - 40
+        shown: List[str] = []
+        size = 0
+        for line in lines:
+            size += len(line) + 1
+            if size > budget:
+                break
+            shown.append(line)
+        shown.append(f"... e mais {len(lines) - len(shown)} {noun}")
+        return "\n".join(shown)
+
+    @staticmethod
+    def add_record_fields(embed: discord.Embed, records: List[EditalRecord]) -> int:
+        """
+        Adiciona um campo por edital registrado no histórico e retorna quantos couberam.
+
+        Para antes de o embed passar do limite de caracteres do Discord.
+        """
+        added = 0
+        for record in records:
+            published = record.date or f"{record.published_at:%d/%m/%Y}"
+            name = f"📄 {record.title[:200]}"
+            value = f"📅 {published} - [Acessar]({record.link})"
+            if len(embed) + len(name) + len(value) > EMBED_FIELDS_CHAR_BUDGET:
+                break
+            embed.add_field(name=name, value=value, inline=False)
+            added += 1
+        return added
+
     @app_commands.command(
         name="listar_editais",
-        description="Lista os últimos 10 editais encontrados no site da UEPA",
+        description="Lista os últimos 10 editais publicados, pelo histórico do bot",
     )
     async def list_editais(self, interaction: discord.Interaction):
-        """Lista os últimos editais encontrados no site da UEPA."""
+        """Lista os últimos editais, pelo histórico indexado ou, sem ele, pelo site."""
         await interaction.response.defer(ephemeral=True)
 
-        editais = await self.scraper.fetch_editais()
+        records = await self.all_editais_repo.get_latest(10)
+        if records:
+            embed = discord.Embed(
+                title="📋 Últimos 10 Editais da UEPA",
+                description="Editais mais recentes, por data de publicação.",
+                color=discord.Color.blue(),
+            )
+            shown = self.add_record_fields(embed, records)
+            embed.set_footer(text=f"Mostrando {shown} editais do histórico do bot.")
+            await interaction.followup.send(embed=embed)
+            return
+
+        # histórico ainda sem datas (bot recém-instalado): consulta o site
+        editais = await self.sources.fetch_all(self.bot.known_edital_hashes)
 
         if not editais:
             await interaction.followup.send(
@@ -115,6 +214,87 @@ class InfoCog(commands.Cog):
         )
         await interaction.followup.send(embed=embed)
 
+    @app_commands.command(
+        name="historico",
+        description="Lista os editais publicados em um período",
+    )
+    @app_commands.describe(
+        inicio="Data inicial (DD/MM/AAAA)",
+        fim="Data final (DD/MM/AAAA); padrão: hoje",
+    )
+    async def history(
+        self, interaction: discord.Interaction, inicio: str, fim: Optional[str] = None
+    ):
+        """Lista os editais publicados entre duas datas, a partir do histórico indexado."""
+        start = parse_day(inicio)
+        end = parse_day(fim) if fim else date.today()
+        if not start or not end or start > end:
+            await interaction.response.send_message(
+                "❌ Período inválido. Use datas no formato DD/MM/AAAA, com o início antes do fim.",
+                ephemeral=True,
+            )
+            return
+
+        records = await self.all_editais_repo.get_published_between(
+            start, end, limit=MAX_EMBED_FIELDS
+        )
+        period = f"{start:%d/%m/%Y} a {end:%d/%m/%Y}"
+        if not records:
+            await interaction.response.send_message(
+                f"ℹ️ Nenhum edital registrado com publicação entre {period}.", ephemeral=True
+            )
+            return
+
+        embed = discord.Embed(
+            title=f"🗂️ Editais de {period}",
+            color=discord.Color.blue(),
+        )
+        shown = self.add_record_fields(embed, records)
+        if shown < len(records) or len(records) == MAX_EMBED_FIELDS:
+            embed.set_footer(
+                text=f"Mostrando os {shown} mais recentes; reduza o período para ver os demais."
+            )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @app_commands.command(
+        name="estatisticas",
+        description="Mostra quantos editais foram publicados por mês",
+    )
+    @app_commands.describe(meses="Quantidade de meses exibidos (1 a 24)")
+    async def stats(
+        self, interaction: discord.Interaction, meses: app_commands.Range[int, 1, 24] = 12
+    ):
+        """Mostra a quantidade de editais publicados por mês, a partir do histórico indexado."""
+        today = date.today()
+        months_back = today.year * 12 + today.month - meses
+        since = date(months_back // 12, months_back % 12 + 1, 1)
+        counts = await self.all_editais_repo.count_by_month(since)
+
+        embed = discord.Embed(
+            title="📈 Editais Publicados por Mês",
+            color=discord.Color.blue(),
+        )
+        if not counts:
+            embed.description = "ℹ️ Nenhum edital com data de publicação registrada no período."
+        else:
+            peak = max(count for _, _, count in counts)
+            lines = [
+                f"`{MONTH_ABBREVIATIONS[month - 1]}/{year}` "
+                f"{'█' * max(1, round(count / peak * 15))} {count}"
+                for year, month, count in counts
+            ]
+            embed.description = "\n".join(lines)
+            embed.add_field(
+                name="Total no Período", value=str(sum(c for _, _, c in counts)), inline=True
+            )
+        embed.add_field(
+            name="Total de Editais Vistos",
+            value=str(await self.all_editais_repo.count_all()),
+            inline=True,
+        )
+        embed.set_footer(text=f"Desde {since:%m/%Y}, pela data de publicação dos editais.")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
     @app_commands.command(
         name="ajuda", description="Mostra a mensagem de ajuda com todos os comandos"
     )
@@ -130,6 +310,7 @@ class InfoCog(commands.Cog):
         `/configurar` - Define o canal para receber as notificações.
         `/pausar` - Pausa o envio de novas notificações.
         `/retomar` - Retoma o envio de notificações.
+        `/modo_notificacao` - Posta os editais agrupados ou um por mensagem.
         """
 
         roles_cmds = """
@@ -141,8 +322,11 @@ class InfoCog(commands.Cog):
 
         general_cmds = """
         `/status` - Mostra o status e configurações atuais.
-        `/listar_editais` - Lista os últimos editais do site da UEPA.
+        `/listar_editais` - Lista os últimos editais publicados (histórico do bot).
+        `/historico` - Lista os editais publicados em um período.
+        `/estatisticas` - Mostra quantos editais foram publicados por mês.
         `/verificar_agora` - Força uma nova verificação de editais.
+        `/intervalo_verificacao` - Define o intervalo de verificação (0 = adaptativo).
         `/limpar_historico` - [PERIGOSO] Reseta a base de dados de editais do bot.
         `/ajuda` - Mostra esta mensagem.
         """
@@ -165,9 +349,9 @@ async def setup(bot: UEPABot):
 
     cog = InfoCog(
         bot=bot,
-        guild_repo=bot.container.guild_settings_repo(),
-        role_repo=bot.container.role_repo(),
+        guild_cache=bot.container.guild_cache(),
         all_editais_repo=bot.container.all_editais_repo(),
-        scraper=bot.container.uepa_scraper(),
+        sources=bot.container.source_registry(),
+        outbox_repo=bot.container.notification_outbox_repo(),
     )
     await bot.add_cog(cog)
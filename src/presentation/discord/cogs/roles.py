@@ -9,7 +9,8 @@ from discord.ext import commands
 from dependency_injector.wiring import inject, Provide
 
 from src.containers import Container
-from src.core.repositories.interfaces import ILogRepository, IRoleRepository
+from src.core.repositories.interfaces import ILogRepository
+from src.infra.cache.guild_settings_cache import GuildSettingsCache
 from src.presentation.discord.bot import UEPABot
 
 logger = logging.getLogger(__name__)
@@ -22,12 +23,12 @@ class RolesCog(commands.Cog):
     def __init__(
         self,
         bot: UEPABot,
-        role_repo: IRoleRepository,
+        guild_cache: GuildSettingsCache,
         log_repo: ILogRepository,
     ):
         """Inicializa o cog."""
         self.bot = bot
-        self.role_repo = role_repo
+        self.guild_cache = guild_cache
         self.log_repo = log_repo
 
     @app_commands.command(
@@ -39,12 +40,12 @@ class RolesCog(commands.Cog):
         """Adiciona um cargo à lista de menções."""
         guild_id = str(interaction.guild_id)
 
-        success = self.role_repo.add(
+        success = await self.guild_cache.add_role(
             guild_id, str(cargo.id), cargo.name, str(interaction.user.id)
         )
 
         if success:
-            self.log_repo.add(
+            await self.log_repo.add(
                 guild_id, "role_added", f"Cargo: {cargo.name}", str(interaction.user.id)
             )
             embed = discord.Embed(
@@ -68,10 +69,10 @@ class RolesCog(commands.Cog):
         """Remove um cargo da lista de menções."""
         guild_id = str(interaction.guild_id)
 
-        success = self.role_repo.remove(guild_id, str(cargo.id))
+        success = await self.guild_cache.remove_role(guild_id, str(cargo.id))
 
         if success:
-            self.log_repo.add(
+            await self.log_repo.add(
                 guild_id,
                 "role_removed",
                 f"Cargo: {cargo.name}",
@@ -100,7 +101,7 @@ class RolesCog(commands.Cog):
             return
 
         guild_id = str(interaction.guild_id)
-        roles = self.role_repo.get_all(guild_id)
+        roles = self.guild_cache.roles(guild_id)
 
         embed = discord.Embed(
             title="👥 Cargos Configurados para Menção", color=discord.Color.blue()
@@ -137,12 +138,12 @@ class RolesCog(commands.Cog):
             @inject
             def __init__(
                 self,
-                role_repo: IRoleRepository = Provide[Container.role_repo],
+                guild_cache: GuildSettingsCache = Provide[Container.guild_cache],
                 log_repo: ILogRepository = Provide[Container.log_repo],
             ):
                 """Inicializa a view."""
                 super().__init__(timeout=30)
-                self.role_repo = role_repo
+                self.guild_cache = guild_cache
                 self.log_repo = log_repo
 
             @discord.ui.button(
@@ -153,8 +154,8 @@ class RolesCog(commands.Cog):
             ):
                 """Confirma a remoção de todos os cargos."""
                 button.disabled = True
-                cleared_count = self.role_repo.clear(guild_id)
-                self.log_repo.add(
+                cleared_count = await self.guild_cache.clear_roles(guild_id)
+                await self.log_repo.add(
                     guild_id,
                     "roles_cleared",
                     f"{cleared_count} cargos removidos",
@@ -187,7 +188,7 @@ async def setup(bot: UEPABot):
 
     cog = RolesCog(
         bot=bot,
-        role_repo=bot.container.role_repo(),
+        guild_cache=bot.container.guild_cache(),
         log_repo=bot.container.log_repo(),
     )
     await bot.add_cog(cog)
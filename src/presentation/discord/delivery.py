@@ -0,0 +1,241 @@
+"""Entrega concorrente de notificações aos servidores, respeitando os rate limits do Discord."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+# Limites do Discord por mensagem: quantidade de embeds e soma dos caracteres.
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+
+def chunk_embeds(embeds: Iterable[discord.Embed]) -> List[List[discord.Embed]]:
+    """Agrupa os embeds em lotes que respeitam os limites de uma mensagem."""
+    chunks: List[List[discord.Embed]] = []
+    current: List[discord.Embed] = []
+    size = 0
+    for embed in embeds:
+        embed_size = len(embed)
+        if current and (
+            len(current) >= MAX_EMBEDS_PER_MESSAGE
+            or size + embed_size > MAX_EMBED_CHARS_PER_MESSAGE
+        ):
+            chunks.append(current)
+            current, size = [], 0
+        current.append(embed)
+        size += embed_size
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class TokenBucket:
+    """
+    Limitador de taxa do tipo token bucket.
+
+    Libera até `capacity` requisições de uma vez e repõe `rate` por segundo.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Aguarda até haver uma ficha disponível e a consome."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+@dataclass
+class DeliveryMessage:
+    """
+    Argumentos de `channel.send` e os itens do outbox que a mensagem entrega.
+
+    Com `edit_message_id`, a mensagem já enviada é editada em vez de uma nova
+    ser postada.
+    """
+
+    payload: Dict[str, Any]
+    entry_ids: List[int] = field(default_factory=list)
+    edit_message_id: Optional[int] = None
+
+
+@dataclass
+class DeliveryJob:
+    """Mensagens destinadas a um canal, enviadas em ordem."""
+
+    guild: discord.Guild
+    channel: discord.abc.Messageable
+    messages: List[DeliveryMessage]
+
+    @property
+    def entry_ids(self) -> List[int]:
+        """Itens do outbox entregues por todas as mensagens do job."""
+        return [entry_id for message in self.messages for entry_id in message.entry_ids]
+
+
+@dataclass
+class DeliveryReport:
+    """Resumo de uma rodada de entregas."""
+
+    jobs: int = 0
+    delivered: int = 0
+    failed: int = 0
+    messages_sent: int = 0
+    elapsed: float = 0.0
+    failures: Dict[int, str] = field(default_factory=dict)
+
+
+class DeliveryScheduler:
+    """
+    Distribui as notificações entre vários canais em paralelo.
+
+    - No máximo `max_concurrency` canais recebem mensagens ao mesmo tempo.
+    - Dentro de um canal as mensagens seguem em sequência, preservando a
+      ordem; os buckets por rota e as respostas 429 ficam a cargo do
+      cliente HTTP do discord.py, que aguarda o tempo indicado pelo Discord.
+    - Um token bucket global limita o total de requisições por segundo,
+      mantendo o bot abaixo do limite global da API.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 20,
+        global_rate: float = 40.0,
+        progress_interval: float = 10.0,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.bucket = TokenBucket(global_rate)
+        self.progress_interval = progress_interval
+
+    async def _deliver_job(
+        self,
+        job: DeliveryJob,
+        semaphore: asyncio.Semaphore,
+        on_sent: Optional[
+            Callable[[DeliveryJob, DeliveryMessage, discord.Message], Awaitable[None]]
+        ],
+    ) -> Tuple[DeliveryJob, int, int, Optional[Exception]]:
+        """
+        Envia (ou edita) as mensagens de um canal, em ordem, e retorna o resultado.
+
+        Retorna o job, quantas mensagens saíram, o índice da primeira mensagem
+        não concluída e o erro que interrompeu o job. Uma falha em `on_sent`
+        deixa a própria mensagem como não concluída.
+        """
+        sent = 0
+        current = 0
+        async with semaphore:
+            try:
+                for current, message in enumerate(job.messages):
+                    await self.bucket.acquire()
+                    if message.edit_message_id:
+                        partial = job.channel.get_partial_message(message.edit_message_id)
+                        result = await partial.edit(**message.payload)
+                    else:
+                        result = await job.channel.send(**message.payload)
+                    sent += 1
+                    if on_sent:
+                        await on_sent(job, message, result)
+            except discord.HTTPException as e:
+                return job, sent, current, e
+            except Exception as e:
+                # um erro inesperado (banco, callback) encerra só este job
+                logger.error(
+                    "Erro inesperado ao notificar o servidor %s: %s",
+                    job.guild.name,
+                    e,
+                    exc_info=True,
+                )
+                return job, sent, current, e
+        return job, sent, len(job.messages), None
+
+    async def deliver(
+        self,
+        jobs: Iterable[DeliveryJob],
+        on_sent: Optional[
+            Callable[[DeliveryJob, DeliveryMessage, discord.Message], Awaitable[None]]
+        ] = None,
+        on_failed: Optional[
+            Callable[[DeliveryJob, List[DeliveryMessage], Exception], Awaitable[None]]
+        ] = None,
+    ) -> DeliveryReport:
+        """
+        Entrega todos os jobs e retorna o resumo.
+
+        `on_sent` é chamado logo após cada mensagem enviada ou editada, com a
+        mensagem retornada pelo Discord, o que permite registrar o progresso
+        de forma durável. Falhas em um canal (sem
+        permissão, canal removido, erro no `on_sent` etc.) interrompem apenas
+        aquele job; `on_failed` recebe as mensagens não concluídas e o erro.
+        """
+        jobs = list(jobs)
+        report = DeliveryReport(jobs=len(jobs))
+        if not jobs:
+            return report
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        start = last_progress = time.monotonic()
+        tasks = [
+            asyncio.ensure_future(self._deliver_job(job, semaphore, on_sent)) for job in jobs
+        ]
+        try:
+            for future in asyncio.as_completed(tasks):
+                job, sent, pending_from, error = await future
+                report.messages_sent += sent
+                if error is None:
+                    report.delivered += 1
+                else:
+                    report.failed += 1
+                    report.failures[job.guild.id] = str(error)
+                    logger.error("Erro ao notificar o servidor %s: %s", job.guild.name, error)
+                    if on_failed:
+                        try:
+                            await on_failed(job, job.messages[pending_from:], error)
+                        except Exception as e:
+                            logger.error(
+                                "Erro ao registrar a falha do servidor %s: %s",
+                                job.guild.name,
+                                e,
+                                exc_info=True,
+                            )
+
+                now = time.monotonic()
+                if now - last_progress >= self.progress_interval:
+                    last_progress = now
+                    logger.info(
+                        "Entrega em andamento: %d/%d servidores (%d falhas, %d mensagens).",
+                        report.delivered + report.failed,
+                        report.jobs,
+                        report.failed,
+                        report.messages_sent,
+                    )
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        report.elapsed = time.monotonic() - start
+        logger.info(
+            "Entrega concluída em %.1fs: %d servidores notificados, %d falhas, %d mensagens.",
+            report.elapsed,
+            report.delivered,
+            report.failed,
+            report.messages_sent,
+        )
+        return report